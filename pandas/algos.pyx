@@ -2312,6 +2312,48 @@ def group_median(ndarray[float64_t, ndim=2] out,
             ptr += size
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_median_bin(ndarray[float64_t, ndim=2] out,
+                     ndarray[int64_t] counts,
+                     ndarray[float64_t, ndim=2] values,
+                     ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, nbins, start, end
+        ndarray data
+        float64_t* ptr
+
+    nbins = len(bins)
+    N, K = (<object> values).shape
+
+    if bins[nbins - 1] == N:
+        ngroups = nbins
+    else:
+        ngroups = nbins + 1
+
+    for j in range(ngroups):
+        start = 0 if j == 0 else bins[j - 1]
+        end = bins[j] if j < nbins else N
+        counts[j] = end - start
+
+    # the bins are contiguous row ranges, so a single transposed copy
+    # (which _median_linear is free to reorder) replaces the group sort
+    data = np.array(values.T, dtype=np.float64, order='C', copy=True)
+    ptr = <float64_t*> data.data
+
+    for i in range(K):
+        for j in range(ngroups):
+            start = 0 if j == 0 else bins[j - 1]
+            if counts[j] == 0:
+                out[j, i] = NaN
+            else:
+                out[j, i] = _median_linear(ptr + start, counts[j])
+        ptr += N
+
+
 cdef inline float64_t _median_linear(float64_t* a, int n):
     cdef int i, j, na_count = 0
     cdef float64_t result
@@ -219,6 +219,40 @@ def evaluate(op, op_str, a, b, raise_on_error=False, use_numexpr=True,
     return _evaluate_standard(op, op_str, a, b, raise_on_error=raise_on_error)
 
 
+def evaluate_fused(expr, local_dict, fallback, use_numexpr=True):
+    """ evaluate an elementwise expression over several operands in a single
+        numexpr pass, returning fallback() if numexpr cannot be used for it
+
+        Parameters
+        ----------
+
+        expr :       the expression, in numexpr syntax
+        local_dict : dict of the arrays and scalars referenced by expr
+        fallback :   callable evaluating the expression without numexpr
+        use_numexpr : whether to try to use numexpr (default True)
+        """
+    result = None
+
+    if use_numexpr and _USE_NUMEXPR:
+        arrays = [v for v in local_dict.values() if isinstance(v, np.ndarray)]
+        dtypes = set(v.dtype.name for v in arrays)
+        if (len(arrays) and np.prod(arrays[0].shape) > _MIN_ELEMENTS and
+                _ALLOWED_DTYPES['evaluate'] >= dtypes):
+            try:
+                result = ne.evaluate(expr, local_dict=local_dict,
+                                     casting='safe', truediv=True)
+            except Exception:
+                pass
+
+    if _TEST_MODE:
+        _store_test_result(result is not None)
+
+    if result is None:
+        result = fallback()
+
+    return result
+
+
 def where(cond, a, b, raise_on_error=False, use_numexpr=True):
     """ evaluate the where condition cond on a and b
 
@@ -66,6 +66,93 @@ def unique(values):
     return _hashtable_algo(f, values.dtype)
 
 
+# lookup sets larger than this are searched with searchsorted if sorted,
+# rather than hashed
+_ISIN_SORTED_MIN_VALUES = 1000000
+
+
+def isin(comps, values):
+    """
+    Compute whether each element of comps is contained in values
+
+    Parameters
+    ----------
+    comps : array-like
+    values : array-like
+        The values to look for
+
+    Returns
+    -------
+    isin : ndarray (boolean dtype), same length as comps
+    """
+    comps = com._values_from_object(comps)
+    if not (isinstance(values, (list, tuple)) or hasattr(values, '__array__')):
+        values = list(values)
+    raw_values, values = values, com._asarray_tuplesafe(values)
+
+    # may need i8 conversion for proper membership testing
+    if com.is_datetime64_dtype(comps):
+        from pandas.core.series import Series
+        from pandas.tseries.tools import to_datetime
+        values = Series(to_datetime(values)).values.view('i8')
+        comps = comps.view('i8')
+    elif com.is_timedelta64_dtype(comps):
+        from pandas.core.series import Series
+        from pandas.tseries.timedeltas import to_timedelta
+        values = Series(to_timedelta(values)).values.view('i8')
+        comps = comps.view('i8')
+
+    if _is_int64_like(comps):
+        if _is_int64_like(values):
+            return _isin_typed(com._ensure_int64(comps),
+                               com._ensure_int64(values), 'int64')
+        elif com.is_float_dtype(values):
+            # only integral values can be equal to an integer
+            values = values[np.isfinite(values) & (values % 1 == 0) &
+                            (np.abs(values) < 2 ** 63)]
+            return _isin_typed(com._ensure_int64(comps),
+                               com._ensure_int64(values), 'int64')
+    elif com.is_float_dtype(comps):
+        if _is_int64_like(values):
+            # only integers that float64 holds exactly can be equal to a
+            # float, the others would be rounded
+            values = com._ensure_int64(values)
+            fvalues = values.astype(np.float64)
+            exact = fvalues < 2 ** 63
+            exact[exact] = fvalues[exact].astype(np.int64) == values[exact]
+            return _isin_typed(com._ensure_float64(comps),
+                               fvalues[exact], 'float64')
+        elif com.is_float_dtype(values):
+            return _isin_typed(com._ensure_float64(comps),
+                               com._ensure_float64(values), 'float64')
+
+    # as a Python set would, match objects by identity (e.g. np.nan) first
+    if not com.is_object_dtype(values):
+        values = com._asarray_tuplesafe(raw_values, dtype=object)
+    return htable.ismember_object(com._ensure_object(comps),
+                                  com._ensure_object(values))
+
+
+def _is_int64_like(values):
+    # bool and the integer dtypes that int64 holds exactly
+    return (com.is_bool_dtype(values) or
+            (com.is_integer_dtype(values) and values.dtype != np.uint64))
+
+
+def _isin_typed(comps, values, dtype):
+    if len(values) > _ISIN_SORTED_MIN_VALUES:
+        is_monotonic = getattr(algos, 'is_monotonic_%s' % dtype)
+        if is_monotonic(values, False)[0]:
+
+            # a binary search of the sorted values needs no hash table of
+            # them, which is expensive to build
+            indexer = values.searchsorted(comps)
+            indexer[indexer == len(values)] = 0
+            return values.take(indexer) == comps
+
+    return getattr(htable, 'ismember_%s' % dtype)(comps, values)
+
+
 def _hashtable_algo(f, dtype):
     """
     f(HashTable, type_caster) -> result
@@ -1345,6 +1345,62 @@ def _possibly_downcast_to_dtype(result, dtype):
     return result
 
 
+_downcast_int_types = [np.int8, np.uint8, np.int16, np.uint16,
+                       np.int32, np.uint32]
+
+
+def _possibly_downcast_numeric(values):
+    """ cast int / float values to the smallest int, uint or float dtype
+    that holds them exactly (unlike _possibly_downcast_to_dtype, which only
+    checks that the values are close); floats are only cast to ints if they
+    are all integral (and thus not null)
+    """
+    if not values.size:
+        return values
+
+    if issubclass(values.dtype.type, np.floating):
+        if np.isfinite(values).all():
+            mn, mx = values.min(), values.max()
+            if mn >= -2 ** 63 and mx < 2 ** 63:
+                as_int = values.astype(np.int64)
+                if (as_int == values).all():
+                    values = as_int
+
+        if values.dtype.itemsize > 4 and issubclass(values.dtype.type,
+                                                      np.floating):
+            as_float32 = values.astype(np.float32)
+            if ((as_float32 == values) | isnull(values)).all():
+                return as_float32
+            return values
+
+    if issubclass(values.dtype.type, np.integer):
+        mn, mx = values.min(), values.max()
+        for t in _downcast_int_types:
+            if np.dtype(t).itemsize >= values.dtype.itemsize:
+                break
+            info = np.iinfo(t)
+            if info.min <= mn and mx <= info.max:
+                return values.astype(t)
+
+    return values
+
+
+def _object_nbytes(values, deep=True):
+    """ the bytes of the objects referred to by object values (not counting
+    the pointers to them): none if not deep, estimated from an evenly spaced
+    sample of (at most) deep values if deep is an integer
+    """
+    if not deep or values.dtype != np.object_ or not values.size:
+        return 0
+
+    values = values.ravel()
+    if deep is not True and len(values) > deep:
+        sample = values[::len(values) // deep][:deep]
+        return int(lib.memory_usage_of_objects(sample) *
+                   (float(len(values)) / len(sample)))
+    return lib.memory_usage_of_objects(values)
+
+
 def _maybe_convert_string_to_object(values):
     """
     Convert string-like and string-like array to convert object dtype.
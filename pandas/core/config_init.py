@@ -204,9 +204,10 @@ pc_mpl_style_doc = """
 """
 
 pc_memory_usage_doc = """
-: bool or None
+: bool, 'deep' or None
     This specifies if the memory usage of a DataFrame should be displayed when
-    df.info() is called.
+    df.info() is called. 'deep' also counts the objects referred to by object
+    columns.
 """
 
 style_backup = dict()
@@ -281,7 +282,8 @@ with cf.config_prefix('display'):
     cf.register_option('line_width', get_default_val('display.width'),
                        pc_line_width_doc)
     cf.register_option('memory_usage', True, pc_memory_usage_doc,
-                        validator=is_instance_factory([type(None), bool]))
+                        validator=is_one_of_factory([None, True, False,
+                                                     'deep']))
 
 cf.deprecate_option('display.line_width',
                     msg=pc_line_width_deprecation_warning,
@@ -329,6 +331,18 @@ with cf.config_prefix('mode'):
     cf.register_option('chained_assignment', 'warn', chained_assignment,
                        validator=is_one_of_factory([None, 'warn', 'raise']))
 
+copy_on_write_doc = """
+: boolean
+    True means that copies (e.g. DataFrame.copy, rename, reindex with the
+    same index) share their data with the original until one of them is
+    modified; shared data is marked read-only in the meantime.
+    Default is False (copies are always made eagerly).
+"""
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool)
+
 
 # Set up the io.excel specific configuration.
 writer_engine_doc = """
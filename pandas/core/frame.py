@@ -759,13 +759,14 @@ class DataFrame(NDFrame):
 
     @classmethod
     def from_records(cls, data, index=None, exclude=None, columns=None,
-                     coerce_float=False, nrows=None):
+                     coerce_float=False, nrows=None, nrows_hint=None):
         """
         Convert structured or record ndarray to DataFrame
 
         Parameters
         ----------
-        data : ndarray (structured dtype), list of tuples, dict, or DataFrame
+        data : ndarray (structured dtype), list of tuples, dict, DataFrame,
+            or an iterator of tuples, lists, dicts or records
         index : string, list of fields, array-like
             Field of array to use as the index, alternately a specific set of
             input labels to use
@@ -780,6 +781,14 @@ class DataFrame(NDFrame):
         coerce_float : boolean, default False
             Attempt to convert values to non-string, non-numeric objects (like
             decimal.Decimal) to floating point, useful for SQL result sets
+        nrows : int, default None
+            Number of rows to read if data is an iterator
+        nrows_hint : int, default None
+            Expected number of rows if data is an iterator of tuples, lists
+            or dicts, which are read into typed columns directly, to
+            preallocate them
+
+            .. versionadded:: 0.16.1
 
         Returns
         -------
@@ -789,6 +798,7 @@ class DataFrame(NDFrame):
         if columns is not None:
             columns = _ensure_index(columns)
 
+        arrays = None
         if com.is_iterator(data):
             if nrows == 0:
                 return cls()
@@ -805,19 +815,30 @@ class DataFrame(NDFrame):
             if hasattr(first_row, 'dtype') and first_row.dtype.names:
                 dtype = first_row.dtype
 
-            values = [first_row]
-
-            if nrows is None:
-                values += data
-            else:
-                values.extend(itertools.islice(data, nrows - 1))
-
-            if dtype is not None:
-                data = np.array(values, dtype=dtype)
+            rows = itertools.chain([first_row], data)
+            if nrows is not None:
+                rows = itertools.islice(rows, nrows)
+
+            # rows are read straight into typed columns
+            size_hint = nrows_hint or nrows or 0
+            if dtype is None and isinstance(first_row, (list, tuple)):
+                arrays, arr_columns = _list_to_arrays(
+                    rows, columns, coerce_float=coerce_float,
+                    size_hint=size_hint)
+            elif dtype is None and isinstance(first_row, collections.Mapping):
+                arrays, arr_columns = _list_of_dict_to_arrays(
+                    rows, columns, coerce_float=coerce_float,
+                    size_hint=size_hint)
+            elif dtype is not None:
+                data = np.array(list(rows), dtype=dtype)
             else:
-                data = values
+                data = list(rows)
 
-        if isinstance(data, dict):
+        if arrays is not None:
+            arr_columns = _ensure_index(arr_columns)
+            if columns is None:
+                columns = arr_columns
+        elif isinstance(data, dict):
             if columns is None:
                 columns = arr_columns = _ensure_index(sorted(data))
                 arrays = [data[k] for k in columns]
@@ -1443,12 +1464,14 @@ class DataFrame(NDFrame):
         max_cols : int, default None
             Determines whether full summary or short summary is printed.
             None follows the `display.max_info_columns` setting.
-        memory_usage : boolean, default None
+        memory_usage : boolean or 'deep', default None
             Specifies whether total memory usage of the DataFrame
             elements (including index) should be displayed. None follows
             the `display.memory_usage` setting. True or False overrides
-            the `display.memory_usage` setting. Memory usage is shown in
-            human-readable units (base-2 representation).
+            the `display.memory_usage` setting. 'deep' also counts the
+            objects referred to by object columns (see ``memory_usage``).
+            Memory usage is shown in human-readable units (base-2
+            representation).
         null_counts : boolean, default None
             Whether to show the non-null counts
             If None, then only show if the frame is smaller than max_info_rows and max_info_columns.
@@ -1516,14 +1539,6 @@ class DataFrame(NDFrame):
         def _non_verbose_repr():
             lines.append(self.columns.summary(name='Columns'))
 
-        def _sizeof_fmt(num, size_qualifier):
-            # returns size in human readable format
-            for x in ['bytes', 'KB', 'MB', 'GB', 'TB']:
-                if num < 1024.0:
-                    return "%3.1f%s %s" % (num, size_qualifier, x)
-                num /= 1024.0
-            return "%3.1f%s %s" % (num, size_qualifier, 'PB')
-
         if verbose:
             _verbose_repr()
         elif verbose is False:  # specifically set to False, not nesc None
@@ -1543,14 +1558,15 @@ class DataFrame(NDFrame):
             # size_qualifier is just a best effort; not guaranteed to catch all
             # cases (e.g., it misses categorical data even with object
             # categories)
-            size_qualifier = ('+' if 'object' in counts
-                              or is_object_dtype(self.index) else '')
-            mem_usage = self.memory_usage(index=True).sum()
+            deep = memory_usage == 'deep'
+            size_qualifier = ('+' if not deep and ('object' in counts
+                              or is_object_dtype(self.index)) else '')
+            mem_usage = self.memory_usage(index=True, deep=deep).sum()
             lines.append("memory usage: %s\n" %
                             _sizeof_fmt(mem_usage, size_qualifier))
         _put_lines(buf, lines)
 
-    def memory_usage(self, index=False):
+    def memory_usage(self, index=False, deep=False):
         """Memory usage of DataFrame columns.
 
         Parameters
@@ -1559,6 +1575,13 @@ class DataFrame(NDFrame):
             Specifies whether to include memory usage of DataFrame's
             index in returned Series. If `index=True` (default is False)
             the first index of the Series is `Index`.
+        deep : boolean or int, default False
+            If True, also count the memory consumed by the objects that
+            object columns (and an object index) refer to. If an integer,
+            estimate it from a sample of (at most) that many values per
+            column.
+
+            .. versionadded:: 0.16.1
 
         Returns
         -------
@@ -1568,20 +1591,153 @@ class DataFrame(NDFrame):
 
         Notes
         -----
-        Memory usage does not include memory consumed by elements that
-        are not components of the array.
+        Unless deep, memory usage does not include memory consumed by
+        elements that are not components of the array. When deep, the memory
+        usage of the index also includes the hash table of its engine and its
+        cached attributes.
 
         See Also
         --------
         numpy.ndarray.nbytes
+        DataFrame.memory_breakdown
         """
-        result = Series([ c.values.nbytes for col, c in self.iteritems() ],
+        result = Series(self._data.memory_usage(deep=deep),
                         index=self.columns)
         if index:
-             result = Series(self.index.nbytes,
-                        index=['Index']).append(result)
+            result = Series(_index_memory_usage(self.index, deep),
+                            index=['Index']).append(result)
+        return result
+
+    def memory_breakdown(self, deep=False):
+        """
+        Memory usage of the parts of the DataFrame: each of its blocks (the
+        arrays holding the columns of the same dtype), and the values, the
+        hash table of the engine and each of the cached attributes of its
+        index and columns.
+
+        .. versionadded:: 0.16.1
+
+        Parameters
+        ----------
+        deep : boolean or int, default False
+            See ``memory_usage``
+
+        Returns
+        -------
+        breakdown : DataFrame
+            With the columns 'part' ('block', 'index' or 'columns'),
+            'component', 'dtype' and 'bytes', one row per component
+        """
+        rows = []
+        for b in self._data.blocks:
+            items = com.pprint_thing(list(self.columns[b.mgr_locs.indexer]))
+            rows.append(('block', '%s: %s' % (b.__class__.__name__, items),
+                         b.dtype, b.memory_usage(deep=deep).sum()))
+
+        for part, axis in [('index', self.index), ('columns', self.columns)]:
+            for component, nbytes in axis._memory_breakdown(deep=deep):
+                rows.append((part, component, axis.dtype, nbytes))
+
+        return DataFrame.from_records(
+            rows, columns=['part', 'component', 'dtype', 'bytes'])
+
+    def optimize_memory(self, categorical_threshold=0.5, compact_strings=True,
+                        verbose=False, buf=None):
+        """
+        Return a copy of the DataFrame using less memory:
+
+        * integer and float columns are cast to the smallest int, uint or
+          float dtype that holds their values exactly (float columns holding
+          only integers become integer columns)
+        * object columns with few unique values become categorical
+        * the other object columns holding only strings are stored compactly
+          (see ``compact_strings``)
+
+        .. versionadded:: 0.16.1
+
+        Parameters
+        ----------
+        categorical_threshold : float, default 0.5
+            Object columns whose number of unique values is at most this
+            fraction of their length are converted to categorical
+        compact_strings : boolean, default True
+            Store the remaining string columns compactly
+        verbose : boolean, default False
+            Print the memory usage of the blocks (including the objects they
+            hold) before and after
+        buf : writable buffer, defaults to sys.stdout
+
+        Returns
+        -------
+        optimized : DataFrame
+
+        Notes
+        -----
+        Arithmetic on the downcast columns is done in their new dtypes, which
+        can overflow (e.g. adding int8 columns).
+        """
+        from pandas.core.format import _put_lines
+
+        result = self._constructor(self._data.optimize_memory(
+            categorical_threshold=categorical_threshold,
+            compact_strings=compact_strings)).__finalize__(self)
+
+        if verbose:
+            if buf is None:  # pragma: no cover
+                buf = sys.stdout
+            lines = []
+            for label, data in [('before', self._data),
+                                ('after', result._data)]:
+                usage = [(b, b.memory_usage(deep=True).sum())
+                         for b in data.blocks]
+                lines.append('memory usage %s: %s' % (
+                    label, _sizeof_fmt(sum(n for _, n in usage))))
+                for b, n in usage:
+                    lines.append('    %s: %d column(s), %s' % (
+                        b.dtype, len(b.mgr_locs), _sizeof_fmt(n)))
+            _put_lines(buf, lines + [''])
+
         return result
 
+    def compact_strings(self, columns=None):
+        """
+        Return a copy of the DataFrame in which the object columns that only
+        hold text strings, or only bytes strings, (and missing values) are
+        stored compactly: as codes into the unique strings of the columns,
+        which are kept (text as utf-8) in a single buffer, instead of as an
+        array of Python objects.
+
+        .. versionadded:: 0.16.1
+
+        Parameters
+        ----------
+        columns : list-like, optional
+            The columns to compact, default all
+
+        Returns
+        -------
+        compacted : DataFrame
+
+        Raises
+        ------
+        KeyError if any of the columns are not in the frame
+
+        Notes
+        -----
+        This only saves memory. The columns still have dtype object and
+        behave as before. Taking, slicing, reindexing, copying and writing
+        out (``to_csv``) the columns work on the compact storage; modifying
+        a column in-place converts it back to Python objects for good.
+        Anything else, e.g. factorizing, comparisons, the ``.str`` methods or
+        writing to HDF5 / msgpack, works on the column decoded to Python
+        objects.
+        Missing values are held in a validity bitmap and come back as NaN.
+        """
+        if columns is not None:
+            columns = _ensure_index(columns)
+        return self._constructor(
+            self._data.compact_strings(items=columns)).__finalize__(self)
+
     def transpose(self):
         """Transpose index and columns"""
         return super(DataFrame, self).transpose(1, 0)
@@ -1667,6 +1823,7 @@ class DataFrame(NDFrame):
             If label pair is contained, will be reference to calling DataFrame,
             otherwise a new object
         """
+        self._unshare()
         try:
             if takeable is True:
                 series = self._iget_item_cache(col)
@@ -2295,12 +2452,59 @@ class DataFrame(NDFrame):
             else:
                 results[k] = v
 
-        # ... and then assign
+        # ... and then assign, existing columns in place
+        new_items = []
         for k, v in results.items():
-            data[k] = v
+            if k in data.columns:
+                data[k] = v
+            else:
+                new_items.append(k)
+
+        # new columns are added to the BlockManager in one step
+        new_values = []
+        for k in new_items:
+            v = results[k]
+            data._ensure_valid_index(v)
+            new_values.append(data._sanitize_column(k, v))
+
+        if all(getattr(v, 'ndim', 1) == 1 for v in new_values):
+            data._data.extend(new_items, new_values)
+            data._clear_item_cache()
+        else:
+            for k, v in zip(new_items, new_values):
+                data[k] = v
 
         return data
 
+    def lazy(self):
+        """
+        Return a LazyFrame deferring operations on this DataFrame.
+
+        Filters, projections, column assignments, groupby aggregations and
+        merges on the LazyFrame are recorded rather than executed. On
+        ``collect()`` the recorded plan is optimized, pushing filters and
+        column selections down towards the data and evaluating elementwise
+        expressions in a single numexpr pass where possible, and executed.
+
+        .. versionadded:: 0.16.1
+
+        Returns
+        -------
+        LazyFrame
+
+        Examples
+        --------
+        >>> lf = df.lazy()
+        >>> lf = lf.assign(c=lf.a + lf.b)
+        >>> lf[(lf.a > 0) & (lf.c < 10)].groupby('key')['c'].sum().collect()
+
+        See Also
+        --------
+        LazyFrame.explain : the optimized plan
+        """
+        from pandas.core.lazy import LazyFrame
+        return LazyFrame(self)
+
     def _sanitize_column(self, key, value):
         # Need to make sure new columns (which go into the BlockManager as new
         # blocks) are always copied
@@ -3603,7 +3807,7 @@ class DataFrame(NDFrame):
     # Function application
 
     def apply(self, func, axis=0, broadcast=False, raw=False, reduce=None,
-              args=(), **kwds):
+              args=(), engine=None, **kwds):
         """
         Applies function along input axis of DataFrame.
 
@@ -3638,6 +3842,20 @@ class DataFrame(NDFrame):
         args : tuple
             Positional arguments to pass to function in addition to the
             array/series
+        engine : {None, 'batched', 'numba'}, default None
+            Requires raw=True. Instead of calling func once per row/column:
+
+            * 'batched' : call func with 2-dimensional ndarrays holding a
+              batch of rows (axis=1) or columns (axis=0) each, one per row of
+              the ndarray. func must return an array with one value, or one
+              row of values, per row of its input
+            * 'numba' : compile func, taking the ndarray of a row/column and
+              returning a number, with numba and call it on the float64
+              values of every row/column in a compiled loop. Requires numba,
+              and a frame of numeric dtypes
+
+            .. versionadded:: 0.16.1
+
         Additional keyword arguments will be passed as keywords to the function
 
         Notes
@@ -3653,6 +3871,8 @@ class DataFrame(NDFrame):
         >>> df.apply(numpy.sqrt) # returns DataFrame
         >>> df.apply(numpy.sum, axis=0) # equiv to df.sum(0)
         >>> df.apply(numpy.sum, axis=1) # equiv to df.sum(1)
+        >>> df.apply(lambda x: x[:, 0] * x[:, 1], axis=1, raw=True,
+        ...          engine='batched')
 
         See also
         --------
@@ -3671,6 +3891,25 @@ class DataFrame(NDFrame):
         if len(self.columns) == 0 and len(self.index) == 0:
             return self._apply_empty_result(func, axis, reduce, *args, **kwds)
 
+        if engine is not None:
+            if not raw:
+                raise ValueError("engine=%r requires raw=True" % engine)
+            if broadcast:
+                raise ValueError("broadcast is not supported with "
+                                 "engine=%r" % engine)
+            if not all(self.shape):
+                return self._apply_empty_result(func, axis, reduce, *args,
+                                                **kwds)
+            if engine == 'batched':
+                return self._apply_batched(f, axis)
+            elif engine == 'numba':
+                if args or kwds:
+                    raise ValueError("args and keywords are not supported "
+                                     "with engine='numba'")
+                return self._apply_numba(func, axis)
+            raise ValueError("engine must be one of None, 'batched' or "
+                             "'numba', got %r" % engine)
+
         if isinstance(f, np.ufunc):
             results = f(self.values)
             return self._constructor(data=results, index=self.index,
@@ -3717,6 +3956,53 @@ class DataFrame(NDFrame):
         else:
             return Series(result, index=self._get_agg_axis(axis))
 
+    def _apply_batched(self, func, axis):
+        # the rows passed to func are the rows (axis=1) or columns (axis=0)
+        values = self.values
+        if axis == 0:
+            values = values.T
+
+        n, k = values.shape
+        batch_size = max(1, _APPLY_BATCH_SIZE // max(k, 1))
+
+        results = []
+        for start in range(0, n, batch_size):
+            batch = values[start:start + batch_size]
+            result = np.asarray(func(batch))
+            if result.ndim not in (1, 2) or len(result) != len(batch):
+                raise ValueError("func must return one value or one row of "
+                                 "values per row of its input, got shape "
+                                 "%s for an input of shape %s"
+                                 % (result.shape, batch.shape))
+            results.append(result)
+
+        return self._wrap_engine_result(np.concatenate(results), axis)
+
+    def _apply_numba(self, func, axis):
+        if not all(com.is_numeric_dtype(dtype) for dtype in self.dtypes):
+            raise TypeError("engine='numba' requires a frame of numeric "
+                            "dtypes")
+
+        values = self.values
+        if axis == 0:
+            values = values.T
+        values = np.ascontiguousarray(values, dtype=np.float64)
+
+        result = _get_numba_apply_loop(func)(values)
+        return self._wrap_engine_result(result, axis)
+
+    def _wrap_engine_result(self, result, axis):
+        labels = self._get_agg_axis(axis)
+        if result.ndim == 1:
+            return Series(result, index=labels)
+
+        other = self._get_axis(axis)
+        columns = other if result.shape[1] == len(other) else None
+        result = self._constructor(result, index=labels, columns=columns)
+        if axis == 0:
+            result = result.T
+        return result
+
     def _apply_standard(self, func, axis, ignore_failures=False, reduce=True):
 
         # skip if we are mixed datelike and trying reduce across axes
@@ -4693,10 +4979,17 @@ class DataFrame(NDFrame):
                                 " allowed to be passed to DataFrame.isin(), "
                                 "you passed a "
                                 "{0!r}".format(type(values).__name__))
-            return DataFrame(lib.ismember(self.values.ravel(),
-                                          set(values)).reshape(self.shape),
-                             self.index,
-                             self.columns)
+            values = com._asarray_tuplesafe(values)
+
+            # column by column, so that numeric columns use the typed
+            # membership tests
+            result = np.empty(self.shape, dtype=bool)
+            for i in range(len(self.columns)):
+                comps = self.iloc[:, i]
+                if com.needs_i8_conversion(comps):
+                    comps = comps.asobject
+                result[:, i] = algos.isin(comps, values)
+            return DataFrame(result, self.index, self.columns)
 
     #----------------------------------------------------------------------
     # Deprecated stuff
@@ -4741,6 +5034,66 @@ DataFrame._add_numeric_operations()
 
 _EMPTY_SERIES = Series([])
 
+
+def _index_memory_usage(index, deep=False):
+    """ the memory usage of index, with its engine and cache if deep """
+    if deep:
+        return index.memory_usage(deep=deep)
+    return index.nbytes
+
+# number of values passed at a time to func by apply(engine='batched')
+_APPLY_BATCH_SIZE = 1 << 20
+
+# the most recently used compiled loops of apply(engine='numba'), by the
+# code of the function; the loops hold on to the function, so they are
+# not keyed on it (which would never let it go)
+_numba_apply_loops = OrderedDict()
+_NUMBA_APPLY_CACHE_SIZE = 128
+
+
+def _get_numba_apply_loop(func):
+    """
+    compile func, taking a 1-d float64 ndarray and returning a number, and a
+    loop calling it on each row of a 2-d float64 ndarray with numba
+    """
+    # closures compile their cell values in, so they are not cached
+    key = None
+    code = getattr(func, '__code__', None)
+    if code is not None and func.__closure__ is None:
+        key = (code, func.__defaults__)
+        try:
+            loop = _numba_apply_loops.pop(key)
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable defaults
+            key = None
+        else:
+            _numba_apply_loops[key] = loop
+            return loop
+
+    try:
+        import numba
+    except ImportError:  # pragma: no cover
+        raise ImportError("engine='numba' requires numba")
+
+    jitted = numba.njit(func)
+
+    @numba.njit
+    def loop(values):
+        n = values.shape[0]
+        result = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            result[i] = jitted(values[i])
+        return result
+
+    if key is not None:
+        _numba_apply_loops[key] = loop
+        while len(_numba_apply_loops) > _NUMBA_APPLY_CACHE_SIZE:
+            _numba_apply_loops.popitem(last=False)
+    return loop
+
+
 def _arrays_to_mgr(arrays, arr_names, index, columns, dtype=None):
     """
     Segregate Series based on type and coerce into matrices.
@@ -4945,12 +5298,13 @@ def _reorder_arrays(arrays, arr_columns, columns):
     return arrays, arr_columns
 
 
-def _list_to_arrays(data, columns, coerce_float=False, dtype=None):
-    if len(data) > 0 and isinstance(data[0], tuple):
-        content = list(lib.to_object_array_tuples(data).T)
-    else:
-        # list of lists
-        content = list(lib.to_object_array(data).T)
+def _list_to_arrays(data, columns, coerce_float=False, dtype=None,
+                    size_hint=None):
+    # data is a list or an iterator of tuples or lists
+    if size_hint is None:
+        size_hint = len(data) if isinstance(data, list) else 0
+    content = lib.rows_to_arrays(data, size_hint=size_hint,
+                                 infer=not _is_object_dtype_arg(dtype))
     return _convert_object_array(content, columns, dtype=dtype,
                                  coerce_float=coerce_float)
 
@@ -4989,20 +5343,22 @@ def _list_of_series_to_arrays(data, columns, coerce_float=False, dtype=None):
         return values.T, columns
 
 
-def _list_of_dict_to_arrays(data, columns, coerce_float=False, dtype=None):
-    if columns is None:
-        gen = (list(x.keys()) for x in data)
-        columns = lib.fast_unique_multiple_list_gen(gen)
-
-    # assure that they are of the base dict class and not of derived
-    # classes
-    data = [(type(d) is dict) and d or dict(d) for d in data]
-
-    content = list(lib.dicts_to_array(data, list(columns)).T)
+def _list_of_dict_to_arrays(data, columns, coerce_float=False, dtype=None,
+                            size_hint=None):
+    # data is a list or an iterator of dicts
+    if size_hint is None:
+        size_hint = len(data) if isinstance(data, list) else 0
+    content, columns = lib.dicts_to_arrays(
+        data, columns=None if columns is None else list(columns),
+        size_hint=size_hint, infer=not _is_object_dtype_arg(dtype))
     return _convert_object_array(content, columns, dtype=dtype,
                                  coerce_float=coerce_float)
 
 
+def _is_object_dtype_arg(dtype):
+    return dtype is not None and (dtype == object or dtype == np.object)
+
+
 def _convert_object_array(content, columns, coerce_float=False, dtype=None):
     if columns is None:
         columns = _default_index(len(content))
@@ -5015,7 +5371,8 @@ def _convert_object_array(content, columns, coerce_float=False, dtype=None):
     # provide soft conversion of object dtypes
     def convert(arr):
         if dtype != object and dtype != np.object:
-            arr = lib.maybe_convert_objects(arr, try_float=coerce_float)
+            if arr.dtype == np.object_:
+                arr = lib.maybe_convert_objects(arr, try_float=coerce_float)
             arr = com._possibly_cast_to_datetime(arr, dtype)
         return arr
 
@@ -5088,6 +5445,15 @@ def _put_str(s, space):
     return ('%s' % s)[:space].ljust(space)
 
 
+def _sizeof_fmt(num, size_qualifier=''):
+    # returns size in human readable format
+    for x in ['bytes', 'KB', 'MB', 'GB', 'TB']:
+        if num < 1024.0:
+            return "%3.1f%s %s" % (num, size_qualifier, x)
+        num /= 1024.0
+    return "%3.1f%s %s" % (num, size_qualifier, 'PB')
+
+
 #----------------------------------------------------------------------
 # Add plotting methods to DataFrame
 
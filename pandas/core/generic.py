@@ -927,11 +927,37 @@ class NDFrame(PandasObject):
             (default is False)
         compress : type of compressor (zlib or blosc), default to None (no
             compression)
+        zero_copy : boolean, write the blocks as raw buffers which
+            read_msgpack builds the blocks over without copying
+            (default is False)
         """
 
         from pandas.io import packers
         return packers.to_msgpack(path_or_buf, self, **kwargs)
 
+    def to_shared_memory(self, path=None):
+        """
+        Place the object in shared memory, for other processes to read with
+        ``pd.from_shared_memory(handle)`` as read-only, without copying
+        the blocks.
+
+        THIS IS AN EXPERIMENTAL LIBRARY and the storage format
+        may not be stable until a future release.
+
+        Parameters
+        ----------
+        path : string File path, default None
+            if None, a temporary file on a tmpfs (/dev/shm) when available
+
+        Returns
+        -------
+        handle : SharedMemoryHandle, picklable; call ``handle.unlink()``
+            to release the memory
+        """
+
+        from pandas.io import packers
+        return packers.to_shared_memory(self, path=path)
+
     def to_sql(self, name, con, flavor='sqlite', schema=None, if_exists='fail',
                index=True, index_label=None, chunksize=None, dtype=None):
         """
@@ -1170,6 +1196,11 @@ class NDFrame(PandasObject):
         else:
             self._item_cache.clear()
 
+    def _unshare(self):
+        """ copy any values shared copy-on-write before setting in-place """
+        if self._data._unshare():
+            self._clear_item_cache()
+
     def _slice(self, slobj, axis=0, kind=None):
         """
         Construct a slice of this container.
@@ -2250,6 +2281,10 @@ class NDFrame(PandasObject):
         -------
         copy : type of caller
         """
+        if deep and config.get_option('mode.copy_on_write'):
+            # cached items are views on our values, which would prevent
+            # sharing them
+            self._clear_item_cache()
         data = self._data.copy(deep=deep)
         return self._constructor(data).__finalize__(self)
 
@@ -1484,8 +1484,13 @@ class BaseGrouper(object):
                 swapped = True
                 values = values.swapaxes(0, axis)
             if arity > 1:
-                raise NotImplementedError
-            out_shape = (self.ngroups,) + values.shape[1:]
+                if (vdim > 2 or swapped or
+                        how not in self._cython_functions):
+                    raise NotImplementedError
+                # arity columns of output for each column of values
+                out_shape = (self.ngroups, arity * values.shape[1])
+            else:
+                out_shape = (self.ngroups,) + values.shape[1:]
 
         is_numeric = is_numeric_dtype(values.dtype)
 
@@ -1798,6 +1803,9 @@ class BinGrouper(BaseGrouper):
         'min': 'group_min_bin',
         'max': 'group_max_bin',
         'var': 'group_var_bin',
+        'median': {
+            'name': 'group_median_bin'
+        },
         'ohlc': 'group_ohlc',
         'first': {
             'name': 'group_nth_bin',
@@ -3268,6 +3276,30 @@ class DataFrameGroupBy(NDFrameGroupBy):
              in self._iterate_column_groupbys()),
             keys=self._selected_obj.columns, axis=1)
 
+    def ohlc(self):
+        """
+        Compute open, high, low and close values of each group for each
+        column, excluding missing values
+        """
+        obj = self._selected_obj
+        if not (isinstance(self.grouper, BinGrouper) and self.axis == 0 and
+                len(obj.columns) > 1 and
+                all(dtype.kind in 'biuf' for dtype in obj.dtypes)):
+            return super(DataFrameGroupBy, self).ohlc()
+
+        # aggregate all of the columns in one pass over the bins, as the
+        # column by column path would do it
+        from pandas.tools.merge import concat
+        result, names = self.grouper.aggregate(
+            np.asarray(obj.values, dtype=np.float64), 'ohlc')
+        index = self.grouper.result_index
+        pieces = []
+        for j in range(len(obj.columns)):
+            values = self._try_cast(result[:, 4 * j:4 * j + 4],
+                                    obj.iloc[:, j])
+            pieces.append(DataFrame(values, index=index, columns=names))
+        return concat(pieces, keys=obj.columns, axis=1)
+
 from pandas.tools.plotting import boxplot_frame_groupby
 DataFrameGroupBy.boxplot = boxplot_frame_groupby
 
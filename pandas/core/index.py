@@ -11,6 +11,7 @@ from sys import getsizeof
 import pandas.tslib as tslib
 import pandas.lib as lib
 import pandas.algos as _algos
+import pandas.core.algorithms as algos
 import pandas.index as _index
 from pandas.lib import Timestamp, Timedelta, is_datetime_array
 from pandas.core.base import PandasObject, FrozenList, FrozenNDArray, IndexOpsMixin, _shared_docs
@@ -820,6 +821,68 @@ class Index(IndexOpsMixin, PandasObject):
     def _cleanup(self):
         self._engine.clear_mapping()
 
+    def memory_usage(self, deep=False):
+        """
+        Memory usage of the index: its values, the hash table of its engine
+        (once it is populated) and its other cached attributes
+
+        .. versionadded:: 0.16.1
+
+        Parameters
+        ----------
+        deep : boolean or int, default False
+            If True, include the memory of the objects referred to by object
+            values; if an integer, estimate it from a sample of (at most) that
+            many values
+
+        Returns
+        -------
+        bytes used : int
+
+        See Also
+        --------
+        DataFrame.memory_breakdown
+        """
+        return sum(n for _, n in self._memory_breakdown(deep=deep))
+
+    def _memory_breakdown(self, deep=False):
+        """ list of (component, bytes used) """
+        values = self._data
+        result = [('values', values.nbytes + com._object_nbytes(values, deep))]
+        return result + self._cache_memory_breakdown(deep=deep)
+
+    def _cache_memory_breakdown(self, deep=False):
+        result = []
+        cache = getattr(self, '_cache', None) or {}
+        for name, value in sorted(compat.iteritems(cache)):
+            if name == '_engine':
+                result.append(('engine', value.sizeof()))
+                continue
+
+            if value is self:
+                continue
+            result.append(('cache: %s' % name,
+                           self._cached_nbytes(value, deep=deep)))
+        return result
+
+    def _cached_nbytes(self, value, deep=False):
+        """ the bytes held by a cached value, including the arrays held in
+            tuples, lists and dicts """
+        if value is self:
+            return 0
+        elif isinstance(value, Index):
+            return value.memory_usage(deep=deep)
+        elif isinstance(value, np.ndarray):
+            return value.nbytes + com._object_nbytes(value, deep)
+        elif isinstance(value, (tuple, list)):
+            return getsizeof(value) + sum(self._cached_nbytes(v, deep=deep)
+                                          for v in value)
+        elif isinstance(value, dict):
+            return getsizeof(value) + sum(
+                getsizeof(k) + self._cached_nbytes(v, deep=deep)
+                for k, v in compat.iteritems(value))
+        return getsizeof(value)
+
     @cache_readonly
     def _engine(self):
         # property, for now, slow to look up
@@ -1699,10 +1762,9 @@ class Index(IndexOpsMixin, PandasObject):
         is_contained : ndarray (boolean dtype)
 
         """
-        value_set = set(values)
         if level is not None:
             self._validate_index_level(level)
-        return lib.ismember(self._array_values(), value_set)
+        return algos.isin(self._array_values(), values)
 
     def reindex(self, target, method=None, level=None, limit=None):
         """
@@ -2845,11 +2907,9 @@ class Float64Index(NumericIndex):
 
     @Appender(Index.isin.__doc__)
     def isin(self, values, level=None):
-        value_set = set(values)
         if level is not None:
             self._validate_index_level(level)
-        return lib.ismember_nans(self._array_values(), value_set,
-                                 isnull(list(value_set)).any())
+        return algos.isin(self._array_values(), values)
 
 
 Float64Index._add_numeric_methods()
@@ -3216,6 +3276,15 @@ class MultiIndex(Index):
         names_nbytes = sum(( getsizeof(i) for i in self.names ))
         return level_nbytes + label_nbytes + names_nbytes
 
+    def _memory_breakdown(self, deep=False):
+        result = [('levels', sum(lev.memory_usage(deep=deep)
+                                 for lev in self.levels)),
+                  ('labels', sum(lab.nbytes for lab in self.labels))]
+        if self._tuples is not None:
+            result.append(('tuples', self._tuples.nbytes +
+                           com._object_nbytes(self._tuples, deep)))
+        return result + self._cache_memory_breakdown(deep=deep)
+
     def __repr__(self):
         encoding = get_option('display.encoding')
         attrs = [('levels', default_pprint(self.levels)),
@@ -4838,7 +4907,7 @@ class MultiIndex(Index):
     @Appender(Index.isin.__doc__)
     def isin(self, values, level=None):
         if level is None:
-            return lib.ismember(self._array_values(), set(values))
+            return algos.isin(self._array_values(), list(values))
         else:
             num = self._get_level_number(level)
             levs = self.levels[num]
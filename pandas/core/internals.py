@@ -1,5 +1,7 @@
 import copy
+import sys
 import itertools
+import weakref
 import re
 import operator
 from datetime import datetime, timedelta
@@ -7,6 +9,7 @@ from collections import defaultdict
 
 import numpy as np
 from pandas.core.base import PandasObject
+from pandas.core.config import get_option
 
 from pandas.core.common import (_possibly_downcast_to_dtype, isnull,
                                 _NS_DTYPE, _TD_DTYPE, ABCSeries, is_list_like,
@@ -19,6 +22,7 @@ from pandas.core.index import Index, MultiIndex, _ensure_index
 from pandas.core.indexing import maybe_convert_indices, length_of_indexer
 from pandas.core.categorical import Categorical, maybe_to_categorical
 import pandas.core.common as com
+from pandas.core.algorithms import factorize
 from pandas.sparse.array import _maybe_to_sparse, SparseArray
 import pandas.lib as lib
 import pandas.tslib as tslib
@@ -34,6 +38,35 @@ from pandas.tseries.timedeltas import _coerce_scalar_to_timedelta_type
 from pandas.lib import BlockPlacement
 
 
+class _BlockRef(object):
+
+    """
+    Number of blocks holding the same values copy-on-write
+    (see option ``mode.copy_on_write``)
+    """
+    __slots__ = ['count']
+
+    def __init__(self):
+        self.count = 1
+
+
+# the values that have been shared copy-on-write (by id); a read-only view
+# on them must be copied before setting, even once the option is off
+_shared_values = weakref.WeakValueDictionary()
+
+
+def _is_shared_view(values):
+    """ whether values are a read-only view on values shared copy-on-write """
+    if not isinstance(values, np.ndarray) or values.flags.writeable:
+        return False
+    base = values
+    while isinstance(base, np.ndarray):
+        if _shared_values.get(id(base)) is base:
+            return True
+        base = base.base
+    return False
+
+
 class Block(PandasObject):
 
     """
@@ -42,7 +75,7 @@ class Block(PandasObject):
 
     Index-ignorant; let the container take care of that
     """
-    __slots__ = ['_mgr_locs', 'values', 'ndim']
+    __slots__ = ['_mgr_locs', 'values', 'ndim', '_ref']
     is_numeric = False
     is_float = False
     is_integer = False
@@ -70,6 +103,7 @@ class Block(PandasObject):
 
         self.mgr_locs = placement
         self.values = values
+        self._ref = None
 
         if len(self.mgr_locs) != len(self.values):
             raise ValueError('Wrong number of items passed %d,'
@@ -173,6 +207,7 @@ class Block(PandasObject):
         self.mgr_locs = BlockPlacement(state[0])
         self.values = state[1]
         self.ndim = self.values.ndim
+        self._ref = None
 
     def _slice(self, slicer):
         """ return a slice of my values """
@@ -267,6 +302,7 @@ class Block(PandasObject):
         -------
         None
         """
+        self._unshare()
         self.values[locs] = values
 
     def delete(self, loc):
@@ -297,6 +333,11 @@ class Block(PandasObject):
                 raise NotImplementedError
             mask[mask.cumsum(self.ndim-1)>limit]=False
 
+        # nothing to fill
+        if not mask.any():
+            blocks = [self] if inplace else [self.copy()]
+            return self._maybe_downcast(blocks, downcast)
+
         value = self._try_fill(value)
         blocks = self.putmask(mask, value, inplace=inplace)
         return self._maybe_downcast(blocks, downcast)
@@ -425,6 +466,31 @@ class Block(PandasObject):
 
         return [self.copy()] if copy else [self]
 
+    def compact_strings(self, locs=None):
+        """ return a copy of the block with its strings held compactly
+            (see CompactStringBlock), we do not hold strings here! """
+        return self.copy()
+
+    def optimize_memory(self, **kwargs):
+        """ return a copy of the block using less memory, there is nothing
+            to gain here! """
+        return self.copy()
+
+    def memory_usage(self, deep=False):
+        """ the bytes held by each of my items (a single one if 1-dim); if
+            deep, including the objects referred to by object values (see
+            com._object_nbytes) """
+        return self._spread_nbytes(self.values.nbytes)
+
+    def _spread_nbytes(self, nbytes):
+        """ spread bytes held in common evenly over my items """
+        n = 1 if self.ndim == 1 else len(self.mgr_locs)
+        result = np.empty(n, dtype=np.int64)
+        if n:
+            result.fill(nbytes // n)
+            result[:nbytes % n] += 1
+        return result
+
     def _can_hold_element(self, value):
         raise NotImplementedError()
 
@@ -496,12 +562,71 @@ class Block(PandasObject):
 
     # block actions ####
     def copy(self, deep=True):
+        # no reference to the values may be held while checking whether
+        # they can be shared
+        ref = self._share_ref() if deep else None
         values = self.values
-        if deep:
+        if deep and ref is None:
             values = values.copy()
-        return make_block(values, ndim=self.ndim,
-                          klass=self.__class__, fastpath=True,
-                          placement=self.mgr_locs)
+        block = make_block(values, ndim=self.ndim,
+                           klass=self.__class__, fastpath=True,
+                           placement=self.mgr_locs)
+        if ref is not None:
+            block._ref = ref
+        return block
+
+    def _share_ref(self):
+        """
+        if copy-on-write is enabled and my values can be shared, mark them
+        read-only and return their (incremented) reference count; otherwise
+        return None and the caller must copy the values
+        """
+        if not get_option('mode.copy_on_write'):
+            return None
+
+        ref = self._ref
+        if ref is None:
+
+            # we can only share memory that we own and that nobody else
+            # holds a view on (only self.values and the getrefcount arg
+            # refer to it); any other view could still write into the
+            # shared buffer
+            if (type(self.values) is not np.ndarray or
+                    self.values.base is not None or
+                    not self.values.flags.writeable or
+                    sys.getrefcount(self.values) > 2):
+                return None
+
+            self.values.flags.writeable = False
+            _shared_values[id(self.values)] = self.values
+            ref = self._ref = _BlockRef()
+
+        ref.count += 1
+        return ref
+
+    def _unshare(self):
+        """
+        make sure that my values are safe to modify in-place, copying them
+        if they are shared copy-on-write with other blocks
+
+        Returns
+        -------
+        boolean, whether the values were copied
+        """
+        ref = self._ref
+        if ref is not None:
+            self._ref = None
+            ref.count -= 1
+            if ref.count == 0:
+                # the other holders have all made their own copy
+                self.values.flags.writeable = True
+                return False
+        elif not _is_shared_view(self.values):
+            return False
+
+        # a view on values that are shared copy-on-write
+        self.values = self.values.copy()
+        return True
 
     def replace(self, to_replace, value, inplace=False, filter=None,
                 regex=False):
@@ -527,6 +652,7 @@ class Block(PandasObject):
         indexer is a direct slice/positional indexer; value must be a
         compatible shape
         """
+        self._unshare()
 
         # coerce None values, if appropriate
         if value is None:
@@ -644,6 +770,8 @@ class Block(PandasObject):
         a new block(s), the result of the putmask
         """
 
+        if inplace:
+            self._unshare()
         new_values = self.values if inplace else self.values.copy()
 
         # may need to align the new
@@ -782,6 +910,8 @@ class Block(PandasObject):
                     return [self.copy()]
 
         fill_value = self._try_fill(fill_value)
+        if inplace:
+            self._unshare()
         values = self.values if inplace else self.values.copy()
         values = self._try_operate(values)
         values = com.interpolate_2d(values,
@@ -802,6 +932,8 @@ class Block(PandasObject):
                      inplace=False, downcast=None, **kwargs):
         """ interpolate using scipy wrappers """
 
+        if inplace:
+            self._unshare()
         data = self.values if inplace else self.values.copy()
 
         # only deal with floats
@@ -1142,6 +1274,7 @@ class NonConsolidatableMixIn(object):
             raise TypeError("values must be {0}".format(self._holder.__name__))
 
         self.values = values
+        self._ref = None
 
     def get_values(self, dtype=None):
         """ need to to_dense myself (and always return a ndim sized object) """
@@ -1189,6 +1322,19 @@ class NumericBlock(Block):
     is_numeric = True
     _can_hold_na = True
 
+    def optimize_memory(self, **kwargs):
+        """ return the items cast to the smallest dtype holding their values
+            exactly, can return multiple blocks! """
+        blocks = []
+        for i, rl in enumerate(self.mgr_locs):
+            values = self.values[i:i + 1]
+            new_values = com._possibly_downcast_numeric(values)
+            if new_values is values:
+                new_values = values.copy()
+            blocks.append(make_block(new_values, ndim=self.ndim,
+                                     placement=[rl]))
+        return blocks
+
 
 class FloatOrComplexBlock(NumericBlock):
     __slots__ = ()
@@ -1303,6 +1449,9 @@ class TimeDeltaBlock(IntBlock):
     _can_hold_na = True
     is_numeric = False
 
+    def optimize_memory(self, **kwargs):
+        return self.copy()
+
     @property
     def fill_value(self):
         return tslib.iNaT
@@ -1484,6 +1633,71 @@ class ObjectBlock(Block):
 
         return blocks
 
+    def compact_strings(self, locs=None):
+        """ return a copy of the block, holding the items (of locs, if
+            given) that only have strings and missing values compactly
+            (see CompactStringBlock)
+
+            can return multiple blocks!
+            """
+        compact, other = [], []
+        for i, rl in enumerate(self.mgr_locs):
+            if locs is None or rl in locs:
+                newb = CompactStringBlock.from_block(
+                    self.getitem_block(slice(i, i + 1)))
+                if newb is not None:
+                    compact.append(newb)
+                    continue
+            other.append(i)
+
+        if not compact:
+            return self.copy()
+        if other:
+            compact.append(self.getitem_block(other).copy())
+        return compact
+
+    def optimize_memory(self, categorical_threshold=0.5,
+                        compact_strings=True, **kwargs):
+        """ return a copy of the block, holding the items with few unique
+            values as categoricals and (optionally) the other items that
+            only hold strings compactly
+
+            can return multiple blocks!
+            """
+        blocks, other = [], []
+        for i, rl in enumerate(self.mgr_locs):
+            values = self.values[i]
+            try:
+                n_uniques = len(factorize(values)[1])
+            except TypeError:
+                # unhashable values
+                n_uniques = len(values)
+
+            if len(values) and n_uniques <= categorical_threshold * len(values):
+                blocks.append(make_block(Categorical(values), ndim=self.ndim,
+                                         placement=[rl]))
+            else:
+                other.append(i)
+
+        if other:
+            rest = self.getitem_block(other)
+            if compact_strings:
+                rest = rest.compact_strings()
+            else:
+                rest = rest.copy()
+            blocks.extend(rest if isinstance(rest, list) else [rest])
+        return blocks
+
+    def memory_usage(self, deep=False):
+        result = super(ObjectBlock, self).memory_usage(deep=deep)
+        if deep:
+            values = self.values
+            if self.ndim == 1:
+                result += com._object_nbytes(values, deep)
+            else:
+                result += [com._object_nbytes(v, deep) for v in values]
+        return result
+
     def set(self, locs, values, check=False):
         """
         Modify Block in-place with new item value
@@ -1500,6 +1714,7 @@ class ObjectBlock(Block):
                     return
             except:
                 pass
+        self._unshare()
         try:
             self.values[locs] = values
         except (ValueError):
@@ -1608,6 +1823,8 @@ class ObjectBlock(Block):
                 result = [result]
             return result
 
+        if inplace:
+            self._unshare()
         new_values = self.values if inplace else self.values.copy()
 
         # deal with replacing values with objects (strings) that match but
@@ -1640,6 +1857,416 @@ class ObjectBlock(Block):
                 make_block(new_values,
                            fastpath=True, placement=self.mgr_locs)]
 
+# lone surrogates are encoded as such
+_UTF8_ERRORS = 'surrogatepass' if compat.PY3 else 'strict'
+
+
+def _encode_strings(values):
+    """
+    dictionary encode object values holding only text (unicode) strings, or
+    only bytes strings, and missing values; return the codes into the unique
+    strings, the validity of the codes, the unique strings as one buffer
+    (utf-8 for text) with the offsets of the strings in it and whether they
+    are text, or None if the values cannot be encoded
+    """
+    labels, uniques = factorize(values.ravel())
+    if not len(uniques):
+        return None
+    kinds = set(type(x) for x in uniques)
+    if kinds == set([compat.text_type]):
+        text = True
+        uniques = [x.encode('utf-8', _UTF8_ERRORS) for x in uniques]
+    elif kinds == set([compat.binary_type]):
+        text = False
+    else:
+        return None
+
+    data = b''.join(uniques)
+    if len(data):
+        buffer = np.frombuffer(data, dtype=np.uint8)
+    else:
+        buffer = np.empty(0, dtype=np.uint8)
+    offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(x) for x in uniques])
+
+    valid = labels != -1
+    codes = labels.astype(np.int32 if len(uniques) < 2 ** 31 else np.int64)
+    codes[~valid] = 0
+    return (codes.reshape(values.shape), valid.reshape(values.shape),
+            buffer, offsets, text)
+
+
+def _decode_strings(codes, buffer, offsets, text):
+    """ the strings the codes refer to, as an object array """
+    n_uniques = len(offsets) - 1
+    if codes.size >= n_uniques:
+        used, inverse = np.arange(n_uniques), codes.ravel()
+    else:
+        # only decode the strings that are referred to
+        used, inverse = np.unique(codes.ravel(), return_inverse=True)
+
+    strings = [buffer[start:end].tostring()
+               for start, end in zip(offsets[used], offsets[used + 1])]
+    if text:
+        strings = [x.decode('utf-8', _UTF8_ERRORS) for x in strings]
+    uniques = np.empty(len(strings), dtype=np.object_)
+    uniques[:] = strings
+    return uniques.take(inverse).reshape(codes.shape)
+
+
+class CompactStringBlock(ObjectBlock):
+    """
+    an object block holding only text strings (or only bytes strings) and
+    missing values, kept as codes into the unique strings of the block, which
+    are stored contiguously (text as utf-8) in a single buffer, together with
+    a packed validity bitmap of the codes (missing values come back as NaN)
+
+    To the outside the block is the object block (same dtype, fill_value
+    and values); taking, slicing, copying and merging blocks, and the
+    operations that do not modify the values work on the codes. Accessing
+    ``values`` decodes the block to the object values for good, so that
+    they can be modified in-place.
+    """
+    __slots__ = ['_codes', '_mask', '_dense', '_buffer', '_offsets',
+                 '_text']
+
+    def __init__(self, values, placement, ndim=None, fastpath=False,
+                 valid=None, mask=None, buffer=None, offsets=None,
+                 text=True):
+        """
+        values are either the object values, or the codes together with
+        their validity as a boolean array (valid) or as the packed bitmap
+        (mask), the buffer and offsets of the unique strings and whether
+        they are text
+        """
+        self._codes = self._mask = self._dense = None
+        self._buffer = self._offsets = None
+        self._text = text
+        if valid is None and mask is None:
+            super(CompactStringBlock, self).__init__(values,
+                                                     placement=placement,
+                                                     ndim=ndim,
+                                                     fastpath=fastpath)
+            return
+
+        if ndim is None:
+            ndim = values.ndim
+        elif values.ndim != ndim:
+            raise ValueError('Wrong number of dimensions')
+        if mask is None:
+            if valid.shape != values.shape:
+                raise ValueError('values and valid must have the same shape')
+            mask = np.packbits(valid, axis=-1)
+        self.ndim = ndim
+
+        self.mgr_locs = placement
+        self._codes = values
+        self._mask = mask
+        self._buffer = buffer
+        self._offsets = offsets
+        self._text = text
+        self._ref = None
+
+        if len(self.mgr_locs) != len(values):
+            raise ValueError('Wrong number of items passed %d,'
+                             ' placement implies %d' % (
+                                 len(values), len(self.mgr_locs)))
+
+    @classmethod
+    def from_block(cls, block):
+        """
+        a compact block holding the values of an object block, or None if
+        they are not all strings
+        """
+        encoded = _encode_strings(block.values)
+        if encoded is None:
+            return None
+        codes, valid, buffer, offsets, text = encoded
+        return cls(codes, placement=block.mgr_locs, ndim=block.ndim,
+                   valid=valid, buffer=buffer, offsets=offsets, text=text)
+
+    def _make_compact(self, values, placement, valid=None, mask=None):
+        """ a compact block holding the codes, sharing my strings """
+        # the buffer is never modified, so that it can be shared
+        return self.__class__(values, placement=placement, ndim=self.ndim,
+                              valid=valid, mask=mask, buffer=self._buffer,
+                              offsets=self._offsets, text=self._text)
+
+    @property
+    def _is_compact(self):
+        return self._codes is not None
+
+    def _valid(self, item=None):
+        """ the unpacked validity bitmap (of item) """
+        mask = self._mask if item is None else self._mask[item]
+        return np.unpackbits(mask, axis=-1)[..., :self._codes.shape[-1]] \
+                 .view(np.bool_)
+
+    def _to_dense(self, values, valid):
+        """ decode (a selection of) the codes """
+        values = _decode_strings(values, self._buffer, self._offsets,
+                                 self._text)
+        if values.ndim == 0:
+            return values[()] if valid else np.nan
+        values[~valid] = np.nan
+        return values
+
+    def _dense_block(self):
+        """ a decoded copy of myself """
+        return ObjectBlock(self.get_values(), ndim=self.ndim,
+                           placement=self.mgr_locs)
+
+    def _delegate(self, name, *args, **kwargs):
+        """
+        run a method that does not modify my values on a decoded copy, so
+        that I stay compact
+        """
+        if not self._is_compact or kwargs.get('inplace', False):
+            return getattr(super(CompactStringBlock, self), name)(*args,
+                                                                  **kwargs)
+        return getattr(self._dense_block(), name)(*args, **kwargs)
+
+    def _clear_compact(self):
+        self._codes = self._mask = None
+        self._buffer = self._offsets = None
+
+    def _make_dense(self):
+        """ switch to holding the decoded values """
+        if self._is_compact:
+            self._dense = self._to_dense(self._codes, self._valid())
+            self._clear_compact()
+
+    @property
+    def values(self):
+        self._make_dense()
+        return self._dense
+
+    @values.setter
+    def values(self, values):
+        self._clear_compact()
+        self._dense = values
+
+    @property
+    def shape(self):
+        if self._is_compact:
+            return self._codes.shape
+        return self._dense.shape
+
+    @property
+    def dtype(self):
+        if self._is_compact:
+            return np.dtype(np.object_)
+        return self._dense.dtype
+
+    @property
+    def itemsize(self):
+        return self.dtype.itemsize
+
+    @property
+    def is_view(self):
+        if self._is_compact:
+            return False
+        return super(CompactStringBlock, self).is_view
+
+    @property
+    def is_bool(self):
+        if self._is_compact:
+            return False
+        return super(CompactStringBlock, self).is_bool
+
+    @property
+    def _consolidate_key(self):
+        if self._is_compact:
+            # text and bytes strings are not merged
+            return (self._can_consolidate,
+                    'compact_text' if self._text else 'compact_bytes')
+        return super(CompactStringBlock, self)._consolidate_key
+
+    def _merge_compact(self, blocks, new_mgr_locs, argsort):
+        """ merge compact blocks, concatenating their strings """
+        # shift the codes by the strings of the blocks before them
+        buffers, offsets, codes = [], [], []
+        n_bytes = n_uniques = 0
+        for b in blocks:
+            buffers.append(b._buffer)
+            offsets.append(b._offsets[:-1] + n_bytes)
+            codes.append(b._codes.astype(np.int64) + n_uniques)
+            n_bytes += len(b._buffer)
+            n_uniques += len(b._offsets) - 1
+        offsets.append([n_bytes])
+
+        new_values = np.vstack(codes)[argsort]
+        if n_uniques < 2 ** 31:
+            new_values = new_values.astype(np.int32)
+        new_valid = np.vstack([b._valid() for b in blocks])[argsort]
+        return self.__class__(new_values, placement=new_mgr_locs[argsort],
+                              ndim=self.ndim, valid=new_valid,
+                              buffer=np.concatenate(buffers),
+                              offsets=np.concatenate(offsets),
+                              text=self._text)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getstate__(self):
+        return self.mgr_locs.indexer, self.get_values()
+
+    def __setstate__(self, state):
+        self._clear_compact()
+        super(CompactStringBlock, self).__setstate__(state)
+
+    def make_block_same_class(self, values, placement, copy=False,
+                              fastpath=True, **kwargs):
+        if copy:
+            values = values.copy()
+        return make_block(values, placement, klass=ObjectBlock,
+                          fastpath=fastpath, **kwargs)
+
+    def get_values(self, dtype=None):
+        if self._is_compact:
+            return self._to_dense(self._codes, self._valid())
+        return super(CompactStringBlock, self).get_values(dtype=dtype)
+
+    def iget(self, i):
+        if not self._is_compact:
+            return super(CompactStringBlock, self).iget(i)
+
+        if isinstance(i, tuple):
+            return self._to_dense(self._codes[i[0]][..., i[1]],
+                                  self._valid(i[0])[..., i[1]])
+
+        # return a view, so that a Series holding the item counts as a view
+        # on its frame and propagates any setting through its cacher
+        return self._to_dense(self._codes[i], self._valid(i))[...]
+
+    def _unshare(self):
+        if self._is_compact:
+            # items can only be set in-place through the decoded values
+            self._make_dense()
+            return True
+        return super(CompactStringBlock, self)._unshare()
+
+    def _slice(self, slicer):
+        if not self._is_compact:
+            return super(CompactStringBlock, self)._slice(slicer)
+        return self._to_dense(self._codes[slicer], self._valid()[slicer])
+
+    def getitem_block(self, slicer, new_mgr_locs=None):
+        if not self._is_compact:
+            return super(CompactStringBlock, self).getitem_block(
+                slicer, new_mgr_locs=new_mgr_locs)
+
+        if new_mgr_locs is None:
+            if isinstance(slicer, tuple):
+                axis0_slicer = slicer[0]
+            else:
+                axis0_slicer = slicer
+            new_mgr_locs = self.mgr_locs[axis0_slicer]
+
+        new_values = self._codes[slicer]
+        if new_values.ndim != self.ndim:
+            raise ValueError("Only same dim slicing is allowed")
+
+        return self._make_compact(new_values, new_mgr_locs,
+                                  valid=self._valid()[slicer])
+
+    def take_nd(self, indexer, axis, new_mgr_locs=None, fill_tuple=None):
+        if not self._is_compact or (fill_tuple is not None and
+                                    not isnull(fill_tuple[0])):
+            return self._delegate('take_nd', indexer, axis,
+                                  new_mgr_locs=new_mgr_locs,
+                                  fill_tuple=fill_tuple)
+
+        if new_mgr_locs is None:
+            if axis == 0:
+                slc = lib.indexer_as_slice(indexer)
+                if slc is not None:
+                    new_mgr_locs = self.mgr_locs[slc]
+                else:
+                    new_mgr_locs = self.mgr_locs[indexer]
+            else:
+                new_mgr_locs = self.mgr_locs
+
+        # -1 in indexer is missing
+        new_values = com.take_nd(self._codes, indexer, axis=axis,
+                                 fill_value=0)
+        new_valid = com.take_nd(self._valid(), indexer, axis=axis,
+                                fill_value=False)
+        return self._make_compact(new_values, new_mgr_locs, valid=new_valid)
+
+    def copy(self, deep=True):
+        if not self._is_compact:
+            return super(CompactStringBlock, self).copy(deep=deep)
+
+        values, mask = self._codes, self._mask
+        if deep:
+            values, mask = values.copy(), mask.copy()
+        return self._make_compact(values, self.mgr_locs, mask=mask)
+
+    def delete(self, loc):
+        if not self._is_compact:
+            return super(CompactStringBlock, self).delete(loc)
+
+        # the bitmap is packed along the last axis only
+        self._codes = np.delete(self._codes, loc, 0)
+        self._mask = np.delete(self._mask, loc, 0)
+        self.mgr_locs = self.mgr_locs.delete(loc)
+
+    def equals(self, other):
+        if self.dtype != other.dtype or self.shape != other.shape:
+            return False
+        return array_equivalent(self.get_values(), other.get_values())
+
+    def compact_strings(self, locs=None):
+        return self.copy()
+
+    def optimize_memory(self, **kwargs):
+        return self.copy()
+
+    def memory_usage(self, deep=False):
+        if self._is_compact:
+            return self._spread_nbytes(self._codes.nbytes + self._mask.nbytes +
+                                       self._buffer.nbytes +
+                                       self._offsets.nbytes)
+        return super(CompactStringBlock, self).memory_usage(deep=deep)
+
+    def fillna(self, *args, **kwargs):
+        return self._delegate('fillna', *args, **kwargs)
+
+    def replace(self, *args, **kwargs):
+        return self._delegate('replace', *args, **kwargs)
+
+    def interpolate(self, *args, **kwargs):
+        return self._delegate('interpolate', *args, **kwargs)
+
+    def _astype(self, *args, **kwargs):
+        return self._delegate('_astype', *args, **kwargs)
+
+    def shift(self, *args, **kwargs):
+        return self._delegate('shift', *args, **kwargs)
+
+    def diff(self, *args, **kwargs):
+        return self._delegate('diff', *args, **kwargs)
+
+    def eval(self, *args, **kwargs):
+        return self._delegate('eval', *args, **kwargs)
+
+    def where(self, *args, **kwargs):
+        return self._delegate('where', *args, **kwargs)
+
+    def to_native_types(self, slicer=None, **kwargs):
+        if not self._is_compact:
+            return super(CompactStringBlock, self).to_native_types(
+                slicer=slicer, **kwargs)
+        # only decode the chunk that is asked for
+        if slicer is not None:
+            values = self._slice((slice(None), slicer))
+        else:
+            values = self.get_values()
+        dense = ObjectBlock(values, ndim=self.ndim, placement=self.mgr_locs)
+        return dense.to_native_types(**kwargs)
+
+
 class CategoricalBlock(NonConsolidatableMixIn, ObjectBlock):
     __slots__ = ()
     is_categorical = True
@@ -1662,6 +2289,18 @@ class CategoricalBlock(NonConsolidatableMixIn, ObjectBlock):
     def to_dense(self):
         return self.values.to_dense().view()
 
+    def compact_strings(self, locs=None):
+        """ the categories are held once already """
+        return self.copy()
+
+    def optimize_memory(self, **kwargs):
+        return self.copy()
+
+    def memory_usage(self, deep=False):
+        nbytes = self.values.nbytes + com._object_nbytes(
+            self.values.categories.values, deep)
+        return self._spread_nbytes(nbytes)
+
     @property
     def shape(self):
         return (len(self.mgr_locs), len(self.values))
@@ -1843,6 +2482,8 @@ class DatetimeBlock(Block):
                inplace=False, downcast=None):
 
         # straight putmask here
+        if inplace:
+            self._unshare()
         values = self.values if inplace else self.values.copy()
         mask = isnull(self.values)
         value = self._try_fill(value)
@@ -1896,6 +2537,7 @@ class DatetimeBlock(Block):
             # Workaround for numpy 1.6 bug
             values = tslib.cast_to_nanoseconds(values)
 
+        self._unshare()
         self.values[locs] = values
 
     def get_values(self, dtype=None):
@@ -2498,6 +3140,28 @@ class BlockManager(PandasObject):
     def convert(self, **kwargs):
         return self.apply('convert', **kwargs)
 
+    def compact_strings(self, items=None):
+        # not passed as apply's filter, which would not copy the blocks
+        # outside of it
+        locs = None
+        if items is not None:
+            indexer = self.items.get_indexer_for(items)
+            mask = indexer == -1
+            if mask.any():
+                raise KeyError('%s not in index' % items[mask])
+            locs = set(indexer)
+        return self.apply('compact_strings', locs=locs)
+
+    def optimize_memory(self, **kwargs):
+        return self.apply('optimize_memory', **kwargs)
+
+    def memory_usage(self, deep=False):
+        """ the bytes held by each of the items (see Block.memory_usage) """
+        result = np.zeros(len(self.items), dtype=np.int64)
+        for b in self.blocks:
+            result[b.mgr_locs.indexer] = b.memory_usage(deep=deep)
+        return result
+
     def replace(self, **kwargs):
         return self.apply('replace', **kwargs)
 
@@ -2595,6 +3259,20 @@ class BlockManager(PandasObject):
 
         return False
 
+    def _unshare(self):
+        """
+        make sure none of my blocks holds values that are shared
+        copy-on-write, i.e. that writing to the values in-place is safe
+
+        Returns
+        -------
+        boolean, whether any values were copied
+        """
+        copied = False
+        for block in self.blocks:
+            copied = block._unshare() or copied
+        return copied
+
     def get_bool_data(self, copy=False):
         """
         Parameters
@@ -3098,9 +3776,50 @@ class BlockManager(PandasObject):
 
         self._known_consolidated = False
 
-        if len(self.blocks) > 100:
+        # consolidating copies all of the data, so only do it once the number
+        # of blocks has grown with the number of items; inserting items one
+        # at a time then costs amortized O(1) copies per item
+        if len(self.blocks) > max(100, len(self.items) // 2):
             self._consolidate_inplace()
 
+    def extend(self, items, values, allow_duplicates=False):
+        """
+        Append several items at the end at once, items of the same dtype
+        going into a single new block
+
+        Parameters
+        ----------
+        items : array_like
+        values : list of array_like, one per item
+        allow_duplicates: bool
+            If False, trying to append non-unique items will raise
+
+        """
+        items = _ensure_index(items)
+        if len(items) != len(values):
+            raise ValueError('Wrong number of items passed %d, '
+                             'expected %d' % (len(values), len(items)))
+
+        if not allow_duplicates:
+            existing = self.items.intersection(items)
+            if len(existing) or not items.is_unique:
+                dups = existing if len(existing) else items.get_duplicates()
+                raise ValueError('cannot insert %s, already exists' % dups[0])
+
+        if not len(items):
+            return
+
+        offset = len(self.items)
+        blocks = form_blocks(values, items, [items] + self.axes[1:])
+        for blk in blocks:
+            blk.mgr_locs = blk.mgr_locs.add(offset)
+
+        self.axes[0] = self.items.append(items)
+        self.blocks += tuple(blocks)
+        self._shape = None
+        self._known_consolidated = False
+        self._rebuild_blknos_and_blklocs()
+
     def reindex_axis(self, new_index, axis, method=None, limit=None,
                      fill_value=None, copy=True):
         """
@@ -3432,6 +4151,9 @@ class SingleBlockManager(BlockManager):
         kwargs['by_item'] = False
         return self.apply('convert', **kwargs)
 
+    def memory_usage(self, deep=False):
+        return self._block.memory_usage(deep=deep)
+
     @property
     def dtype(self):
         return self._values.dtype
@@ -3819,9 +4541,13 @@ def _merge_blocks(blocks, dtype=None, _can_consolidate=True):
         # FIXME: optimization potential in case all mgrs contain slices and
         # combination of those slices is a slice, too.
         new_mgr_locs = np.concatenate([b.mgr_locs.as_array for b in blocks])
-        new_values = _vstack([b.values for b in blocks], dtype)
-
         argsort = np.argsort(new_mgr_locs)
+
+        if isinstance(blocks[0], CompactStringBlock) and blocks[0]._is_compact:
+            # blocks with the same _consolidate_key are all compact
+            return blocks[0]._merge_compact(blocks, new_mgr_locs, argsort)
+
+        new_values = _vstack([b.values for b in blocks], dtype)
         new_values = new_values[argsort]
         new_mgr_locs = new_mgr_locs[argsort]
 
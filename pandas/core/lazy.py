@@ -0,0 +1,692 @@
+"""
+Deferred evaluation of chains of DataFrame operations.
+
+A LazyFrame (see DataFrame.lazy) records filters, projections, column
+assignments, groupby aggregations and merges as a plan instead of executing
+them. On collect() the plan is optimized -- filters are fused and pushed down
+below assignments and projections, columns that are never used are pruned as
+early as possible -- and then executed, elementwise expressions being
+evaluated in a single numexpr pass where possible.
+"""
+import operator
+
+import numpy as np
+
+from pandas import compat
+from pandas.compat import zip
+import pandas.core.common as com
+import pandas.computation.expressions as expressions
+
+
+#----------------------------------------------------------------------
+# Expressions
+
+# operators that numexpr can evaluate
+_numexpr_ops = frozenset(['+', '-', '*', '/', '**', '<', '<=', '>', '>=',
+                          '==', '!=', '&', '|', '~'])
+
+
+def _binop(op, op_str, reverse=False):
+    def f(self, other):
+        other = _as_expr(other)
+        if reverse:
+            return BinOp(op, op_str, other, self)
+        return BinOp(op, op_str, self, other)
+    return f
+
+
+def _as_expr(value):
+    if isinstance(value, Expr):
+        return value
+    return Literal(value)
+
+
+class Expr(object):
+    """
+    An elementwise expression over the columns of a LazyFrame, built from
+    column references with the arithmetic, comparison and logical operators.
+    """
+
+    def columns(self):
+        """ the set of column names referenced by the expression """
+        raise NotImplementedError
+
+    def _evaluate(self, frame):
+        """ evaluate node by node with the pandas operators """
+        raise NotImplementedError
+
+    def _numexpr(self, frame, local_dict):
+        """
+        return the expression in numexpr syntax, adding its operands to
+        local_dict, or None if numexpr cannot evaluate it
+        """
+        return None
+
+    def isin(self, values):
+        return Func('isin', self, values)
+
+    def isnull(self):
+        return Func('isnull', self)
+
+    def notnull(self):
+        return Func('notnull', self)
+
+    def __nonzero__(self):
+        raise ValueError("The truth value of an expression is ambiguous, "
+                         "use the operators &, | and ~ instead of and, or "
+                         "and not")
+
+    __bool__ = __nonzero__
+
+    __add__ = _binop(operator.add, '+')
+    __radd__ = _binop(operator.add, '+', reverse=True)
+    __sub__ = _binop(operator.sub, '-')
+    __rsub__ = _binop(operator.sub, '-', reverse=True)
+    __mul__ = _binop(operator.mul, '*')
+    __rmul__ = _binop(operator.mul, '*', reverse=True)
+    __truediv__ = _binop(operator.truediv, '/')
+    __rtruediv__ = _binop(operator.truediv, '/', reverse=True)
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+    __floordiv__ = _binop(operator.floordiv, '//')
+    __rfloordiv__ = _binop(operator.floordiv, '//', reverse=True)
+    __pow__ = _binop(operator.pow, '**')
+    __rpow__ = _binop(operator.pow, '**', reverse=True)
+    __mod__ = _binop(operator.mod, '%')
+    __rmod__ = _binop(operator.mod, '%', reverse=True)
+    __lt__ = _binop(operator.lt, '<')
+    __le__ = _binop(operator.le, '<=')
+    __gt__ = _binop(operator.gt, '>')
+    __ge__ = _binop(operator.ge, '>=')
+    __eq__ = _binop(operator.eq, '==')
+    __ne__ = _binop(operator.ne, '!=')
+    __and__ = _binop(operator.and_, '&')
+    __rand__ = _binop(operator.and_, '&', reverse=True)
+    __or__ = _binop(operator.or_, '|')
+    __ror__ = _binop(operator.or_, '|', reverse=True)
+    __hash__ = object.__hash__
+
+    def __invert__(self):
+        return UnaryOp(operator.invert, '~', self)
+
+    def __neg__(self):
+        return UnaryOp(operator.neg, '-', self)
+
+
+class Column(Expr):
+
+    def __init__(self, name):
+        self.name = name
+
+    def columns(self):
+        return set([self.name])
+
+    def _evaluate(self, frame):
+        return frame[self.name]
+
+    def _numexpr(self, frame, local_dict):
+        values = frame[self.name].values
+        if values.dtype.name not in expressions._ALLOWED_DTYPES['evaluate']:
+            return None
+        key = '_v%d' % len(local_dict)
+        local_dict[key] = values
+        return key
+
+    def __repr__(self):
+        return com.pprint_thing(self.name)
+
+
+class Literal(Expr):
+
+    def __init__(self, value):
+        self.value = value
+
+    def columns(self):
+        return set()
+
+    def _evaluate(self, frame):
+        return self.value
+
+    def _numexpr(self, frame, local_dict):
+        if not com.is_number(self.value):
+            return None
+        key = '_v%d' % len(local_dict)
+        local_dict[key] = self.value
+        return key
+
+    def __repr__(self):
+        return com.pprint_thing(self.value)
+
+
+class BinOp(Expr):
+
+    def __init__(self, op, op_str, left, right):
+        self.op = op
+        self.op_str = op_str
+        self.left = left
+        self.right = right
+
+    def columns(self):
+        return self.left.columns() | self.right.columns()
+
+    def _evaluate(self, frame):
+        return self.op(self.left._evaluate(frame),
+                       self.right._evaluate(frame))
+
+    def _numexpr(self, frame, local_dict):
+        if self.op_str not in _numexpr_ops:
+            return None
+        left = self.left._numexpr(frame, local_dict)
+        right = self.right._numexpr(frame, local_dict)
+        if left is None or right is None:
+            return None
+        return '(%s %s %s)' % (left, self.op_str, right)
+
+    def __repr__(self):
+        return '(%r %s %r)' % (self.left, self.op_str, self.right)
+
+
+class UnaryOp(Expr):
+
+    def __init__(self, op, op_str, operand):
+        self.op = op
+        self.op_str = op_str
+        self.operand = operand
+
+    def columns(self):
+        return self.operand.columns()
+
+    def _evaluate(self, frame):
+        return self.op(self.operand._evaluate(frame))
+
+    def _numexpr(self, frame, local_dict):
+        operand = self.operand._numexpr(frame, local_dict)
+        if operand is None:
+            return None
+        return '(%s%s)' % (self.op_str, operand)
+
+    def __repr__(self):
+        return '(%s%r)' % (self.op_str, self.operand)
+
+
+class Func(Expr):
+    """ a call of an elementwise Series method, e.g. isin """
+
+    def __init__(self, name, operand, *args):
+        self.name = name
+        self.operand = operand
+        self.args = args
+
+    def columns(self):
+        return self.operand.columns()
+
+    def _evaluate(self, frame):
+        return getattr(self.operand._evaluate(frame), self.name)(*self.args)
+
+    def __repr__(self):
+        return '%r.%s(%s)' % (self.operand, self.name,
+                              ', '.join(com.pprint_thing(a)
+                                        for a in self.args))
+
+
+def _evaluate(expr, frame):
+    """
+    the values of the expression on frame, evaluated in a single numexpr
+    pass when every operand and operator allows it
+    """
+    fallback = lambda: com._values_from_object(expr._evaluate(frame))
+
+    local_dict = {}
+    ne_expr = expr._numexpr(frame, local_dict)
+    if ne_expr is None:
+        return fallback()
+    return expressions.evaluate_fused(ne_expr, local_dict, fallback)
+
+
+#----------------------------------------------------------------------
+# Plan nodes
+#
+# each node returns (result, owned) from _execute, owned meaning that the
+# result is not shared with the caller's data and may be modified in place
+
+class _Node(object):
+
+    children = ()
+
+    def columns(self):
+        """ the output column names, or None if unknown before executing """
+        return None
+
+    def _child_required(self, required):
+        """
+        the columns required from each child to produce the required
+        columns (None meaning all of them)
+        """
+        return [None] * len(self.children)
+
+    def _with_children(self, children):
+        node = object.__new__(type(self))
+        node.__dict__.update(self.__dict__)
+        node.children = tuple(children)
+        return node
+
+    def _describe(self):
+        raise NotImplementedError
+
+    def _format(self, depth=0):
+        lines = ['  ' * depth + self._describe()]
+        for child in self.children:
+            lines.extend(child._format(depth + 1))
+        return lines
+
+
+class _Source(_Node):
+
+    def __init__(self, frame):
+        self.frame = frame
+
+    def columns(self):
+        return list(self.frame.columns)
+
+    def _execute(self, inputs):
+        return self.frame, False
+
+    def _describe(self):
+        return 'DataFrame(%d rows x %d columns)' % self.frame.shape
+
+
+class _Project(_Node):
+
+    def __init__(self, child, cols):
+        self.children = (child,)
+        self.cols = list(cols)
+
+    def columns(self):
+        return self.cols
+
+    def _child_required(self, required):
+        return [self.cols]
+
+    def _execute(self, inputs):
+        frame, owned = inputs[0]
+        if list(frame.columns) == self.cols:
+            return frame, owned
+        result = frame[self.cols]
+        result.is_copy = None
+        return result, True
+
+    def _describe(self):
+        return 'Project(%s)' % com.pprint_thing(self.cols)
+
+
+class _Filter(_Node):
+
+    def __init__(self, child, expr):
+        self.children = (child,)
+        self.expr = expr
+
+    def columns(self):
+        return self.children[0].columns()
+
+    def _child_required(self, required):
+        if required is None:
+            return [None]
+        return [set(required) | self.expr.columns()]
+
+    def _execute(self, inputs):
+        frame, owned = inputs[0]
+        mask = _evaluate(self.expr, frame)
+        indexer = np.asarray(mask, dtype=bool).nonzero()[0]
+        return frame.take(indexer, is_copy=False), True
+
+    def _describe(self):
+        return 'Filter(%r)' % self.expr
+
+
+class _Assign(_Node):
+
+    def __init__(self, child, items):
+        self.children = (child,)
+        self.items = list(items)
+
+    def names(self):
+        return set(k for k, _ in self.items)
+
+    def is_elementwise(self):
+        """ whether every assigned value is an expression or a scalar """
+        return all(isinstance(v, Expr) or np.isscalar(v)
+                   for _, v in self.items)
+
+    def columns(self):
+        cols = self.children[0].columns()
+        if cols is None:
+            return None
+        return cols + [k for k, _ in self.items if k not in cols]
+
+    def _child_required(self, required):
+        if any(callable(v) for _, v in self.items):
+            return [None]
+        if required is None:
+            return [None]
+        required = set(required) - self.names()
+        for _, v in self.items:
+            if isinstance(v, Expr):
+                required |= v.columns()
+        return [required]
+
+    def _execute(self, inputs):
+        frame, owned = inputs[0]
+
+        # do all calculations first, as DataFrame.assign does
+        results = []
+        for k, v in self.items:
+            if isinstance(v, Expr):
+                v = _evaluate(v, frame)
+            elif callable(v):
+                v = v(frame)
+            results.append((k, v))
+
+        if not owned:
+            # new columns only need a new BlockManager
+            deep = not self.names().isdisjoint(frame.columns)
+            frame = frame.copy(deep=deep)
+        for k, v in results:
+            frame[k] = v
+        return frame, True
+
+    def _describe(self):
+        return 'Assign(%s)' % ', '.join('%s=%s' % (com.pprint_thing(k),
+                                                   com.pprint_thing(v))
+                                        for k, v in self.items)
+
+
+class _GroupBy(_Node):
+
+    def __init__(self, child, by, kwargs, selection, method, args,
+                 method_kwargs):
+        self.children = (child,)
+        self.by = by
+        self.kwargs = kwargs
+        self.selection = selection
+        self.method = method
+        self.args = args
+        self.method_kwargs = method_kwargs
+
+    def _child_required(self, required):
+        keys = self.by if isinstance(self.by, list) else [self.by]
+        if (self.selection is None or
+                self.kwargs.get('level') is not None or
+                not all(isinstance(k, compat.string_types) for k in keys)):
+            return [None]
+        selection = self.selection
+        if not isinstance(selection, list):
+            selection = [selection]
+        return [set(keys) | set(selection)]
+
+    def _execute(self, inputs):
+        frame, owned = inputs[0]
+        grouped = frame.groupby(self.by, **self.kwargs)
+        if self.selection is not None:
+            grouped = grouped[self.selection]
+        return getattr(grouped, self.method)(*self.args,
+                                             **self.method_kwargs), True
+
+    def _describe(self):
+        selection = ''
+        if self.selection is not None:
+            selection = '[%s]' % com.pprint_thing(self.selection)
+        return 'GroupBy(%s)%s.%s()' % (com.pprint_thing(self.by), selection,
+                                       self.method)
+
+
+class _Merge(_Node):
+
+    def __init__(self, left, right, kwargs):
+        self.children = (left, right)
+        self.kwargs = kwargs
+
+    def _keys(self, side):
+        kwargs = self.kwargs
+        if kwargs.get(side + '_index'):
+            return []
+        keys = kwargs.get(side + '_on', kwargs.get('on'))
+        if keys is None:
+            left, right = [c.columns() for c in self.children]
+            return list(set(left) & set(right))
+        if not isinstance(keys, list):
+            keys = [keys]
+        if not all(isinstance(k, compat.string_types) for k in keys):
+            return None
+        return keys
+
+    def _child_required(self, required):
+        left, right = [c.columns() for c in self.children]
+        if required is None or left is None or right is None:
+            return [None, None]
+
+        left_keys, right_keys = self._keys('left'), self._keys('right')
+        if left_keys is None or right_keys is None:
+            return [None, None]
+
+        # overlapping columns are suffixed in the result
+        overlap = (set(left) & set(right)) - (set(left_keys) &
+                                               set(right_keys))
+        if overlap:
+            return [None, None]
+
+        required = set(required)
+        return [required | set(left_keys), required | set(right_keys)]
+
+    def _execute(self, inputs):
+        from pandas.tools.merge import merge
+        (left, _), (right, _) = inputs
+        return merge(left, right, **self.kwargs), True
+
+    def _describe(self):
+        return 'Merge(%s)' % ', '.join('%s=%s' % (k, com.pprint_thing(v))
+                                       for k, v in sorted(self.kwargs.items()))
+
+
+class _Method(_Node):
+    """ any other DataFrame method, executed as is """
+
+    def __init__(self, child, name, args, kwargs):
+        self.children = (child,)
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+
+    def _execute(self, inputs):
+        frame, owned = inputs[0]
+
+        # the result may be a view on the input
+        return getattr(frame, self.name)(*self.args, **self.kwargs), False
+
+    def _describe(self):
+        return '%s()' % self.name
+
+
+#----------------------------------------------------------------------
+# Optimization
+
+def _push_filters(node):
+    """ fuse consecutive filters and move them towards the source """
+    node = node._with_children([_push_filters(c) for c in node.children])
+    if not isinstance(node, _Filter):
+        return node
+
+    child = node.children[0]
+    if isinstance(child, _Filter):
+        return _Filter(child.children[0], child.expr & node.expr)
+    if isinstance(child, _Project):
+        return child._with_children(
+            [_push_filters(_Filter(child.children[0], node.expr))])
+    if (isinstance(child, _Assign) and child.is_elementwise() and
+            child.names().isdisjoint(node.expr.columns())):
+        return child._with_children(
+            [_push_filters(_Filter(child.children[0], node.expr))])
+    return node
+
+
+def _prune(node, required=None):
+    """
+    drop assignments that are never used and select only the required
+    columns from the sources
+    """
+    if isinstance(node, _Source):
+        if required is not None:
+            cols = [c for c in node.columns() if c in required]
+            if len(cols) < len(node.columns()):
+                return _Project(node, cols)
+        return node
+
+    if isinstance(node, _Assign) and required is not None:
+        items = [(k, v) for k, v in node.items if k in required]
+        if not items:
+            return _prune(node.children[0], required)
+        node = _Assign(node.children[0], items)
+
+    if isinstance(node, _Project):
+        child = node.children[0]
+        if isinstance(child, _Project):
+            return _prune(_Project(child.children[0], node.cols), required)
+        if isinstance(child, _Source):
+            return node
+
+    return node._with_children([_prune(c, r) for c, r in
+                                zip(node.children,
+                                    node._child_required(required))])
+
+
+def _optimize(node):
+    return _prune(_push_filters(node))
+
+
+def _execute(node):
+    return node._execute([_execute(c) for c in node.children])
+
+
+#----------------------------------------------------------------------
+# LazyFrame
+
+class LazyFrame(object):
+    """
+    A deferred DataFrame, see DataFrame.lazy.
+
+    Operations on a LazyFrame build up a plan that is only optimized and
+    executed by collect(). Columns are referenced as lf['a'] or lf.a, and
+    combine with the arithmetic, comparison and logical operators into
+    elementwise expressions, usable in filters (lf[lf.a > 0]) and
+    assignments (lf.assign(c=lf.a + lf.b)).
+    """
+
+    def __init__(self, data):
+        if not isinstance(data, _Node):
+            data = _Source(data)
+        self._plan = data
+
+    @property
+    def columns(self):
+        """ the column names, or None if not known before executing """
+        from pandas.core.index import Index
+        cols = self._plan.columns()
+        if cols is None:
+            return None
+        return Index(cols)
+
+    def __getitem__(self, key):
+        if isinstance(key, Expr):
+            return LazyFrame(_Filter(self._plan, key))
+        if com.is_list_like(key):
+            return LazyFrame(_Project(self._plan, list(key)))
+        return Column(key)
+
+    def __getattr__(self, name):
+        if not name.startswith('_'):
+            cols = self._plan.columns()
+            if cols is not None and name in cols:
+                return Column(name)
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (type(self).__name__, name))
+
+    def assign(self, **kwargs):
+        """
+        Add or replace columns with expressions, scalars or callables of the
+        DataFrame, as DataFrame.assign
+        """
+        return LazyFrame(_Assign(self._plan, sorted(kwargs.items())))
+
+    def groupby(self, by, **kwargs):
+        """
+        Group by columns, as DataFrame.groupby. The aggregation methods of the
+        returned object return LazyFrames.
+        """
+        return LazyGroupBy(self._plan, by, kwargs)
+
+    def merge(self, right, **kwargs):
+        """ Merge with a DataFrame or LazyFrame, as DataFrame.merge """
+        if not isinstance(right, LazyFrame):
+            right = LazyFrame(right)
+        return LazyFrame(_Merge(self._plan, right._plan, kwargs))
+
+    def optimize(self):
+        """ return a LazyFrame with the optimized plan """
+        return LazyFrame(_optimize(self._plan))
+
+    def explain(self, optimized=True):
+        """ return a description of the (optimized) plan """
+        plan = _optimize(self._plan) if optimized else self._plan
+        return '\n'.join(plan._format())
+
+    def collect(self):
+        """ optimize and execute the plan, returning the result """
+        result, owned = _execute(_optimize(self._plan))
+        return result
+
+    def __repr__(self):
+        return 'LazyFrame\n%s' % self.explain(optimized=False)
+
+
+def _method(name):
+    def f(self, *args, **kwargs):
+        return LazyFrame(_Method(self._plan, name, args, kwargs))
+    f.__name__ = name
+    f.__doc__ = """ deferred DataFrame.%s """ % name
+    return f
+
+for _name in ['head', 'tail', 'sort', 'sort_index', 'dropna', 'fillna',
+              'rename', 'drop', 'drop_duplicates', 'reset_index',
+              'set_index', 'astype']:
+    setattr(LazyFrame, _name, _method(_name))
+
+
+class LazyGroupBy(object):
+    """ a deferred groupby, see LazyFrame.groupby """
+
+    def __init__(self, plan, by, kwargs, selection=None):
+        self._plan = plan
+        self._by = by
+        self._kwargs = kwargs
+        self._selection = selection
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            key = list(key)
+        return LazyGroupBy(self._plan, self._by, self._kwargs, key)
+
+    def _apply(self, method, args, kwargs):
+        return LazyFrame(_GroupBy(self._plan, self._by, self._kwargs,
+                                  self._selection, method, args, kwargs))
+
+
+def _groupby_method(name):
+    def f(self, *args, **kwargs):
+        return self._apply(name, args, kwargs)
+    f.__name__ = name
+    f.__doc__ = """ deferred GroupBy.%s """ % name
+    return f
+
+for _name in ['agg', 'aggregate', 'apply', 'transform', 'filter', 'sum',
+              'mean', 'median', 'min', 'max', 'count', 'size', 'first',
+              'last', 'std', 'var', 'prod', 'nunique']:
+    setattr(LazyGroupBy, _name, _groupby_method(_name))
@@ -40,6 +40,7 @@ from pandas.compat import zip, u, OrderedDict, StringIO
 
 import pandas.core.ops as ops
 from pandas.core.algorithms import select_n
+import pandas.core.algorithms as algorithms
 
 import pandas.core.common as com
 import pandas.core.datetools as datetools
@@ -313,6 +314,39 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         """ same as values (but handles sparseness conversions); is a view """
         return self._data.get_values()
 
+    def memory_usage(self, index=False, deep=False):
+        """
+        Memory usage of the Series
+
+        .. versionadded:: 0.16.1
+
+        Parameters
+        ----------
+        index : bool, default False
+            Whether to include the memory usage of the index (with the
+            hash table of its engine and its cached attributes if deep)
+        deep : boolean or int, default False
+            If True, also count the memory consumed by the objects that object
+            values refer to. If an integer, estimate it from a sample of (at
+            most) that many values.
+
+        Returns
+        -------
+        bytes used : int
+
+        See Also
+        --------
+        DataFrame.memory_usage
+        """
+        result = self._data.memory_usage(deep=deep).sum()
+        if index:
+            # the engine and cache of the index are only counted when deep
+            if deep:
+                result += self.index.memory_usage(deep=deep)
+            else:
+                result += self.index.nbytes
+        return result
+
 
     # ops
     def ravel(self, order='C'):
@@ -678,6 +712,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
 
         # do the setitem
         cacher_needs_updating = self._check_is_chained_assignment_possible()
+        self._unshare()
         setitem(key, value)
         if cacher_needs_updating:
             self._maybe_update_cacher()
@@ -820,6 +855,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             If label is contained, will be reference to calling Series,
             otherwise a new object
         """
+        self._unshare()
         try:
             if takeable:
                 self.values[label] = value
@@ -2224,19 +2260,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
                             " to Series.isin(), you passed a "
                             "{0!r}".format(type(values).__name__))
 
-        # may need i8 conversion for proper membership testing
-        comps = _values_from_object(self)
-        if com.is_datetime64_dtype(self):
-            from pandas.tseries.tools import to_datetime
-            values = Series(to_datetime(values)).values.view('i8')
-            comps = comps.view('i8')
-        elif com.is_timedelta64_dtype(self):
-            from pandas.tseries.timedeltas import to_timedelta
-            values = Series(to_timedelta(values)).values.view('i8')
-            comps = comps.view('i8')
-
-        value_set = set(values)
-        result = lib.ismember(comps, value_set)
+        result = algorithms.isin(_values_from_object(self), values)
         return self._constructor(result, index=self.index).__finalize__(self)
 
     def between(self, left, right, inclusive=True):
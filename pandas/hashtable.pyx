@@ -146,6 +146,11 @@ cdef class HashTable:
     pass
 
 
+cdef inline Py_ssize_t _flags_size(khint_t n_buckets):
+    # khash keeps two flag bits per bucket in uint32 words
+    return (n_buckets >> 4 if n_buckets >= 16 else 1) * sizeof(uint32_t)
+
+
 cdef class StringHashTable(HashTable):
     cdef kh_str_t *table
 
@@ -157,6 +162,11 @@ cdef class StringHashTable(HashTable):
     def __dealloc__(self):
         kh_destroy_str(self.table)
 
+    def sizeof(self):
+        """ return the size of my table in bytes (keys, values and flags) """
+        return (self.table.n_buckets * (sizeof(char *) + sizeof(size_t)) +
+                _flags_size(self.table.n_buckets))
+
     cdef inline int check_type(self, object val):
         return util.is_string_object(val)
 
@@ -371,6 +381,11 @@ cdef class Int64HashTable: #(HashTable):
     def __dealloc__(self):
         kh_destroy_int64(self.table)
 
+    def sizeof(self):
+        """ return the size of my table in bytes (keys, values and flags) """
+        return (self.table.n_buckets * (sizeof(int64_t) + sizeof(size_t)) +
+                _flags_size(self.table.n_buckets))
+
     def __contains__(self, object key):
         cdef khiter_t k
         k = kh_get_int64(self.table, key)
@@ -547,6 +562,11 @@ cdef class Float64HashTable(HashTable):
     def __len__(self):
         return self.table.size
 
+    def sizeof(self):
+        """ return the size of my table in bytes (keys, values and flags) """
+        return (self.table.n_buckets * (sizeof(float64_t) + sizeof(size_t)) +
+                _flags_size(self.table.n_buckets))
+
     cpdef get_item(self, float64_t val):
         cdef khiter_t k
         k = kh_get_float64(self.table, val)
@@ -682,6 +702,11 @@ cdef class PyObjectHashTable(HashTable):
     def __len__(self):
         return self.table.size
 
+    def sizeof(self):
+        """ return the size of my table in bytes (keys, values and flags) """
+        return (self.table.n_buckets * (sizeof(PyObject *) + sizeof(size_t)) +
+                _flags_size(self.table.n_buckets))
+
     def __contains__(self, object key):
         cdef khiter_t k
         hash(key)
@@ -1117,3 +1142,101 @@ def unique_label_indices(ndarray[int64_t, ndim=1] labels):
     arr = arr[labels[arr].argsort()]
 
     return arr[1:] if arr.size != 0 and labels[arr[0]] == -1 else arr
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def ismember_int64(ndarray[int64_t] arr, ndarray[int64_t] values):
+    """
+    Return boolean of whether each element of arr is in values, on an
+    element by element basis
+    """
+    cdef:
+        int ret = 0
+        Py_ssize_t i, n = len(arr), m = len(values)
+        kh_int64_t * table = kh_init_int64()
+        ndarray[uint8_t, ndim=1, cast=True] result = np.empty(n, dtype='bool')
+
+    kh_resize_int64(table, min(m, _SIZE_HINT_LIMIT))
+
+    for i in range(m):
+        kh_put_int64(table, values[i], &ret)
+
+    for i in range(n):
+        result[i] = kh_get_int64(table, arr[i]) != table.n_buckets
+
+    kh_destroy_int64(table)
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def ismember_float64(ndarray[float64_t] arr, ndarray[float64_t] values):
+    """
+    Return boolean of whether each element of arr is in values, on an
+    element by element basis. NaN is in values if values contains a NaN.
+    """
+    cdef:
+        int ret = 0
+        bint hasnans = 0
+        Py_ssize_t i, n = len(arr), m = len(values)
+        float64_t val
+        kh_float64_t * table = kh_init_float64()
+        ndarray[uint8_t, ndim=1, cast=True] result = np.empty(n, dtype='bool')
+
+    kh_resize_float64(table, min(m, _SIZE_HINT_LIMIT))
+
+    # NaN is not equal to itself and 0.0 / -0.0 hash differently, so
+    # these are special cased
+    for i in range(m):
+        val = values[i]
+        if val != val:
+            hasnans = 1
+        elif val == 0:
+            kh_put_float64(table, 0., &ret)
+        else:
+            kh_put_float64(table, val, &ret)
+
+    for i in range(n):
+        val = arr[i]
+        if val != val:
+            result[i] = hasnans
+        elif val == 0:
+            result[i] = kh_get_float64(table, 0.) != table.n_buckets
+        else:
+            result[i] = kh_get_float64(table, val) != table.n_buckets
+
+    kh_destroy_float64(table)
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def ismember_object(ndarray[object] arr, ndarray[object] values):
+    """
+    Return boolean of whether each element of arr is in values, on an
+    element by element basis, with the semantics of a Python set
+    """
+    cdef:
+        int ret = 0
+        Py_ssize_t i, n = len(arr), m = len(values)
+        object val
+        kh_pymap_t * table = kh_init_pymap()
+        ndarray[uint8_t, ndim=1, cast=True] result = np.empty(n, dtype='bool')
+
+    kh_resize_pymap(table, min(m, _SIZE_HINT_LIMIT))
+
+    try:
+        for i in range(m):
+            val = values[i]
+            hash(val)
+            kh_put_pymap(table, <PyObject*> val, &ret)
+
+        for i in range(n):
+            val = arr[i]
+            hash(val)
+            result[i] = kh_get_pymap(table, <PyObject*> val) != table.n_buckets
+    finally:
+        kh_destroy_pymap(table)
+
+    return result
@@ -11,5 +11,6 @@ from pandas.io.html import read_html
 from pandas.io.sql import read_sql, read_sql_table, read_sql_query
 from pandas.io.stata import read_stata
 from pandas.io.pickle import read_pickle, to_pickle
-from pandas.io.packers import read_msgpack, to_msgpack
+from pandas.io.packers import (read_msgpack, to_msgpack,
+                               from_shared_memory)
 from pandas.io.gbq import read_gbq
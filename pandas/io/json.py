@@ -6,10 +6,12 @@ from collections import defaultdict
 import numpy as np
 
 import pandas.json as _json
+import pandas.lib as lib
 from pandas.tslib import iNaT
-from pandas.compat import long, u
+from pandas.compat import long, u, StringIO
 from pandas import compat, isnull
 from pandas import Series, DataFrame, to_datetime
+from pandas.core.frame import _convert_object_array
 from pandas.io.common import get_filepath_or_buffer
 import pandas.core.common as com
 
@@ -103,7 +105,8 @@ class FrameWriter(Writer):
 
 def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
               convert_axes=True, convert_dates=True, keep_default_dates=True,
-              numpy=False, precise_float=False, date_unit=None):
+              numpy=False, precise_float=False, date_unit=None, lines=False,
+              chunksize=None, compression=None):
     """
     Convert a JSON string to pandas object
 
@@ -165,13 +168,66 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
         is to try and detect the correct precision, but if this is not desired
         then pass one of 's', 'ms', 'us' or 'ns' to force parsing only seconds,
         milliseconds, microseconds or nanoseconds respectively.
+    lines : boolean, default False
+        Read the file as line-delimited JSON: one JSON object per line, each
+        being a row.
+
+        .. versionadded:: 0.16.1
+    chunksize : int, default None
+        With ``lines=True``, return a JsonReader object for iteration over
+        DataFrames of `chunksize` lines; the whole file is never held in
+        memory.
+
+        .. versionadded:: 0.16.1
+    compression : {'gzip', 'bz2', None}, default None
+        For on-the-fly decompression of an on-disk file.
+
+        .. versionadded:: 0.16.1
 
     Returns
     -------
-    result : Series or DataFrame
+    result : Series or DataFrame, or JsonReader if chunksize is given
     """
 
+    if chunksize is not None and not lines:
+        raise ValueError("chunksize can only be passed if lines=True")
+
     filepath_or_buffer, _ = get_filepath_or_buffer(path_or_buf)
+    fh, should_close = _get_json_handle(filepath_or_buffer, compression)
+
+    kwds = dict(orient=orient, typ=typ, dtype=dtype,
+                convert_axes=convert_axes, convert_dates=convert_dates,
+                keep_default_dates=keep_default_dates, numpy=numpy,
+                precise_float=precise_float, date_unit=date_unit)
+
+    if lines:
+        reader = JsonReader(fh, chunksize=chunksize,
+                            should_close=should_close, **kwds)
+        if chunksize is not None:
+            return reader
+        try:
+            return reader.read()
+        finally:
+            reader.close()
+
+    if hasattr(fh, 'read'):
+        try:
+            json = fh.read()
+        finally:
+            if should_close:
+                fh.close()
+    else:
+        json = fh
+
+    return _parse_json(json, **kwds)
+
+
+def _get_json_handle(filepath_or_buffer, compression=None):
+    """
+    Return a file handle for a path (decompressing it with compression), the
+    buffer or JSON string itself otherwise, and whether the handle must be
+    closed after reading
+    """
     if isinstance(filepath_or_buffer, compat.string_types):
         try:
             exists = os.path.exists(filepath_or_buffer)
@@ -182,14 +238,16 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
             exists = False
 
         if exists:
-            with open(filepath_or_buffer, 'r') as fh:
-                json = fh.read()
-        else:
-            json = filepath_or_buffer
-    elif hasattr(filepath_or_buffer, 'read'):
-        json = filepath_or_buffer.read()
-    else:
-        json = filepath_or_buffer
+            if compression is not None:
+                return com._get_handle(filepath_or_buffer, 'r',
+                                       compression=compression), True
+            return open(filepath_or_buffer, 'r'), True
+    return filepath_or_buffer, False
+
+
+def _parse_json(json, orient=None, typ='frame', dtype=True, convert_axes=True,
+                convert_dates=True, keep_default_dates=True, numpy=False,
+                precise_float=False, date_unit=None):
 
     obj = None
     if typ == 'frame':
@@ -207,6 +265,71 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
     return obj
 
 
+class JsonReader(object):
+    """
+    Read line-delimited JSON, one record per line, from a file handle or
+    string, returning an object of chunksize records at a time when
+    iterated over
+    """
+
+    def __init__(self, f, chunksize=None, should_close=False, **kwds):
+        if kwds.get('orient') not in (None, 'records'):
+            raise ValueError("orient must be 'records' for line-delimited "
+                             "JSON")
+        if isinstance(f, compat.string_types):
+            f = StringIO(f)
+        self.f = f
+        self.chunksize = chunksize
+        self.should_close = should_close
+        self.kwds = kwds
+        self.nrows_seen = 0
+
+    def __iter__(self):
+        try:
+            if self.chunksize:
+                while True:
+                    yield self.read(self.chunksize)
+            else:
+                yield self.read()
+        except StopIteration:
+            pass
+        finally:
+            self.close()
+
+    def read(self, nrows=None):
+        """
+        Read the next nrows records (all of the remaining ones by default)
+        """
+        lines = []
+        for line in self.f:
+            if compat.PY3 and isinstance(line, bytes):
+                line = line.decode('utf-8')
+            line = line.strip()
+            if line:
+                lines.append(line)
+                if nrows is not None and len(lines) >= nrows:
+                    break
+
+        if not lines and nrows is not None:
+            raise StopIteration
+
+        # one call to the decoder for all of the lines
+        obj = _parse_json('[' + ','.join(lines) + ']', **self.kwds)
+        obj.index = np.arange(self.nrows_seen, self.nrows_seen + len(obj))
+        self.nrows_seen += len(obj)
+        return obj
+
+    def get_chunk(self, size=None):
+        if size is None:
+            size = self.chunksize
+        return self.read(nrows=size)
+
+    def close(self):
+        if self.should_close:
+            self.f.close()
+            self.should_close = False
+
+
 class Parser(object):
 
     _STAMP_UNITS = ('s', 'ms', 'us', 'ns')
@@ -478,9 +601,8 @@ class FrameParser(Parser):
         json = self.json
         orient = self.orient
 
-        if orient == "columns":
-            self.obj = DataFrame(
-                loads(json, precise_float=self.precise_float), dtype=None)
+        if orient == "columns" or orient == "records":
+            self.obj = self._decode_records(json)
         elif orient == "split":
             decoded = dict((str(k), v)
                            for k, v in compat.iteritems(loads(
@@ -495,6 +617,32 @@ class FrameParser(Parser):
             self.obj = DataFrame(
                 loads(json, precise_float=self.precise_float), dtype=None)
 
+    def _decode_records(self, json):
+        """
+        decode an array of records into the values of each key, without a
+        dict per record, and build the frame column by column
+        """
+        try:
+            decoded = loads(json, precise_float=self.precise_float,
+                            records=True)
+        except ValueError:
+            # not an array of objects
+            decoded = loads(json, precise_float=self.precise_float)
+
+        if not isinstance(decoded, tuple):
+            return DataFrame(decoded, dtype=None)
+
+        keys, columns, nrows = decoded
+        try:
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+        except TypeError:
+            order = range(len(keys))
+
+        arrays = [lib.maybe_convert_objects(lib.list_to_object_array(
+            columns[i])) for i in order]
+        return DataFrame._from_arrays(arrays, [keys[i] for i in order],
+                                      com._default_index(nrows))
+
     def _process_converter(self, f, filt=None):
         """ take a conversion function and possibly recreate the frame """
 
@@ -619,9 +767,20 @@ def nested_to_record(ds, prefix="", level=0):
     return new_ds
 
 
+def _flatten_records(data):
+    """
+    Flatten the nested dicts data into a DataFrame, as
+    DataFrame(nested_to_record(data)) would
+    """
+    arrays, columns = lib.flatten_dicts_to_arrays(data, size_hint=len(data))
+    arrays, columns = _convert_object_array(arrays, columns)
+    return DataFrame._from_arrays(arrays, columns, None)
+
+
 def json_normalize(data, record_path=None, meta=None,
                    meta_prefix=None,
-                   record_prefix=None):
+                   record_prefix=None,
+                   processes=None):
     """
     "Normalize" semi-structured JSON data into a flat table
 
@@ -638,6 +797,12 @@ def json_normalize(data, record_path=None, meta=None,
         If True, prefix records with dotted (?) path, e.g. foo.bar.field if
         path to records is ['foo', 'bar']
     meta_prefix : string, default None
+    processes : int, default None
+        Without `record_path`, flatten the records in batches in a pool of
+        this many worker processes. By default they are flattened in this
+        process.
+
+        .. versionadded:: 0.16.1
 
     Examples
     --------
@@ -691,7 +856,22 @@ def json_normalize(data, record_path=None, meta=None,
             #
             # TODO: handle record value which are lists, at least error
             #       reasonably
-            data = nested_to_record(data)
+            if processes is not None and processes > 1 and \
+                    len(data) > processes:
+                from multiprocessing import Pool
+                from pandas.tools.merge import concat
+
+                size = -(-len(data) // processes)
+                batches = [data[i:i + size]
+                           for i in range(0, len(data), size)]
+                pool = Pool(processes)
+                try:
+                    frames = pool.map(_flatten_records, batches)
+                finally:
+                    pool.close()
+                    pool.join()
+                return concat(frames, ignore_index=True)
+            return _flatten_records(data)
         return DataFrame(data)
     elif not isinstance(record_path, list):
         record_path = [record_path]
@@ -41,6 +41,9 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import os
+import mmap
+import struct
+import tempfile
 from datetime import datetime, date, timedelta
 from dateutil.parser import parse
 
@@ -68,6 +71,17 @@ compressor = None
 _IMPORTS = False
 _BLOSC = False
 
+# with zero_copy, the arrays (and their offsets) whose data is written after
+# the msgpack of the object being packed
+_buffers = None
+
+# a zero-copy frame starts with the magic, the length of the msgpack of the
+# object and the length of the frame; the raw data of the arrays follows the
+# msgpack, each aligned to _ALIGNMENT bytes from the start of the frame
+_ZERO_COPY_MAGIC = b'PDZCMSG1'
+_ZERO_COPY_PREFIX = struct.Struct('<QQ')
+_ALIGNMENT = 64
+
 def _importers():
     # import things we need
     # but make this done on a first use basis
@@ -102,11 +116,18 @@ def to_msgpack(path_or_buf, *args, **kwargs):
              (default is False)
     compress : type of compressor (zlib or blosc), default to None (no
                compression)
+    zero_copy : boolean, write the data of the arrays as raw, aligned
+                buffers following the msgpack of each object, so that
+                read_msgpack of a bytes or mmap object builds the arrays
+                over them without copying (default is False)
     """
     _importers()
     global compressor
     compressor = kwargs.pop('compress', None)
     append = kwargs.pop('append', None)
+    zero_copy = kwargs.pop('zero_copy', False)
+    if zero_copy and compressor is not None:
+        raise ValueError("cannot compress with zero_copy")
     if append:
         mode = 'a+b'
     else:
@@ -114,7 +135,11 @@ def to_msgpack(path_or_buf, *args, **kwargs):
 
     def writer(fh):
         for a in args:
-            fh.write(pack(a, **kwargs))
+            if zero_copy:
+                for part in _pack_zero_copy(a, **kwargs):
+                    fh.write(part)
+            else:
+                fh.write(pack(a, **kwargs))
 
     if isinstance(path_or_buf, compat.string_types):
         with open(path_or_buf, mode) as fh:
@@ -137,7 +162,7 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
 
     Parameters
     ----------
-    path_or_buf : string File path, BytesIO like or string
+    path_or_buf : string File path, BytesIO like, string or mmap
     iterator : boolean, if True, return an iterator to the unpacker
                (default is False)
 
@@ -145,18 +170,33 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
     -------
     obj : type of object stored in file
 
+    Notes
+    -----
+    The arrays of objects written with ``zero_copy=True`` and read from a
+    string or an mmap are views on its memory, read-only for a string.
+
     """
     _importers()
     path_or_buf, _ = get_filepath_or_buffer(path_or_buf)
     if iterator:
         return Iterator(path_or_buf)
 
-    def read(fh):
-        l = list(unpack(fh))
+    def collect(l):
+        l = list(l)
         if len(l) == 1:
             return l[0]
         return l
 
+    def read(fh):
+        if _is_zero_copy(fh):
+            return collect(_unpack_zero_copy(fh.read()))
+        return collect(unpack(fh))
+
+    # memory (and zero-copy frames in it) read in place
+    if isinstance(path_or_buf, (compat.binary_type, mmap.mmap)):
+        if path_or_buf[:len(_ZERO_COPY_MAGIC)] == _ZERO_COPY_MAGIC:
+            return collect(_unpack_zero_copy(path_or_buf))
+
     # see if we have an actual file
     if isinstance(path_or_buf, compat.string_types):
 
@@ -181,6 +221,90 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
     # a buffer like
     return read(path_or_buf)
 
+
+class SharedMemoryHandle(object):
+
+    """ the handle of an object placed in shared memory by
+        to_shared_memory; it pickles as its path, to be sent to other
+        processes and read with from_shared_memory """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.path)
+
+    def __eq__(self, other):
+        return (isinstance(other, SharedMemoryHandle) and
+                self.path == other.path)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.path)
+
+    def unlink(self):
+        """ release the shared memory once every process has mapped it;
+            the objects already read from it stay valid """
+        os.remove(self.path)
+
+
+def _shared_memory_dir():
+    # a tmpfs on linux, so that the pages are never written to disk
+    if os.path.isdir('/dev/shm'):
+        return '/dev/shm'
+    return None
+
+
+def to_shared_memory(obj, path=None):
+    """
+    place obj in shared memory, as zero-copy msgpack frames in a memory
+    mapped file, for from_shared_memory to read without copying the blocks
+
+    THIS IS AN EXPERIMENTAL LIBRARY and the storage format
+    may not be stable until a future release.
+
+    Parameters
+    ----------
+    obj : the object to place
+    path : string File path, default None
+        if None, a temporary file on a tmpfs (/dev/shm) when available
+
+    Returns
+    -------
+    handle : SharedMemoryHandle, call its unlink method to release the
+             memory
+
+    """
+    if path is None:
+        fd, path = tempfile.mkstemp(prefix='pandas-', suffix='.msg',
+                                    dir=_shared_memory_dir())
+        os.close(fd)
+    to_msgpack(path, obj, zero_copy=True)
+    return SharedMemoryHandle(path)
+
+
+def from_shared_memory(handle):
+    """
+    Read the object placed in shared memory by to_shared_memory. The
+    blocks are read-only views on the memory (only object blocks are
+    copied), which is shared with every process reading it
+
+    Parameters
+    ----------
+    handle : SharedMemoryHandle or string File path
+
+    Returns
+    -------
+    obj : type of object placed
+
+    """
+    path = getattr(handle, 'path', handle)
+    with open(path, 'rb') as fh:
+        buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    return read_msgpack(buf)
+
 dtype_dict = {21: np.dtype('M8[ns]'),
               u('datetime64[ns]'): np.dtype('M8[ns]'),
               u('datetime64[us]'): np.dtype('M8[us]'),
@@ -224,6 +348,9 @@ def convert(values):
     if dtype == np.object_:
         return v.tolist()
 
+    if _buffers is not None:
+        return _buffer_ref(v)
+
     if compressor == 'zlib':
 
         # return string arrays like they are
@@ -248,8 +375,111 @@ def convert(values):
     return v.tostring()
 
 
+def _aligned(n):
+    return -(-n // _ALIGNMENT) * _ALIGNMENT
+
+
+def _buffer_ref(values):
+    """ record the contiguous array values to be written as a buffer """
+    values = np.ascontiguousarray(values)
+    if _buffers:
+        offset, last = _buffers[-1]
+        offset = _aligned(offset + last.nbytes)
+    else:
+        offset = 0
+    _buffers.append((offset, values))
+    return {'typ': 'buffer', 'offset': offset, 'nbytes': values.nbytes}
+
+
+def _pack_zero_copy(obj, **kwargs):
+    """
+    Pack obj as a zero-copy frame, returning the parts of the frame to
+    write: the arrays are not copied to bytes
+    """
+    global _buffers
+    _buffers = []
+    try:
+        header = pack(obj, **kwargs)
+        buffers = _buffers
+    finally:
+        _buffers = None
+
+    start = _aligned(len(_ZERO_COPY_MAGIC) + _ZERO_COPY_PREFIX.size +
+                     len(header))
+    end = start
+    if buffers:
+        offset, last = buffers[-1]
+        end = _aligned(start + offset + last.nbytes)
+
+    parts = [_ZERO_COPY_MAGIC, _ZERO_COPY_PREFIX.pack(len(header), end),
+             header]
+    pos = len(_ZERO_COPY_MAGIC) + _ZERO_COPY_PREFIX.size + len(header)
+    for offset, values in buffers:
+        parts.append(b'\0' * (start + offset - pos))
+        parts.append(values.data)
+        pos = start + offset + values.nbytes
+    parts.append(b'\0' * (end - pos))
+    return parts
+
+
+def _is_zero_copy(fh):
+    """ whether the file handle fh is at the start of a zero-copy frame """
+    try:
+        pos = fh.tell()
+        magic = fh.read(len(_ZERO_COPY_MAGIC))
+        fh.seek(pos)
+    except Exception:
+        return False
+    return magic == _ZERO_COPY_MAGIC
+
+
+class _BufferRef(object):
+    """ the data of an array at offset in buf """
+
+    def __init__(self, buf, offset, nbytes):
+        self.buf = buf
+        self.offset = offset
+        self.nbytes = nbytes
+
+    def to_array(self, dtype):
+        dtype = np.dtype(dtype)
+        if not self.nbytes:
+            return np.empty(0, dtype=dtype)
+        return np.frombuffer(self.buf, dtype=dtype,
+                             count=self.nbytes // dtype.itemsize,
+                             offset=self.offset)
+
+
+def _unpack_zero_copy(buf):
+    """
+    Unpack the zero-copy frames of buf (bytes or mmap), returning an
+    iterator; the arrays are built over buf without copying
+    """
+    pos = 0
+    prefix_end = len(_ZERO_COPY_MAGIC) + _ZERO_COPY_PREFIX.size
+    while pos < len(buf):
+        if buf[pos:pos + len(_ZERO_COPY_MAGIC)] != _ZERO_COPY_MAGIC:
+            raise ValueError("invalid zero-copy msgpack frame")
+        header_len, frame_len = _ZERO_COPY_PREFIX.unpack(
+            buf[pos + len(_ZERO_COPY_MAGIC):pos + prefix_end])
+        header = buf[pos + prefix_end:pos + prefix_end + header_len]
+        start = pos + _aligned(prefix_end + header_len)
+
+        def object_hook(obj, start=start):
+            if obj.get('typ') == 'buffer':
+                return _BufferRef(buf, start + obj['offset'], obj['nbytes'])
+            return decode(obj)
+
+        for obj in unpack(compat.BytesIO(header), object_hook=object_hook):
+            yield obj
+        pos += frame_len
+
+
 def unconvert(values, dtype, compress=None):
 
+    if isinstance(values, _BufferRef):
+        return values.to_array(dtype)
+
     if dtype == np.object_:
         return np.array(values, dtype=object)
 
@@ -650,7 +880,10 @@ class Iterator(object):
                     needs_closing = False
                     fh = self.path
 
-            unpacker = unpack(fh)
+            if _is_zero_copy(fh):
+                unpacker = _unpack_zero_copy(fh.read())
+            else:
+                unpacker = unpack(fh)
             for o in unpacker:
                 yield o
         finally:
@@ -145,6 +145,10 @@ encoding : string, default None
     <https://docs.python.org/3/library/codecs.html#standard-encodings>`_
 squeeze : boolean, default False
     If the parsed data only contains one column then return a Series
+compact : boolean, default False
+    Return the DataFrame (or each chunk) with its memory usage optimized, see
+    ``DataFrame.optimize_memory``. With the C parser the integer columns are
+    already downcast while parsing (as with ``compact_ints``)
 na_filter : boolean, default True
     Detect missing value markers (empty strings and the value of na_values). In
     data without any NAs, passing na_filter=False can improve the performance
@@ -294,6 +298,7 @@ _parser_defaults = {
     'verbose': False,
     'encoding': None,
     'squeeze': False,
+    'compact': False,
     'compression': None,
     'mangle_dupe_cols': True,
     'tupleize_cols': False,
@@ -389,6 +394,7 @@ def _make_parser_function(name, sep=','):
                  verbose=False,
                  encoding=None,
                  squeeze=False,
+                 compact=False,
                  mangle_dupe_cols=True,
                  tupleize_cols=False,
                  infer_datetime_format=False,
@@ -450,6 +456,7 @@ def _make_parser_function(name, sep=','):
                     verbose=verbose,
                     encoding=encoding,
                     squeeze=squeeze,
+                    compact=compact,
                     memory_map=memory_map,
                     float_precision=float_precision,
 
@@ -553,9 +560,13 @@ class TextFileReader(object):
 
         self.chunksize = options.pop('chunksize', None)
         self.squeeze = options.pop('squeeze', False)
+        self.compact = options.pop('compact', False)
 
         # might mutate self.engine
         self.options, self.engine = self._clean_options(options, engine)
+        if self.compact and self.engine == 'c':
+            # downcast the integer columns as they are parsed
+            self.options['compact_ints'] = True
         if 'has_index_names' in kwds:
             self.options['has_index_names'] = kwds['has_index_names']
 
@@ -722,6 +733,9 @@ class TextFileReader(object):
 
         df = DataFrame(col_dict, columns=columns, index=index)
 
+        if self.compact:
+            df = df.optimize_memory()
+
         if self.squeeze and len(df.columns) == 1:
             return df[df.columns[0]].copy()
         return df
@@ -335,6 +335,58 @@ def read_hdf(path_or_buf, key, **kwargs):
     f(path_or_buf, False)
 
 
+class QueryCache(object):
+
+    """
+    The coordinates selected by the where conditions on the tables of a
+    store, so that repeating a select does not scan the table again.
+    The entries of a key are dropped when it is written to or removed.
+
+    Attributes
+    ----------
+    hits : number of selections found in the cache
+    misses : number of selections computed and cached
+    """
+
+    def __init__(self):
+        self._coordinates = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return sum(len(v) for v in self._coordinates.values())
+
+    def get(self, pathname, condition, start, stop, compute):
+        """
+        return the coordinates of condition in the table at pathname,
+        computing them with compute() when not cached
+        """
+        cached = self._coordinates.setdefault(pathname, {})
+        key = (condition, start, stop)
+        try:
+            coords = cached[key]
+        except KeyError:
+            self.misses += 1
+            coords = cached[key] = compute()
+            coords.flags.writeable = False
+        else:
+            self.hits += 1
+        return coords
+
+    def invalidate(self, key):
+        """ drop the coordinates of the tables of key (and below it) """
+        if not key.startswith('/'):
+            key = '/' + key
+        prefix = key.rstrip('/') + '/'
+        for pathname in list(self._coordinates):
+            if pathname == key or pathname.startswith(prefix):
+                del self._coordinates[pathname]
+
+    def clear(self):
+        """ drop all of the coordinates """
+        self._coordinates.clear()
+
+
 class HDFStore(StringMixin):
 
     """
@@ -365,6 +417,12 @@ class HDFStore(StringMixin):
             in the store wherever possible
     fletcher32 : bool, default False
             If applying compression use the fletcher32 checksum
+    query_cache : bool, default False
+            Cache the coordinates selected by the where conditions of
+            the tables, see the ``query_cache`` attribute for the hit and
+            miss counts
+
+            .. versionadded:: 0.16.1
 
     Examples
     --------
@@ -378,7 +436,7 @@ class HDFStore(StringMixin):
     """
 
     def __init__(self, path, mode=None, complevel=None, complib=None,
-                 fletcher32=False, **kwargs):
+                 fletcher32=False, query_cache=False, **kwargs):
         try:
             import tables
         except ImportError as ex:  # pragma: no cover
@@ -393,8 +451,18 @@ class HDFStore(StringMixin):
         self._complib = complib
         self._fletcher32 = fletcher32
         self._filters = None
+        self._query_cache = QueryCache() if query_cache else None
         self.open(mode=mode, **kwargs)
 
+    @property
+    def query_cache(self):
+        """ the QueryCache of the store, None if not caching """
+        return self._query_cache
+
+    def _invalidate_queries(self, key):
+        if self._query_cache is not None:
+            self._query_cache.invalidate(key)
+
     @property
     def root(self):
         """ return the root node """
@@ -521,6 +589,10 @@ class HDFStore(StringMixin):
         if self.is_open:
             self.close()
 
+        # the file could have changed
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
         if self._complib is not None:
             if self._complevel is None:
                 self._complevel = 9
@@ -664,6 +736,48 @@ class HDFStore(StringMixin):
 
         return it.get_result()
 
+    def resample(self, key, rule, how=None, where=None, columns=None,
+                 chunksize=None, closed=None, label=None, loffset=None,
+                 base=0):
+        """
+        Downsample a table stored in file by time, reading it in chunks so
+        that only one chunk is held in memory (plus the rows of one bin,
+        for a how other than sum, count, mean, first, last, min, max and
+        ohlc). The table must be sorted by its index
+
+        Parameters
+        ----------
+        key : object
+        rule : the offset string or object representing target conversion
+        how : string, method for downsampling, default 'mean'
+        where : list of Term (or convertable) objects, optional
+        columns : a list of columns that if not None, will limit the return
+            columns
+        chunksize : nrows to read at a time, default 100000
+        closed, label, loffset, base : see DataFrame.resample
+
+        Returns
+        -------
+        The resampled object
+
+        """
+        from pandas.tseries.resample import _resample_chunks
+
+        where = _ensure_term(where, scope_level=1)
+        if chunksize is None:
+            chunksize = 100000
+
+        chunks = self.select(key, where=where, columns=columns,
+                             chunksize=chunksize)
+        result = _resample_chunks(chunks, rule, how=how, closed=closed,
+                                  label=label, loffset=loffset, base=base)
+        if result is None:
+            # nothing was selected
+            result = self.select(key, where=where, columns=columns)
+            result = result.resample(rule, how=how, closed=closed,
+                                     label=label, loffset=loffset, base=base)
+        return result
+
     def select_as_coordinates(
             self, key, where=None, start=None, stop=None, **kwargs):
         """
@@ -782,6 +896,89 @@ class HDFStore(StringMixin):
         return it.get_result(coordinates=True)
 
 
+    def select_many(self, keys, where=None, columns=None, workers=None,
+                    concat=False, **kwargs):
+        """
+        Retrieve pandas objects from many keys, optionally based on the
+        same where criteria, reading and converting them in worker processes
+
+        Parameters
+        ----------
+        keys : a list of the keys
+        where : list of Term (or convertable) objects, optional
+        columns : a list of columns that if not None, will limit the return
+            columns
+        workers : integer, default None
+            read the keys in a pool of this many worker processes, which open
+            the file read-only; the store must be opened with mode 'r'. By
+            default the keys are read one after another in this process;
+            iterator and chunksize are not supported with workers
+        concat : boolean, default False
+            concatenate the objects, with the keys as the outer level of
+            the index
+
+        Returns
+        -------
+        a dict of key -> selected object, or the concatenated object
+
+        .. versionadded:: 0.16.1
+        """
+        if not isinstance(keys, (list, tuple)):
+            raise TypeError("keys must be a list/tuple")
+
+        where = _ensure_term(where, scope_level=1)
+        keys = list(keys)
+
+        if workers is None or workers <= 1 or len(keys) <= 1:
+            objs = [self.select(k, where=where, columns=columns, **kwargs)
+                    for k in keys]
+        else:
+            if self._mode != 'r':
+                raise ValueError("select_many with workers requires the store "
+                                 "to be opened with mode 'r'")
+            if kwargs.get('iterator') or kwargs.get('chunksize') is not None:
+                raise ValueError("select_many with workers does not support "
+                                 "iterator or chunksize")
+
+            # the where is evaluated here (it can refer to variables in the
+            # scope of the caller), the workers select the coordinates;
+            # these are absolute, so start/stop are not passed on with them
+            bounded = dict((k, v) for k, v in kwargs.items()
+                           if k not in ('start', 'stop'))
+            selections = []
+            for k in keys:
+                s = self.get_storer(k)
+                if s is None:
+                    raise KeyError('No object named %s in the file' % k)
+                if not s.is_table:
+                    s.validate_read(dict(where=where, columns=columns))
+                    selections.append((k, None, kwargs))
+                elif where is not None:
+                    w = s.read_coordinates(where=where,
+                                           start=kwargs.get('start'),
+                                           stop=kwargs.get('stop')).values
+                    selections.append((k, w, bounded))
+                else:
+                    selections.append((k, None, kwargs))
+
+            from multiprocessing import Pool
+
+            size = -(-len(keys) // workers)
+            batches = [(self._path, selections[i:i + size], columns)
+                       for i in range(0, len(keys), size)]
+            pool = Pool(min(workers, len(batches)))
+            try:
+                objs = list(itertools.chain.from_iterable(
+                    pool.map(_select_keys, batches)))
+            finally:
+                pool.close()
+                pool.join()
+
+        if concat:
+            from pandas.tools.merge import concat as concat_objs
+            return concat_objs(objs, keys=keys)
+        return dict(zip(keys, objs))
+
     def put(self, key, value, format=None, append=False, **kwargs):
         """
         Store object in HDFStore
@@ -831,6 +1028,7 @@ class HDFStore(StringMixin):
 
         """
         where = _ensure_term(where, scope_level=1)
+        self._invalidate_queries(key)
         try:
             s = self.get_storer(key)
         except:
@@ -857,7 +1055,10 @@ class HDFStore(StringMixin):
             if not s.is_table:
                 raise ValueError(
                     'can only remove with where on objects written as tables')
-            return s.delete(where=where, start=start, stop=stop)
+            try:
+                return s.delete(where=where, start=start, stop=stop)
+            finally:
+                self._invalidate_queries(key)
 
     def append(self, key, value, format=None, append=True, columns=None,
                dropna=None, **kwargs):
@@ -1208,6 +1409,7 @@ class HDFStore(StringMixin):
 
     def _write_to_group(self, key, value, format, index=True, append=False,
                         complib=None, encoding=None, **kwargs):
+        self._invalidate_queries(key)
         group = self.get_node(key)
 
         # remove the node if we are not appending
@@ -1267,6 +1469,18 @@ class HDFStore(StringMixin):
         return s.read(**kwargs)
 
 
+def _select_keys(args):
+    """ select the (key, where, kwargs) selections from the store at path,
+        in a select_many worker """
+    path, selections, columns = args
+    store = HDFStore(path, mode='r')
+    try:
+        return [store.select(k, where=w, columns=columns, **kw)
+                for k, w, kw in selections]
+    finally:
+        store.close()
+
+
 def get_store(path, **kwargs):
     """ Backwards compatible alias for ``HDFStore``
     """
@@ -4487,11 +4701,17 @@ class Selection(object):
                 .format(where, ','.join(q.keys()))
             )
 
+    @property
+    def query_cache(self):
+        return getattr(self.table.parent, 'query_cache', None)
+
     def select(self):
         """
         generate the selection
         """
         if self.condition is not None:
+            if self.query_cache is not None:
+                return self.table.table.read_coordinates(self.select_coords())
             return self.table.table.read_where(self.condition.format(),
                                               start=self.start, stop=self.stop)
         elif self.coordinates is not None:
@@ -4514,9 +4734,20 @@ class Selection(object):
             stop += nrows
 
         if self.condition is not None:
-            return self.table.table.get_where_list(self.condition.format(),
-                                                 start=start, stop=stop,
-                                                 sort=True)
+            condition = self.condition.format()
+
+            def compute():
+                return self.table.table.get_where_list(condition,
+                                                       start=start, stop=stop,
+                                                       sort=True)
+
+            # the condition has the values of the terms bound, so it
+            # identifies the selection
+            cache = self.query_cache
+            if cache is not None:
+                return cache.get(self.table.pathname, condition, start, stop,
+                                 compute)
+            return compute()
         elif self.coordinates is not None:
             return self.coordinates
 
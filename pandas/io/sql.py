@@ -9,6 +9,7 @@ from datetime import datetime, date
 
 import warnings
 import traceback
+import itertools
 import re
 import numpy as np
 
@@ -16,8 +17,11 @@ import pandas.lib as lib
 import pandas.core.common as com
 from pandas.compat import lzip, map, zip, raise_with_traceback, string_types
 from pandas.core.api import DataFrame, Series
+from pandas.core.frame import _convert_object_array
 from pandas.core.common import isnull
 from pandas.core.base import PandasObject
+from pandas.tseries.index import DatetimeIndex
+from pandas.tseries.period import PeriodIndex
 from pandas.tseries.tools import to_datetime
 from pandas.util.decorators import Appender
 
@@ -116,13 +120,86 @@ def _parse_date_columns(data_frame, parse_dates):
     return data_frame
 
 
+def _partition_bounds(low, high, num_partitions):
+    """
+    Return the boundaries of num_partitions ranges evenly splitting
+    [low, high], dropping empty ranges; integer boundaries for integer
+    low and high
+    """
+    if com.is_integer(low) and com.is_integer(high):
+        low, high = int(low), int(high)
+        bounds = [low + (high - low) * i // num_partitions
+                  for i in range(num_partitions + 1)]
+    else:
+        low, high = float(low), float(high)
+        bounds = [low + (high - low) * i / num_partitions
+                  for i in range(num_partitions)] + [high]
+
+    bounds = sorted(set(bounds))
+    if len(bounds) == 1:
+        bounds = bounds * 2
+    return bounds
+
+
+def _supports_concurrent_reads(engine):
+    """
+    Whether separate connections of engine see the same database (an
+    in-memory sqlite database is private to its connection)
+    """
+    url = engine.url
+    return not (url.drivername.startswith('sqlite') and
+                url.database in (None, '', ':memory:'))
+
+
+# maximum number of threads of the default pool reading the partitions of
+# read_sql_table
+_MAX_READ_THREADS = 8
+
+
+def _read_threads(engine, num_reads):
+    """
+    The number of threads to run num_reads reads on separate connections of
+    engine in: at most _MAX_READ_THREADS, and no more than the connections
+    that the pool of engine hands out at once (more would wait on the pool)
+    """
+    threads = min(num_reads, _MAX_READ_THREADS)
+    pool = engine.pool
+    size = getattr(pool, 'size', None)
+    if callable(size):
+        # a negative overflow does not limit the connections
+        overflow = getattr(pool, '_max_overflow', 0)
+        if overflow >= 0:
+            threads = min(threads, max(size() + overflow, 1))
+    return threads
+
+
+def _frame_from_rows(data, columns, coerce_float=True, dtypes=None):
+    """
+    Build a DataFrame from a list of result rows, filling an array per
+    column straight from the rows. dtypes optionally gives the expected
+    dtype of each column, keeping float columns float64 (and int columns
+    holding only NULLs float64) whatever the values in these rows are.
+    """
+    if not len(data):
+        return DataFrame.from_records(data, columns=columns,
+                                      coerce_float=coerce_float)
+
+    arrays = lib.rows_to_arrays(data, size_hint=len(data), dtypes=dtypes)
+    arrays, columns = _convert_object_array(arrays, columns,
+                                            coerce_float=coerce_float)
+    return DataFrame._from_arrays(arrays, columns, None)
+
+
 def _wrap_result(data, columns, index_col=None, coerce_float=True,
                  parse_dates=None):
     """Wrap result set of query in a DataFrame """
 
-    frame = DataFrame.from_records(data, columns=columns,
-                                   coerce_float=coerce_float)
+    frame = _frame_from_rows(data, columns, coerce_float=coerce_float)
+    return _finish_result(frame, index_col=index_col,
+                          parse_dates=parse_dates)
+
 
+def _finish_result(frame, index_col=None, parse_dates=None):
     _parse_date_columns(frame, parse_dates)
 
     if index_col is not None:
@@ -279,7 +356,8 @@ def uquery(sql, con=None, cur=None, retry=True, params=None):
 
 def read_sql_table(table_name, con, schema=None, index_col=None,
                    coerce_float=True, parse_dates=None, columns=None,
-                   chunksize=None):
+                   chunksize=None, partition_column=None, num_partitions=None,
+                   pool=None):
     """Read SQL database table into a DataFrame.
 
     Given a table name and an SQLAlchemy engine, returns a DataFrame.
@@ -312,12 +390,35 @@ def read_sql_table(table_name, con, schema=None, index_col=None,
         List of column names to select from sql table
     chunksize : int, default None
         If specified, return an iterator where `chunksize` is the number of
-        rows to include in each chunk.
+        rows to include in each chunk. Integer columns that can hold NULLs
+        are float in every chunk.
+    partition_column : string, default None
+        Name of an integer or float column to split the read on: the range
+        of its values is divided into `num_partitions` ranges, which are
+        read concurrently on separate connections of the engine's pool and
+        concatenated (rows with a NULL value go to the first one). Cannot
+        be combined with `chunksize`.
+
+        .. versionadded:: 0.16.1
+    num_partitions : int, default None
+        Number of ranges of `partition_column` to read
+    pool : multiprocessing.pool.ThreadPool, default None
+        Thread pool (any object with a ``map`` method) to run the reads of
+        the partitions in. By default a pool is created for the call, with
+        at most 8 threads, and no more than the connections the pool of the
+        engine can hand out at once.
 
     Returns
     -------
     DataFrame
 
+    Notes
+    -----
+    With `partition_column`, the rows are ordered by partition rather than
+    as the database returns them for the whole table. An in-memory sqlite
+    database is private to its connection, its partitions are read one
+    after another.
+
     See also
     --------
     read_sql_query : Read SQL query into a DataFrame.
@@ -338,7 +439,9 @@ def read_sql_table(table_name, con, schema=None, index_col=None,
     pandas_sql = SQLDatabase(con, meta=meta)
     table = pandas_sql.read_table(
         table_name, index_col=index_col, coerce_float=coerce_float,
-        parse_dates=parse_dates, columns=columns, chunksize=chunksize)
+        parse_dates=parse_dates, columns=columns, chunksize=chunksize,
+        partition_column=partition_column, num_partitions=num_partitions,
+        pool=pool)
 
     if table is not None:
         return table
@@ -589,6 +692,62 @@ def pandasSQL_builder(con, flavor=None, schema=None, meta=None,
         return SQLiteDatabase(con, flavor, is_cursor=is_cursor)
 
 
+# number of rows converted to Python objects at a time by SQLTable.insert
+_INSERT_CONVERT_ROWS = 10000
+
+# maximum number of parameters of a multi-row insert statement
+_MAX_INSERT_PARAMS = 1000
+
+
+def _use_multi_values(dialect):
+    """
+    Whether to insert several rows with one statement, which is a single
+    round trip, where the dialect supports it (sqlite is in-process, so
+    executemany is faster)
+    """
+    return (dialect.name != 'sqlite' and
+            getattr(dialect, 'supports_multivalues_insert', False))
+
+
+def _sql_values(values, can_hold_na=True):
+    """
+    Convert a 2-d array of values to lists of Python objects (one per row
+    of values), null values becoming None
+    """
+    if com.is_datetime64_dtype(values):
+        # microsecond resolution yields datetime.datetime, NaT None
+        return values.astype('M8[us]').tolist()
+
+    if values.dtype.kind not in 'iubfc':
+        values = np.array(values, dtype=object)
+    result = values.tolist()
+
+    if can_hold_na:
+        mask = isnull(values)
+        for i, j in zip(*mask.nonzero()):
+            result[i][j] = None
+    return result
+
+
+def _sql_block_values(block):
+    if block.is_datetime:
+        return _sql_values(block.values)
+    return _sql_values(block.get_values(), can_hold_na=block._can_hold_na)
+
+
+def _sql_index_values(index):
+    # as reset_index casts the levels: periods and tz-aware datetimes are
+    # written as Period / Timestamp objects
+    if isinstance(index, PeriodIndex) or (isinstance(index, DatetimeIndex)
+                                          and index.tz is not None):
+        values = index.asobject.values
+    else:
+        values = index.values
+        if values.dtype == np.object_:
+            values = lib.maybe_convert_objects(values)
+    return _sql_values(values[None, :])
+
+
 class SQLTable(PandasObject):
     """
     For mapping Pandas tables to SQL tables.
@@ -651,48 +810,59 @@ class SQLTable(PandasObject):
     def insert_statement(self):
         return self.table.insert()
 
-    def insert_data(self):
+    def insert_keys(self):
+        keys = list(map(str, self.frame.columns))
         if self.index is not None:
-            temp = self.frame.copy()
-            temp.index.names = self.index
-            try:
-                temp.reset_index(inplace=True)
-            except ValueError as err:
-                raise ValueError(
-                    "duplicate name in index/columns: {0}".format(err))
-        else:
-            temp = self.frame
-
-        column_names = list(map(str, temp.columns))
-        ncols = len(column_names)
-        data_list = [None] * ncols
-        blocks = temp._data.blocks
-
-        for i in range(len(blocks)):
-            b = blocks[i]
-            if b.is_datetime:
-                # convert to microsecond resolution so this yields
-                # datetime.datetime
-                d = b.values.astype('M8[us]').astype(object)
-            else:
-                d = np.array(b.get_values(), dtype=object)
+            keys = list(self.index) + keys
+            dups = [k for k in set(keys) if keys.count(k) > 1]
+            if dups:
+                raise ValueError("duplicate name in index/columns: cannot "
+                                 "insert {0}, already exists".format(dups[0]))
+        return keys
+
+    def insert_data(self, start=0, end=None):
+        """
+        Return the values of rows start to end of the frame (and index) as
+        a list of lists of Python objects, one list per column, null values
+        being None
+        """
+        chunk = self.frame.iloc[start:end]
 
-            # replace NaN with None
-            if b._can_hold_na:
-                mask = isnull(d)
-                d[mask] = None
+        data_list = []
+        if self.index is not None:
+            index = chunk.index
+            for i in range(len(self.index)):
+                data_list.extend(
+                    _sql_index_values(index.get_level_values(i)))
 
-            for col_loc, col in zip(b.mgr_locs, d):
-                data_list[col_loc] = col
+        columns = [None] * len(chunk.columns)
+        for b in chunk._data.blocks:
+            for col_loc, col in zip(b.mgr_locs, _sql_block_values(b)):
+                columns[col_loc] = col
+        data_list.extend(columns)
 
-        return column_names, data_list
+        return data_list
 
     def _execute_insert(self, conn, keys, data_iter):
-        data = [dict((k, v) for k, v in zip(keys, row)) for row in data_iter]
-        conn.execute(self.insert_statement(), data)
+        # the rows are consumed in pieces, as they are converted
+        multi_values = _use_multi_values(conn.dialect)
+        if multi_values:
+            rows = max(1, _MAX_INSERT_PARAMS // max(len(keys), 1))
+        else:
+            rows = _INSERT_CONVERT_ROWS
+
+        while True:
+            data = [dict(zip(keys, row))
+                    for row in itertools.islice(data_iter, rows)]
+            if not data:
+                break
+            if multi_values and len(data) > 1:
+                conn.execute(self.insert_statement().values(data))
+            else:
+                conn.execute(self.insert_statement(), data)
 
     def insert(self, chunksize=None):
-        keys, data_list = self.insert_data()
+        keys = self.insert_keys()
 
         nrows = len(self.frame)
 
@@ -704,29 +874,36 @@ class SQLTable(PandasObject):
         elif chunksize == 0:
             raise ValueError('chunksize argument should be non-zero')
 
-        chunks = int(nrows / chunksize) + 1
+        # the values of at most _INSERT_CONVERT_ROWS rows are held as
+        # Python objects at a time
+        convert_rows = min(chunksize, _INSERT_CONVERT_ROWS)
 
         with self.pd_sql.run_transaction() as conn:
-            for i in range(chunks):
-                start_i = i * chunksize
-                end_i = min((i + 1) * chunksize, nrows)
-                if start_i >= end_i:
-                    break
+            for start_i in range(0, nrows, chunksize):
+                end_i = min(start_i + chunksize, nrows)
+                rows = self._iter_rows(start_i, end_i, convert_rows)
+                self._execute_insert(conn, keys, rows)
 
-                chunk_iter = zip(*[arr[start_i:end_i] for arr in data_list])
-                self._execute_insert(conn, keys, chunk_iter)
+    def _iter_rows(self, start, end, convert_rows):
+        for i in range(start, end, convert_rows):
+            data_list = self.insert_data(i, min(i + convert_rows, end))
+            for row in zip(*data_list):
+                yield row
 
     def _query_iterator(self, result, chunksize, columns, coerce_float=True,
                         parse_dates=None):
         """Return generator through chunked result set"""
 
+        # a nullable integer column is float in every chunk, whether or not
+        # the chunk has NULLs
+        dtypes = self._column_dtypes(columns, nullable_as_float=True)
         while True:
             data = result.fetchmany(chunksize)
             if not data:
                 break
             else:
-                self.frame = DataFrame.from_records(
-                    data, columns=columns, coerce_float=coerce_float)
+                self.frame = _frame_from_rows(
+                    data, columns, coerce_float=coerce_float, dtypes=dtypes)
 
                 self._harmonize_columns(parse_dates=parse_dates)
 
@@ -736,7 +913,8 @@ class SQLTable(PandasObject):
                 yield self.frame
 
     def read(self, coerce_float=True, parse_dates=None, columns=None,
-             chunksize=None):
+             chunksize=None, partition_column=None, num_partitions=None,
+             pool=None):
 
         if columns is not None and len(columns) > 0:
             from sqlalchemy import select
@@ -747,24 +925,130 @@ class SQLTable(PandasObject):
         else:
             sql_select = self.table.select()
 
-        result = self.pd_sql.execute(sql_select)
-        column_names = result.keys()
-
-        if chunksize is not None:
-            return self._query_iterator(result, chunksize, column_names,
-                                        coerce_float=coerce_float,
-                                        parse_dates=parse_dates)
+        if partition_column is not None:
+            if chunksize is not None:
+                raise ValueError("chunksize cannot be combined with "
+                                 "partition_column")
+            self.frame = self._read_partitioned(
+                sql_select, partition_column, num_partitions, pool=pool,
+                coerce_float=coerce_float)
         else:
+            result = self.pd_sql.execute(sql_select)
+            column_names = result.keys()
+
+            if chunksize is not None:
+                return self._query_iterator(result, chunksize, column_names,
+                                            coerce_float=coerce_float,
+                                            parse_dates=parse_dates)
+
             data = result.fetchall()
-            self.frame = DataFrame.from_records(
-                data, columns=column_names, coerce_float=coerce_float)
+            self.frame = _frame_from_rows(
+                data, column_names, coerce_float=coerce_float,
+                dtypes=self._column_dtypes(column_names))
 
-            self._harmonize_columns(parse_dates=parse_dates)
+        self._harmonize_columns(parse_dates=parse_dates)
 
-            if self.index is not None:
-                self.frame.set_index(self.index, inplace=True)
+        if self.index is not None:
+            self.frame.set_index(self.index, inplace=True)
+
+        return self.frame
+
+    def _read_partitioned(self, sql_select, partition_column, num_partitions,
+                          pool=None, coerce_float=True):
+        """
+        Read the rows of sql_select in num_partitions ranges of values of
+        the (numeric) partition_column, concurrently on separate
+        connections of the engine, into one DataFrame
+        """
+        from sqlalchemy import select, func, and_, or_
 
-            return self.frame
+        if not com.is_integer(num_partitions) or num_partitions < 1:
+            raise ValueError("num_partitions must be a positive integer")
+        try:
+            col = self.table.c[partition_column]
+        except KeyError:
+            raise ValueError("partition_column %s not found in table %s"
+                             % (partition_column, self.name))
+        if self._numpy_type(col.type) not in (float, np.dtype('int64')):
+            raise ValueError("partition_column must be an integer or float "
+                             "column")
+
+        low, high = self.pd_sql.execute(
+            select([func.min(col), func.max(col)])).fetchone()
+        if low is None:
+            # the column is all NULL
+            queries = [sql_select]
+        else:
+            bounds = _partition_bounds(low, high, num_partitions)
+            queries = []
+            for i in range(len(bounds) - 1):
+                if i == len(bounds) - 2:
+                    cond = and_(col >= bounds[i], col <= bounds[i + 1])
+                else:
+                    cond = and_(col >= bounds[i], col < bounds[i + 1])
+                if i == 0:
+                    cond = or_(cond, col.is_(None))
+                queries.append(sql_select.where(cond))
+
+        engine = self.pd_sql.engine
+
+        def read_partition(query):
+            conn = engine.connect()
+            try:
+                result = conn.execute(query)
+                column_names = result.keys()
+                return _frame_from_rows(
+                    result.fetchall(), column_names,
+                    coerce_float=coerce_float,
+                    dtypes=self._column_dtypes(column_names))
+            finally:
+                conn.close()
+
+        if len(queries) == 1 or not _supports_concurrent_reads(engine):
+            frames = [read_partition(query) for query in queries]
+        elif pool is not None:
+            frames = pool.map(read_partition, queries)
+        else:
+            from multiprocessing.pool import ThreadPool
+            pool = ThreadPool(_read_threads(engine, len(queries)))
+            try:
+                frames = pool.map(read_partition, queries)
+            finally:
+                pool.close()
+                pool.join()
+
+        # empty partitions would make the columns object
+        frames = [frame for frame in frames if len(frame)] or frames[:1]
+        if len(frames) == 1:
+            return frames[0]
+
+        from pandas.tools.merge import concat
+        return concat(frames, ignore_index=True)
+
+    def _column_dtypes(self, columns, nullable_as_float=False):
+        """
+        The dtypes of the float and integer columns of the table among
+        columns, None for the others; with nullable_as_float, float64 for
+        the integer columns that can hold NULLs
+        """
+        dtypes = []
+        for name in columns:
+            try:
+                column = self.table.c[name]
+            except KeyError:
+                dtypes.append(None)
+                continue
+            col_type = self._numpy_type(column.type)
+            if col_type is float:
+                dtypes.append(np.dtype('float64'))
+            elif col_type is np.dtype('int64'):
+                if nullable_as_float and column.nullable:
+                    dtypes.append(np.dtype('float64'))
+                else:
+                    dtypes.append(col_type)
+            else:
+                dtypes.append(None)
+        return dtypes
 
     def _index_name(self, index, index_label):
         # for writing: index=True to include index in sql table
@@ -1012,7 +1296,8 @@ class SQLDatabase(PandasSQL):
 
     def read_table(self, table_name, index_col=None, coerce_float=True,
                    parse_dates=None, columns=None, schema=None,
-                   chunksize=None):
+                   chunksize=None, partition_column=None, num_partitions=None,
+                   pool=None):
         """Read SQL database table into a DataFrame.
 
         Parameters
@@ -1043,6 +1328,13 @@ class SQLDatabase(PandasSQL):
         chunksize : int, default None
             If specified, return an iterator where `chunksize` is the number
             of rows to include in each chunk.
+        partition_column : string, default None
+            Name of an integer or float column whose range of values is
+            split in `num_partitions` ranges read concurrently
+        num_partitions : int, default None
+            Number of ranges of `partition_column` to read
+        pool : multiprocessing.pool.ThreadPool, default None
+            Thread pool to run the reads of the partitions in
 
         Returns
         -------
@@ -1057,21 +1349,28 @@ class SQLDatabase(PandasSQL):
         table = SQLTable(table_name, self, index=index_col, schema=schema)
         return table.read(coerce_float=coerce_float,
                           parse_dates=parse_dates, columns=columns,
-                          chunksize=chunksize)
+                          chunksize=chunksize,
+                          partition_column=partition_column,
+                          num_partitions=num_partitions, pool=pool)
 
     @staticmethod
     def _query_iterator(result, chunksize, columns, index_col=None,
                         coerce_float=True, parse_dates=None):
         """Return generator through chunked result set"""
 
+        # the dtypes of the first chunk are expected of the next ones
+        dtypes = None
         while True:
             data = result.fetchmany(chunksize)
             if not data:
                 break
             else:
-                yield _wrap_result(data, columns, index_col=index_col,
-                                   coerce_float=coerce_float,
-                                   parse_dates=parse_dates)
+                frame = _frame_from_rows(data, columns,
+                                         coerce_float=coerce_float,
+                                         dtypes=dtypes)
+                dtypes = list(frame.dtypes)
+                yield _finish_result(frame, index_col=index_col,
+                                     parse_dates=parse_dates)
 
     def read_query(self, sql, index_col=None, coerce_float=True,
                    parse_dates=None, params=None, chunksize=None):
@@ -1344,8 +1643,16 @@ class SQLiteTable(SQLTable):
         return insert_statement
 
     def _execute_insert(self, conn, keys, data_iter):
-        data_list = list(data_iter)
-        conn.executemany(self.insert_statement(), data_list)
+        # sqlite3 consumes the rows as they are converted
+        if self.pd_sql.flavor == 'sqlite':
+            conn.executemany(self.insert_statement(), data_iter)
+            return
+
+        while True:
+            data = list(itertools.islice(data_iter, _INSERT_CONVERT_ROWS))
+            if not data:
+                break
+            conn.executemany(self.insert_statement(), data)
 
     def _create_table_setup(self):
         """
@@ -1477,15 +1784,20 @@ class SQLiteDatabase(PandasSQL):
                         coerce_float=True, parse_dates=None):
         """Return generator through chunked result set"""
 
+        # the dtypes of the first chunk are expected of the next ones
+        dtypes = None
         while True:
             data = cursor.fetchmany(chunksize)
             if not data:
                 cursor.close()
                 break
             else:
-                yield _wrap_result(data, columns, index_col=index_col,
-                                   coerce_float=coerce_float,
-                                   parse_dates=parse_dates)
+                frame = _frame_from_rows(data, columns,
+                                         coerce_float=coerce_float,
+                                         dtypes=dtypes)
+                dtypes = list(frame.dtypes)
+                yield _finish_result(frame, index_col=index_col,
+                                     parse_dates=parse_dates)
 
     def read_query(self, sql, index_col=None, coerce_float=True, params=None,
                    parse_dates=None, chunksize=None):
@@ -673,3 +673,57 @@ class TestPandasContainer(tm.TestCase):
             raise TypeError("raisin")
         self.assertRaises(TypeError, DataFrame({'a': [1, 2, object()]}).to_json,
                           default_handler=my_handler_raises)
+
+    def test_records_columnar(self):
+        # keys missing from some records, nulls
+        json = ('[{"a": 1, "b": "x", "c": 1.5},'
+                ' {"a": 2, "c": null},'
+                ' {"a": 3, "b": null, "c": 2}]')
+        result = read_json(json, orient='records')
+        expected = DataFrame({'a': [1, 2, 3], 'b': ['x', np.nan, None],
+                              'c': [1.5, np.nan, 2.]})
+        assert_frame_equal(result, expected)
+        self.assertEqual(result['a'].dtype, np.int64)
+        self.assertEqual(result['c'].dtype, np.float64)
+
+        # not an array of objects
+        result = read_json('[[1, 2], [3, 4]]', orient='records')
+        assert_frame_equal(result, DataFrame([[1, 2], [3, 4]]))
+
+        result = read_json('[]', orient='records')
+        self.assertEqual(len(result), 0)
+
+    def test_read_json_lines(self):
+        df = DataFrame({'a': [1, 2, 3, 4, 5], 'b': ['x', 'y', 'z', 'u', 'v'],
+                        'c': [1.5, np.nan, 2.5, 3.5, 4.5]})
+        lines = '\n'.join(df.iloc[[i]].to_json(orient='records')[1:-1]
+                          for i in range(len(df))) + '\n\n'
+
+        result = read_json(lines, lines=True)
+        assert_frame_equal(result, df)
+
+        reader = read_json(StringIO(lines), lines=True, chunksize=2)
+        chunks = list(reader)
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        assert_frame_equal(pd.concat(chunks), df)
+
+        # compressed files
+        import gzip
+        import bz2
+        for compression, opener in [('gzip', gzip.GzipFile),
+                                    ('bz2', bz2.BZ2File)]:
+            with ensure_clean() as path:
+                f = opener(path, 'wb')
+                f.write(lines.encode('utf-8'))
+                f.close()
+
+                result = read_json(path, lines=True, compression=compression)
+                assert_frame_equal(result, df)
+
+                result = pd.concat(read_json(path, lines=True, chunksize=3,
+                                             compression=compression))
+                assert_frame_equal(result, df)
+
+        self.assertRaises(ValueError, read_json, lines, chunksize=2)
+        self.assertRaises(ValueError, read_json, lines, lines=True,
+                          orient='split')
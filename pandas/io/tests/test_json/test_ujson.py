@@ -1146,6 +1146,23 @@ class NumpyJSONTests(TestCase):
             self.assertTrue((np.array(['1','2','3']) == output[1]).all())
             self.assertTrue((np.array(['a', 'b']) == output[2]).all())
 
+    def testArrayRecords(self):
+        input = '[{"a": 1, "b": null}, {"b": "x", "c": [1, {"d": 2}]}, {}]'
+        keys, columns, nrows = ujson.loads(input, records=True)
+        self.assertEqual(keys, ['a', 'b', 'c'])
+        self.assertEqual(nrows, 3)
+        self.assertEqual(columns[0][0], 1)
+        self.assertTrue(np.isnan(columns[0][1]) and np.isnan(columns[0][2]))
+        self.assertEqual(columns[1][:2], [None, 'x'])
+        self.assertEqual(columns[2][1], [1, {'d': 2}])
+
+        self.assertEqual(ujson.loads('[]', records=True), ([], [], 0))
+
+        # other documents are decoded as usual
+        self.assertEqual(ujson.loads('{"a": [{"b": 1}]}', records=True),
+                         {'a': [{'b': 1}]})
+        self.assertRaises(ValueError, ujson.loads, '[[1, 2]]', records=True)
+
 
 class PandasJSONTests(TestCase):
 
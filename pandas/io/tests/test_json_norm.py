@@ -163,6 +163,33 @@ class TestJSONNormalize(tm.TestCase):
 
         tm.assert_frame_equal(result, expected)
 
+    def test_nested_records(self):
+        data = [{'id': 1, 'info': {'name': 'a', 'size': {'w': 1, 'h': 2.5}},
+                 'tags': ['x']},
+                {'id': 2, 'info': {'name': 'b', 'size': {'w': 3}},
+                 'extra': {'flag': True}},
+                {'id': 3, 'info': {'size': {}}, 'tags': None}] * 5
+
+        expected = DataFrame(nested_to_record(data))
+        result = json_normalize(data)
+        tm.assert_frame_equal(result, expected)
+        self.assertEqual(result['info.size.w'].dtype, np.float64)
+        self.assertEqual(result['id'].dtype, np.int64)
+
+        # flattened in batches in worker processes
+        result = json_normalize(data, processes=2)
+        tm.assert_frame_equal(result, expected)
+
+    def test_nested_records_name_collision(self):
+        # a dotted key and a key path of the same name share a column
+        data = [{'a.b': 1, 'c': 1}, {'a': {'b': 2}, 'c': 2},
+                {'a': {'b': 3, 'd': 4}}]
+
+        expected = DataFrame(nested_to_record(data))
+        result = json_normalize(data)
+        tm.assert_frame_equal(result, expected)
+        self.assertEqual(list(result.columns), ['a.b', 'a.d', 'c'])
+
 
 class TestNestedToRecord(tm.TestCase):
 
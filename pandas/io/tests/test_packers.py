@@ -1,6 +1,7 @@
 import nose
 
 import datetime
+import mmap
 import numpy as np
 import sys
 from distutils.version import LooseVersion
@@ -86,6 +87,67 @@ class TestAPI(TestPackers):
             result = read_msgpack(p)
             tm.assert_frame_equal(result, df)
 
+    def test_zero_copy(self):
+
+        df = DataFrame({'a': np.random.randn(10),
+                        'b': np.arange(10),
+                        'c': pandas.date_range('20130101', periods=10),
+                        'd': list('abcdefghij')})
+        s = df.to_msgpack(None, zero_copy=True)
+        result = read_msgpack(s)
+        tm.assert_frame_equal(result, df)
+
+        # the float block is a view on the string
+        values = result._data.get_numeric_data().blocks[0].values
+        self.assertFalse(values.flags.owndata)
+        self.assertFalse(values.flags.writeable)
+
+        result = read_msgpack(compat.BytesIO(s))
+        tm.assert_frame_equal(result, df)
+
+        dfs = [df, df.iloc[:0], df * 1]
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, *dfs, zero_copy=True)
+            for i, result in enumerate(read_msgpack(p, iterator=True)):
+                tm.assert_frame_equal(result, dfs[i])
+
+            with open(p, 'rb') as fh:
+                m = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            result = read_msgpack(m)
+            for i in range(len(dfs)):
+                tm.assert_frame_equal(result[i], dfs[i])
+            del result, m
+
+        self.assertRaises(ValueError, df.to_msgpack, None, zero_copy=True,
+                          compress='zlib')
+
+    def test_shared_memory(self):
+
+        df = DataFrame({'a': np.random.randn(10),
+                        'b': np.arange(10),
+                        'c': list('abcdefghij')})
+        handle = df.to_shared_memory()
+        try:
+            handle = compat.cPickle.loads(compat.cPickle.dumps(handle))
+            result = pandas.from_shared_memory(handle)
+            tm.assert_frame_equal(result, df)
+
+            values = result._data.get_numeric_data().blocks[0].values
+            self.assertFalse(values.flags.owndata)
+            self.assertFalse(values.flags.writeable)
+        finally:
+            handle.unlink()
+
+        # still mapped
+        tm.assert_frame_equal(result, df)
+
+        s = Series(np.arange(5.))
+        with ensure_clean(self.path) as p:
+            s.to_shared_memory(p)
+            result = pandas.from_shared_memory(p)
+            tm.assert_series_equal(result, s)
+            del result
+
     def test_iterator_with_string_io(self):
 
         dfs = [ DataFrame(np.random.randn(10,2)) for i in range(5) ]
@@ -278,6 +278,22 @@ c,3
         tm.assert_isinstance(result, Series)
         tm.assert_series_equal(result, expected)
 
+    def test_compact(self):
+        data = """\
+a,b,c,d
+1,1.5,x,foo
+2,2.5,x,bar
+300,3.5,x,baz
+4,4.5,x,qux
+"""
+        result = self.read_csv(StringIO(data), compact=True)
+        expected = self.read_csv(StringIO(data)).optimize_memory()
+        tm.assert_frame_equal(result, expected)
+        self.assertEqual(result['a'].dtype, np.int16)
+        self.assertEqual(result['b'].dtype, np.float32)
+        self.assertEqual(result['c'].dtype, 'category')
+        self.assertEqual(result['d'].dtype, np.object_)
+
     def test_squeeze_no_view(self):
 
         # GH 8217
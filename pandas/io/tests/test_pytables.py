@@ -3280,6 +3280,42 @@ class TestHDFStore(tm.TestCase):
             #result = concat(results)
             #tm.assert_frame_equal(expected, result)
 
+    def test_resample(self):
+
+        with ensure_clean_store(self.path) as store:
+
+            df = tm.makeTimeDataFrame(5000, 'T')
+            df.iloc[::7] = np.nan
+            _maybe_remove(store, 'df')
+            store.append('df', df, data_columns=['A'])
+
+            for how in ['mean', 'sum', 'ohlc', 'first', 'last', 'count']:
+                expected = df.resample('17T', how=how)
+                result = store.resample('df', '17T', how=how, chunksize=333)
+                tm.assert_frame_equal(result, expected)
+
+            expected = df[['A', 'B']].resample('H', how='max',
+                                                closed='right',
+                                                label='right')
+            result = store.resample('df', 'H', how='max', columns=['A', 'B'],
+                                    closed='right', label='right',
+                                    chunksize=1000)
+            tm.assert_frame_equal(result, expected)
+
+            selected = store.select('df', where='A > 0')
+            expected = selected.resample('H', how='median')
+            result = store.resample('df', 'H', how='median', where='A > 0',
+                                    chunksize=100)
+            tm.assert_frame_equal(result, expected)
+
+        with ensure_clean_path(self.path) as path:
+
+            df = tm.makeTimeDataFrame(500)
+            df.to_hdf(path, 'df_non_table')
+            with get_store(path) as store:
+                self.assertRaises(TypeError, store.resample, 'df_non_table',
+                                  'M')
+
     def test_select_iterator_complete_8014(self):
 
         # GH 8014
@@ -4004,6 +4040,119 @@ class TestHDFStore(tm.TestCase):
             self.assertRaises(ValueError, store.select_as_multiple,
                               ['df1','df3'], where=['A>0', 'B>0'], selector='df1')
 
+    def test_select_many(self):
+
+        dfs = dict(('df%d' % i, tm.makeTimeDataFrame()) for i in range(4))
+        keys = sorted(dfs)
+
+        with ensure_clean_path(self.path) as path:
+
+            with HDFStore(path, mode='w') as store:
+                for k in keys:
+                    store.append(k, dfs[k], data_columns=['A'])
+                store.put('fixed', dfs['df0'])
+
+                self.assertRaises(TypeError, store.select_many, 'df0')
+
+                # workers need a read-only store
+                self.assertRaises(ValueError, store.select_many, keys,
+                                  workers=2)
+
+            with HDFStore(path, mode='r') as store:
+                value = 0
+                where = 'A > value'
+                for workers in [None, 2]:
+                    result = store.select_many(keys, where=where,
+                                               columns=['A', 'B'],
+                                               workers=workers)
+                    self.assertEqual(sorted(result), keys)
+                    for k in keys:
+                        expected = dfs[k][dfs[k].A > 0][['A', 'B']]
+                        tm.assert_frame_equal(result[k], expected)
+
+                    result = store.select_many(keys + ['fixed'],
+                                               workers=workers, concat=True)
+                    expected = concat([dfs[k] for k in keys] + [dfs['df0']],
+                                      keys=keys + ['fixed'])
+                    tm.assert_frame_equal(result, expected)
+
+                    self.assertRaises(TypeError, store.select_many,
+                                      ['df0', 'fixed'], where=where,
+                                      workers=workers)
+
+                    # start/stop bound the where
+                    result = store.select_many(keys, where=where,
+                                               start=5, stop=20,
+                                               workers=workers)
+                    for k in keys:
+                        expected = dfs[k].iloc[5:20]
+                        expected = expected[expected.A > 0]
+                        tm.assert_frame_equal(result[k], expected)
+
+                    # a negative stop, as in the serial path
+                    result = store.select_many(keys, where=where, stop=-1,
+                                               workers=workers)
+                    for k in keys:
+                        expected = dfs[k].iloc[:-1]
+                        expected = expected[expected.A > 0]
+                        tm.assert_frame_equal(result[k], expected)
+
+                self.assertRaises(ValueError, store.select_many, keys,
+                                  workers=2, iterator=True)
+                self.assertRaises(ValueError, store.select_many, keys,
+                                  workers=2, chunksize=10)
+
+    def test_query_cache(self):
+
+        df = tm.makeTimeDataFrame()
+        df2 = tm.makeTimeDataFrame()
+
+        with ensure_clean_path(self.path) as path:
+
+            with HDFStore(path, mode='w') as store:
+                self.assertIsNone(store.query_cache)
+                store.append('df', df, data_columns=['A'])
+                store.select('df', where='A > 0')
+
+            with HDFStore(path, mode='a', query_cache=True) as store:
+                cache = store.query_cache
+
+                value = 0
+                for i in range(3):
+                    result = store.select('df', where='A > value',
+                                          columns=['A', 'B'])
+                    tm.assert_frame_equal(result, df[df.A > 0][['A', 'B']])
+                self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+                coords = store.select_as_coordinates('df', 'A > value')
+                self.assert_numpy_array_equal(
+                    coords, np.nonzero((df.A > 0).values)[0])
+                self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+                # a different value of the variable is a different selection
+                value = 0.5
+                result = store.select('df', where='A > value')
+                tm.assert_frame_equal(result, df[df.A > 0.5])
+                self.assertEqual((cache.hits, cache.misses), (3, 2))
+                self.assertEqual(len(cache), 2)
+
+                # writing to the key drops its selections
+                store.append('df', df2)
+                self.assertEqual(len(cache), 0)
+                expected = concat([df, df2])
+                result = store.select('df', where='A > 0')
+                tm.assert_frame_equal(result, expected[expected.A > 0])
+
+                store.remove('df', where='A > 0')
+                self.assertEqual(len(cache), 0)
+                result = store.select('df', where='A > 0')
+                self.assertEqual(len(result), 0)
+
+                store.put('df', df, format='table', data_columns=['A'])
+                result = store.select('df', where='A > 0')
+                tm.assert_frame_equal(result, df[df.A > 0])
+                self.assertEqual(cache.misses, 6)
+
     def test_nan_selection_bug_4858(self):
 
         # GH 4858; nan selection bug, only works for pytables >= 3.1
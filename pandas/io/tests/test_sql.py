@@ -29,7 +29,7 @@ import numpy as np
 from datetime import datetime, date, time
 
 from pandas import DataFrame, Series, Index, MultiIndex, isnull, concat
-from pandas import date_range, to_datetime, to_timedelta
+from pandas import date_range, period_range, to_datetime, to_timedelta
 import pandas.compat as compat
 from pandas.compat import StringIO, range, lrange, string_types
 from pandas.core.datetools import format as date_format
@@ -693,6 +693,34 @@ class _TestSQLApi(PandasSQLTest):
 
             tm.assert_frame_equal(res1, res3)
 
+    def test_chunksize_read_dtypes(self):
+        # a chunk of NULLs in an integer column is float like the others
+        sql.execute("CREATE TABLE test_chunk_dtypes (a INTEGER, b REAL)",
+                    self.conn)
+        for a, b in [(1, 1.5), (2, 2.5), (3, None), (None, None)]:
+            sql.execute("INSERT INTO test_chunk_dtypes VALUES (?, ?)",
+                        self.conn, params=[a, b])
+
+        chunks = list(sql.read_sql_query("SELECT * FROM test_chunk_dtypes",
+                                         self.conn, chunksize=2))
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(chunks[1]['a'].dtype, np.float64)
+        for chunk in chunks:
+            self.assertEqual(chunk['b'].dtype, np.float64)
+
+        if self.mode == 'sqlalchemy':
+            # the schema says that 'a' is a nullable integer, so it is float
+            # in every chunk
+            chunks = list(sql.read_sql_table("test_chunk_dtypes", self.conn,
+                                             chunksize=2))
+            self.assertEqual(len(chunks), 2)
+            for chunk in chunks:
+                self.assertEqual(chunk['a'].dtype, np.float64)
+                self.assertEqual(chunk['b'].dtype, np.float64)
+            tm.assert_frame_equal(
+                concat(chunks, ignore_index=True),
+                sql.read_sql_table("test_chunk_dtypes", self.conn))
+
     def test_categorical(self):
         # GH8624
         # test that categorical gets written correctly as dense column
@@ -725,6 +753,78 @@ class TestSQLApi(_TestSQLApi):
         else:
             raise nose.SkipTest('SQLAlchemy not installed')
 
+    def test_read_table_partitioned(self):
+        n = 100
+        df = DataFrame({'id': np.arange(n) * 3,
+                        'value': np.random.randn(n),
+                        'name': ['a', 'b', 'c', 'd'] * (n // 4)})
+        df.loc[5, 'id'] = np.nan
+
+        with tm.ensure_clean() as name:
+            engine = sqlalchemy.create_engine('sqlite:///' + name)
+            df.to_sql('test_partitioned', engine, index=False)
+            expected = sql.read_sql_table('test_partitioned', engine)
+
+            for num_partitions in [1, 3, 7, 500]:
+                result = sql.read_sql_table(
+                    'test_partitioned', engine, partition_column='id',
+                    num_partitions=num_partitions)
+                result = result.sort('value').reset_index(drop=True)
+                tm.assert_frame_equal(
+                    result, expected.sort('value').reset_index(drop=True))
+
+            from multiprocessing.pool import ThreadPool
+            pool = ThreadPool(2)
+            result = sql.read_sql_table(
+                'test_partitioned', engine, index_col='value',
+                columns=['name'], partition_column='value', num_partitions=4,
+                pool=pool)
+            pool.close()
+            tm.assert_frame_equal(
+                result.sort_index(),
+                expected.set_index('value')[['name']].sort_index())
+
+            self.assertRaises(ValueError, sql.read_sql_table,
+                              'test_partitioned', engine,
+                              partition_column='name', num_partitions=2)
+            self.assertRaises(ValueError, sql.read_sql_table,
+                              'test_partitioned', engine,
+                              partition_column='id', num_partitions=0)
+            self.assertRaises(ValueError, sql.read_sql_table,
+                              'test_partitioned', engine, chunksize=10,
+                              partition_column='id', num_partitions=2)
+            engine.dispose()
+
+    def test_read_table_partitioned_threads(self):
+        # the threads are bounded by the connections of the engine's pool
+        with tm.ensure_clean() as name:
+            engine = sqlalchemy.create_engine('sqlite:///' + name)
+            self.assertTrue(sql._read_threads(engine, 500) <=
+                            sql._MAX_READ_THREADS)
+            self.assertEqual(sql._read_threads(engine, 1), 1)
+            engine.dispose()
+
+            engine = sqlalchemy.create_engine(
+                'sqlite:///' + name, poolclass=sqlalchemy.pool.QueuePool,
+                pool_size=2, max_overflow=1, pool_timeout=5)
+            self.assertEqual(sql._read_threads(engine, 500), 3)
+
+            df = DataFrame({'id': np.arange(100), 'value': np.arange(100.)})
+            df.to_sql('test_partitioned', engine, index=False)
+            result = sql.read_sql_table('test_partitioned', engine,
+                                        partition_column='id',
+                                        num_partitions=50)
+            tm.assert_frame_equal(result.sort('id').reset_index(drop=True),
+                                  df)
+            engine.dispose()
+
+    def test_partition_bounds(self):
+        self.assertEqual(sql._partition_bounds(0, 10, 3), [0, 3, 6, 10])
+        self.assertEqual(sql._partition_bounds(0, 2, 5), [0, 1, 2])
+        self.assertEqual(sql._partition_bounds(4, 4, 2), [4, 4])
+        self.assertEqual(sql._partition_bounds(0., 1., 4),
+                         [0., 0.25, 0.5, 0.75, 1.])
+
     def test_read_table_columns(self):
         # test columns argument in read_table
         sql.to_sql(self.test_frame1, 'test_frame', self.conn)
@@ -809,6 +909,26 @@ class TestSQLApi(_TestSQLApi):
         table = sql.SQLTable("test_type", db, frame=df)
         self.assertTrue(isinstance(table.table.c['time'].type, sqltypes.DateTime))
 
+    def test_insert_data_index_values(self):
+        # index levels are written as reset_index casts them
+        db = sql.SQLDatabase(self.conn)
+
+        idx = date_range('2013-01-01 09:00', periods=2, tz='US/Eastern',
+                         name='time')
+        df = DataFrame({'A': [1, 2]}, index=idx)
+        table = sql.SQLTable('test_tz_index', db, frame=df)
+        data = table.insert_data()
+        self.assertEqual(data[0], list(idx.asobject))
+        self.assertEqual(data[0][0].hour, 9)
+        self.assertEqual(str(data[0][0].tz), 'US/Eastern')
+
+        idx = period_range('2013-01', periods=2, freq='M', name='period')
+        df = DataFrame({'A': [1, 2]}, index=idx)
+        table = sql.SQLTable('test_period_index', db, frame=df)
+        data = table.insert_data()
+        self.assertEqual(data[0], list(idx.asobject))
+        self.assertEqual(data[1], [1, 2])
+
 
 class TestSQLiteFallbackApi(_TestSQLApi):
     """
@@ -839,6 +959,37 @@ class TestSQLiteFallbackApi(_TestSQLApi):
 
         tm.assert_frame_equal(self.test_frame3, result)
 
+    def test_to_sql_bulk_insert(self):
+        # rows are converted and inserted in pieces, nulls become NULL
+        n = 25
+        df = DataFrame({'A': np.arange(n, dtype='int64'),
+                        'B': np.random.randn(n),
+                        'C': ['foo', None, 'bar', 'baz', None] * 5,
+                        'D': date_range('20130101', periods=n)},
+                       index=Index(np.arange(n) * 2, name='idx'))
+        df.loc[::3, 'B'] = np.nan
+        df.loc[::4, 'D'] = np.nan
+
+        original = sql._INSERT_CONVERT_ROWS
+        sql._INSERT_CONVERT_ROWS = 4
+        try:
+            for chunksize in [None, 7]:
+                with tm.ensure_clean() as name:
+                    conn = self.connect(name)
+                    sql.to_sql(df, 'test_bulk', conn, chunksize=chunksize)
+                    result = sql.read_sql_query('SELECT * FROM test_bulk',
+                                                conn, index_col='idx',
+                                                parse_dates=['D'])
+                    conn.close()
+                tm.assert_frame_equal(result, df)
+        finally:
+            sql._INSERT_CONVERT_ROWS = original
+
+    def test_to_sql_duplicate_index_name(self):
+        df = DataFrame({'A': [1, 2]}, index=Index([0, 1], name='A'))
+        with tm.assertRaisesRegexp(ValueError, 'duplicate name'):
+            sql.to_sql(df, 'test_dup', self.conn)
+
     def test_read_sql_delegate(self):
         iris_frame1 = sql.read_sql_query("SELECT * FROM iris", self.conn)
         iris_frame2 = sql.read_sql("SELECT * FROM iris", self.conn)
@@ -973,6 +1124,32 @@ class _TestSQLAlchemy(PandasSQLTest):
     def test_to_sql_append(self):
         self._to_sql_append()
 
+    def test_to_sql_bulk_insert(self):
+        # rows are converted and inserted in pieces, with statements of
+        # several rows where the dialect has them
+        n = 25
+        df = DataFrame({'A': np.arange(n, dtype='int64'),
+                        'B': np.random.randn(n),
+                        'C': ['foo', None, 'bar', 'baz', None] * 5})
+        df.loc[::3, 'B'] = np.nan
+
+        originals = (sql._INSERT_CONVERT_ROWS, sql._MAX_INSERT_PARAMS,
+                     sql._use_multi_values)
+        sql._INSERT_CONVERT_ROWS = 4
+        sql._MAX_INSERT_PARAMS = 6
+        try:
+            for multi_values in [False, True]:
+                sql._use_multi_values = lambda dialect, m=multi_values: (
+                    m and dialect.supports_multivalues_insert)
+                for chunksize in [None, 7]:
+                    df.to_sql('test_bulk', self.conn, index=False,
+                              if_exists='replace', chunksize=chunksize)
+                    result = sql.read_sql_table('test_bulk', self.conn)
+                    tm.assert_frame_equal(result, df)
+        finally:
+            (sql._INSERT_CONVERT_ROWS, sql._MAX_INSERT_PARAMS,
+             sql._use_multi_values) = originals
+
     def test_create_table(self):
         temp_conn = self.connect()
         temp_frame = DataFrame(
@@ -916,6 +916,20 @@ def max_len_string_array(ndarray arr):
 
     return m
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def memory_usage_of_objects(ndarray[object, ndim=1] arr):
+    """ return the memory usage of the objects of a 1-dim object array in
+    bytes, not including the pointers held by the array """
+    cdef:
+        Py_ssize_t i, n = len(arr)
+        int64_t s = 0
+
+    for i from 0 <= i < n:
+        s += arr[i].__sizeof__()
+
+    return s
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def string_array_replace_from_nan_rep(ndarray[object, ndim=1] arr, object nan_rep, object replace = None):
@@ -98,11 +98,11 @@ cdef extern from "datetime/np_datetime.h":
                                                    pandas_datetimestruct *d)
     void pandas_datetime_to_datetimestruct(npy_datetime val,
                                            PANDAS_DATETIMEUNIT fr,
-                                           pandas_datetimestruct *result)
+                                           pandas_datetimestruct *result) nogil
     int days_per_month_table[2][12]
 
-    int dayofweek(int y, int m, int d)
-    int is_leapyear(int64_t year)
+    int dayofweek(int y, int m, int d) nogil
+    int is_leapyear(int64_t year) nogil
     PANDAS_DATETIMEUNIT get_datetime64_unit(object o)
 
 cdef extern from "datetime/np_datetime_strings.h":
@@ -1646,27 +1646,59 @@ def group_ohlc_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
 
     N, K = (<object> values).shape
 
-    if out.shape[1] != 4:
-        raise ValueError('Output array must have 4 columns')
+    if out.shape[1] != 4 * K:
+        raise ValueError('Output array must have 4 columns for each '
+                         'column of values')
 
     NA = np.nan
 
-    b = 0
-    if K > 1:
-        raise NotImplementedError
-    else:
+    # open, high, low and close of column j go to out[:, 4 * j:4 * j + 4]
+    for j in range(K):
+        b = 0
+        got_first = 0
         for i in range(N):
             while b < ngroups - 1 and i >= bins[b]:
                 if not got_first:
-                    out[b, 0] = NA
-                    out[b, 1] = NA
-                    out[b, 2] = NA
-                    out[b, 3] = NA
+                    out[b, 4 * j] = NA
+                    out[b, 4 * j + 1] = NA
+                    out[b, 4 * j + 2] = NA
+                    out[b, 4 * j + 3] = NA
                 else:
-                    out[b, 0] = vopen
-                    out[b, 1] = vhigh
-                    out[b, 2] = vlow
-                    out[b, 3] = vclose
+                    out[b, 4 * j] = vopen
+                    out[b, 4 * j + 1] = vhigh
+                    out[b, 4 * j + 2] = vlow
+                    out[b, 4 * j + 3] = vclose
+                b += 1
+                got_first = 0
+
+            if j == 0:
+                counts[b] += 1
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                if not got_first:
+                    got_first = 1
+                    vopen = val
+                    vlow = val
+                    vhigh = val
+                else:
+                    if val < vlow:
+                        vlow = val
+                    if val > vhigh:
+                        vhigh = val
+                vclose = val
+
+        if not got_first:
+            out[b, 4 * j] = NA
+            out[b, 4 * j + 1] = NA
+            out[b, 4 * j + 2] = NA
+            out[b, 4 * j + 3] = NA
+        else:
+            out[b, 4 * j] = vopen
+            out[b, 4 * j + 1] = vhigh
+            out[b, 4 * j + 2] = vlow
+            out[b, 4 * j + 3] = vclose
                 b += 1
                 got_first = 0
 
@@ -1132,6 +1132,396 @@ def to_object_array_tuples(list rows):
     return result
 
 
+# kinds of the values seen by a _ColumnBuilder
+cdef enum:
+    _KIND_NULL = 0
+    _KIND_BOOL = 1
+    _KIND_INT = 2
+    _KIND_FLOAT = 3
+
+
+cdef class _ColumnBuilder:
+    """
+    Accumulate the values of a column one at a time into typed buffers,
+    inferring the dtype as maybe_convert_objects would: bool, int64 or
+    float64 (None becoming NaN), falling back to an object array of the
+    values as soon as they cannot all be held in one of those.
+
+    A column declared to be float (hint _KIND_FLOAT) stays float64 if it
+    only holds ints, one declared int (hint _KIND_INT) becomes float64 if
+    it only holds None.
+    """
+
+    cdef:
+        Py_ssize_t n, capacity
+        int hint
+        bint infer, is_object
+        bint seen_null, seen_bool, seen_int, seen_float
+        ndarray kinds, bools, ints, floats
+        uint8_t *kinds_data
+        uint8_t *bools_data
+        int64_t *ints_data
+        float64_t *floats_data
+        list objects
+
+    def __init__(self, Py_ssize_t capacity=0, bint infer=True,
+                 int hint=_KIND_NULL):
+        self.n = 0
+        self.capacity = max(capacity, 16)
+        self.hint = hint
+        self.infer = infer
+        self.is_object = not infer
+        self.seen_null = self.seen_bool = self.seen_int = self.seen_float = 0
+        self.objects = [] if self.is_object else None
+        if not self.is_object:
+            self.kinds = np.empty(self.capacity, dtype=np.uint8)
+            self.kinds_data = <uint8_t*> self.kinds.data
+            if hint == _KIND_FLOAT:
+                self._allocate_floats()
+
+    cdef _resize(self):
+        self.capacity = self.capacity * 2
+        self.kinds.resize(self.capacity, refcheck=False)
+        self.kinds_data = <uint8_t*> self.kinds.data
+        if self.bools is not None:
+            self.bools.resize(self.capacity, refcheck=False)
+            self.bools_data = <uint8_t*> self.bools.data
+        if self.ints is not None:
+            self.ints.resize(self.capacity, refcheck=False)
+            self.ints_data = <int64_t*> self.ints.data
+        if self.floats is not None:
+            self.floats.resize(self.capacity, refcheck=False)
+            self.floats_data = <float64_t*> self.floats.data
+
+    cdef _allocate_floats(self):
+        cdef Py_ssize_t i
+
+        self.floats = np.empty(self.capacity, dtype=np.float64)
+        self.floats_data = <float64_t*> self.floats.data
+        for i in range(self.n):
+            if self.kinds_data[i] == _KIND_INT:
+                self.floats_data[i] = <float64_t> self.ints_data[i]
+            else:
+                self.floats_data[i] = NaN
+
+    cdef _to_objects(self):
+        """ switch to holding the values as objects """
+        cdef:
+            Py_ssize_t i
+            uint8_t kind
+            list objects = []
+
+        for i in range(self.n):
+            kind = self.kinds_data[i]
+            if kind == _KIND_NULL:
+                objects.append(None)
+            elif kind == _KIND_BOOL:
+                objects.append(self.bools_data[i] != 0)
+            elif kind == _KIND_INT:
+                objects.append(self.ints_data[i])
+            else:
+                objects.append(self.floats_data[i])
+
+        self.objects = objects
+        self.is_object = 1
+        self.kinds = self.bools = self.ints = self.floats = None
+
+    cdef append(self, object val):
+        cdef:
+            Py_ssize_t i = self.n
+            int64_t ival
+
+        if not self.is_object:
+            if i == self.capacity:
+                self._resize()
+
+            if val is None:
+                if self.seen_bool:
+                    self._to_objects()
+                else:
+                    if self.floats is None:
+                        self._allocate_floats()
+                    self.floats_data[i] = NaN
+                    self.kinds_data[i] = _KIND_NULL
+                    self.seen_null = 1
+            elif util.is_bool_object(val):
+                if self.seen_null or self.seen_int or self.seen_float:
+                    self._to_objects()
+                else:
+                    if self.bools is None:
+                        self.bools = np.empty(self.capacity, dtype=np.uint8)
+                        self.bools_data = <uint8_t*> self.bools.data
+                    self.bools_data[i] = 1 if val else 0
+                    self.kinds_data[i] = _KIND_BOOL
+                    self.seen_bool = 1
+            elif self.seen_bool:
+                self._to_objects()
+            elif util.is_float_object(val):
+                if self.floats is None:
+                    self._allocate_floats()
+                self.floats_data[i] = val
+                self.kinds_data[i] = _KIND_FLOAT
+                self.seen_float = 1
+            elif (util.is_integer_object(val) and
+                  not util.is_datetime64_object(val) and
+                  not is_timedelta(val)):
+                try:
+                    ival = val
+                except OverflowError:
+                    self._to_objects()
+                else:
+                    if self.ints is None:
+                        self.ints = np.empty(self.capacity, dtype=np.int64)
+                        self.ints_data = <int64_t*> self.ints.data
+                    self.ints_data[i] = ival
+                    if self.floats is not None:
+                        self.floats_data[i] = <float64_t> ival
+                    self.kinds_data[i] = _KIND_INT
+                    self.seen_int = 1
+            else:
+                self._to_objects()
+
+        if self.is_object:
+            self.objects.append(val)
+        self.n += 1
+
+    cdef ndarray finish(self):
+        if not self.is_object:
+            if self.seen_bool:
+                return self.bools[:self.n].copy().view(np.bool_)
+            elif (self.seen_float or self.hint == _KIND_FLOAT or
+                  (self.seen_null and (self.seen_int or
+                                       self.hint == _KIND_INT))):
+                if self.floats is None:
+                    self._allocate_floats()
+                return self.floats[:self.n].copy()
+            elif self.seen_int:
+                return self.ints[:self.n].copy()
+            self._to_objects()
+        return list_to_object_array(self.objects)
+
+
+cdef int _dtype_hint(object dtype):
+    if dtype is None:
+        return _KIND_NULL
+    kind = np.dtype(dtype).kind
+    if kind == 'f':
+        return _KIND_FLOAT
+    elif kind in 'iu':
+        return _KIND_INT
+    return _KIND_NULL
+
+
+def rows_to_arrays(object rows, Py_ssize_t size_hint=0, bint infer=True,
+                   object dtypes=None):
+    """
+    Convert an iterable of tuples or lists into a list of arrays, one per
+    column, in a single pass and without building a 2-d object array.
+
+    Columns of bools, ints or floats (None becoming NaN) are returned as
+    bool, int64 or float64 arrays, other columns as object arrays. Short
+    rows are padded with None. With infer=False all columns are object.
+
+    dtypes optionally gives the expected dtype of each column (or None):
+    columns expected to be float are float64 even if they only hold ints,
+    columns expected to be int are float64 if they only hold None.
+    """
+    cdef:
+        Py_ssize_t j, k, n = 0
+        list builders = []
+        list hints = []
+        _ColumnBuilder builder
+        object row
+
+    if dtypes is not None:
+        hints = [_dtype_hint(dtype) for dtype in dtypes]
+
+    for row in rows:
+        if not isinstance(row, (tuple, list)):
+            row = tuple(row)
+        k = len(row)
+
+        while len(builders) < k:
+            j = len(builders)
+            builder = _ColumnBuilder(size_hint, infer,
+                                     hints[j] if j < len(hints) else _KIND_NULL)
+            for j in range(n):
+                builder.append(None)
+            builders.append(builder)
+
+        for j in range(k):
+            (<_ColumnBuilder> builders[j]).append(row[j])
+        for j in range(k, len(builders)):
+            (<_ColumnBuilder> builders[j]).append(None)
+        n += 1
+
+    return [(<_ColumnBuilder> builder).finish() for builder in builders]
+
+
+def dicts_to_arrays(object rows, object columns=None, Py_ssize_t size_hint=0,
+                    bint infer=True):
+    """
+    Convert an iterable of dicts into a list of arrays, one per column, in a
+    single pass and without building a 2-d object array. Missing keys are
+    NaN.
+
+    If columns is None, the columns are all the keys of the dicts, sorted if
+    possible.
+
+    Returns
+    -------
+    arrays, columns
+    """
+    cdef:
+        Py_ssize_t j, n = 0
+        list builders = []
+        list keys
+        dict positions = {}
+        bint discover = columns is None
+        _ColumnBuilder builder
+        object row, key, onan = np.nan
+
+    keys = [] if discover else list(columns)
+    for key in keys:
+        builders.append(_ColumnBuilder(size_hint, infer))
+
+    for row in rows:
+        # dict subclasses and other mappings may define __missing__ or
+        # a different get
+        if type(row) is not dict:
+            row = dict(row)
+
+        if discover:
+            for key in row:
+                if key not in positions:
+                    positions[key] = len(keys)
+                    keys.append(key)
+                    builder = _ColumnBuilder(size_hint, infer)
+                    for j in range(n):
+                        builder.append(onan)
+                    builders.append(builder)
+
+        for j in range(len(keys)):
+            (<_ColumnBuilder> builders[j]).append(
+                (<dict> row).get(keys[j], onan))
+        n += 1
+
+    arrays = [(<_ColumnBuilder> builder).finish() for builder in builders]
+
+    if discover:
+        try:
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+        except Exception:
+            pass
+        else:
+            keys = [keys[j] for j in order]
+            arrays = [arrays[j] for j in order]
+
+    return arrays, keys
+
+
+cdef int _flatten_row(dict row, dict tree, object prefix, object sep,
+                      list builders, list keys, dict positions, Py_ssize_t n,
+                      Py_ssize_t size_hint) except -1:
+    """
+    Append the leaf values of the nested dict row to the builders of their
+    key paths. tree maps each key to a [column position or -1, subtree or
+    None, name] node, so that the names of the key paths are only built the
+    first time they are seen. positions maps the names to the column
+    positions, so that key paths with the same name (e.g. a top level key
+    'a.b' and the path 'a', 'b') share a column.
+    """
+    cdef:
+        Py_ssize_t j
+        list node
+        _ColumnBuilder builder
+        object key, val, onan = np.nan
+
+    for key, val in row.items():
+        node = tree.get(key)
+        if node is None:
+            # top level keys which are not flattened keep their type
+            if prefix is None:
+                name = key
+            else:
+                name = prefix + sep + str(key)
+            node = [-1, None, name]
+            tree[key] = node
+
+        if isinstance(val, dict):
+            if node[1] is None:
+                node[1] = {}
+            _flatten_row(val, node[1],
+                         str(key) if prefix is None else node[2], sep,
+                         builders, keys, positions, n, size_hint)
+            continue
+
+        if node[0] == -1:
+            if node[2] in positions:
+                node[0] = positions[node[2]]
+            else:
+                node[0] = positions[node[2]] = len(builders)
+                builder = _ColumnBuilder(size_hint)
+                for j in range(n):
+                    builder.append(onan)
+                builders.append(builder)
+                keys.append(node[2])
+
+        builder = builders[node[0]]
+        if builder.n > n:
+            # a flattened name given twice in a row, the first value is kept
+            continue
+        while builder.n < n:
+            builder.append(onan)
+        builder.append(val)
+
+    return 0
+
+
+def flatten_dicts_to_arrays(object rows, object sep='.',
+                            Py_ssize_t size_hint=0):
+    """
+    Flatten an iterable of nested dicts into a list of arrays, one per path
+    of keys to a non-dict value, the columns being named by the keys of the
+    path joined with sep (as nested_to_record names them). The values are
+    written to typed column buffers as the rows are walked, without
+    building a flat dict per row. Missing values are NaN.
+
+    Returns
+    -------
+    arrays, columns (sorted if possible)
+    """
+    cdef:
+        Py_ssize_t n = 0
+        list builders = [], keys = []
+        dict tree = {}, positions = {}
+        _ColumnBuilder builder
+        object row, onan = np.nan
+
+    for row in rows:
+        if type(row) is not dict:
+            row = dict(row)
+        _flatten_row(row, tree, None, sep, builders, keys, positions, n,
+                     size_hint)
+        n += 1
+
+    arrays = []
+    for builder in builders:
+        while builder.n < n:
+            builder.append(onan)
+        arrays.append(builder.finish())
+
+    try:
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+    except Exception:
+        pass
+    else:
+        keys = [keys[j] for j in order]
+        arrays = [arrays[j] for j in order]
+
+    return arrays, keys
+
+
 def fast_multiget(dict mapping, ndarray keys, default=np.nan):
     cdef:
         Py_ssize_t i, n = len(keys)
@@ -244,6 +244,26 @@ def period_ordinal(int y, int m, int d, int h, int min, int s, int us, int ps, i
 
     return get_period_ordinal(y, m, d, h, min, s, us, ps, freq)
 
+def periodarr_from_fields(ndarray[int64_t] year, ndarray[int64_t] month,
+                          ndarray[int64_t] day, ndarray[int64_t] hour,
+                          ndarray[int64_t] minute, ndarray[int64_t] second,
+                          int freq):
+    """
+    Compute an array of period ordinals from equal-length arrays of date
+    fields in a single pass.
+    """
+    cdef:
+        Py_ssize_t i, n = len(year)
+        ndarray[int64_t] out
+
+    out = np.empty(n, dtype=np.int64)
+
+    for i in range(n):
+        out[i] = get_period_ordinal(year[i], month[i], day[i], hour[i],
+                                    minute[i], second[i], 0, 0, freq)
+
+    return out
+
 
 cpdef int64_t period_ordinal_to_dt64(int64_t ordinal, int freq):
     cdef:
@@ -268,46 +288,90 @@ cpdef int64_t period_ordinal_to_dt64(int64_t ordinal, int freq):
 
     return pandas_datetimestruct_to_datetime(PANDAS_FR_ns, &dts)
 
-def period_format(int64_t value, int freq, object fmt=None):
+cdef object _period_default_fmt(int freq):
+    """
+    Return the default strftime format for a frequency, or None for weekly
+    periods which are rendered as a start/end range.
+    """
     cdef:
         int freq_group
 
+    freq_group = (freq // 1000) * 1000
+    if freq_group == 1000: # FR_ANN
+        return b'%Y'
+    elif freq_group == 2000: # FR_QTR
+        return b'%FQ%q'
+    elif freq_group == 3000: # FR_MTH
+        return b'%Y-%m'
+    elif freq_group == 4000: # WK
+        return None
+    elif (freq_group == 5000 # BUS
+          or freq_group == 6000): # DAY
+        return b'%Y-%m-%d'
+    elif freq_group == 7000: # HR
+        return b'%Y-%m-%d %H:00'
+    elif freq_group == 8000: # MIN
+        return b'%Y-%m-%d %H:%M'
+    elif freq_group == 9000: # SEC
+        return b'%Y-%m-%d %H:%M:%S'
+    elif freq_group == 10000: # MILLISEC
+        return b'%Y-%m-%d %H:%M:%S.%l'
+    elif freq_group == 11000: # MICROSEC
+        return b'%Y-%m-%d %H:%M:%S.%u'
+    elif freq_group == 12000: # NANOSEC
+        return b'%Y-%m-%d %H:%M:%S.%n'
+    else:
+        raise ValueError('Unknown freq: %d' % freq)
+
+cdef object _period_week_format(int64_t value, int freq):
+    left = period_asfreq(value, freq, 6000, 0)
+    right = period_asfreq(value, freq, 6000, 1)
+    return '%s/%s' % (period_format(left, 6000),
+                      period_format(right, 6000))
+
+def period_format(int64_t value, int freq, object fmt=None):
     if value == iNaT:
         return repr(NaT)
 
     if fmt is None:
-        freq_group = (freq // 1000) * 1000
-        if freq_group == 1000: # FR_ANN
-            fmt = b'%Y'
-        elif freq_group == 2000: # FR_QTR
-            fmt = b'%FQ%q'
-        elif freq_group == 3000: # FR_MTH
-            fmt = b'%Y-%m'
-        elif freq_group == 4000: # WK
-            left = period_asfreq(value, freq, 6000, 0)
-            right = period_asfreq(value, freq, 6000, 1)
-            return '%s/%s' % (period_format(left, 6000),
-                              period_format(right, 6000))
-        elif (freq_group == 5000 # BUS
-              or freq_group == 6000): # DAY
-            fmt = b'%Y-%m-%d'
-        elif freq_group == 7000: # HR
-            fmt = b'%Y-%m-%d %H:00'
-        elif freq_group == 8000: # MIN
-            fmt = b'%Y-%m-%d %H:%M'
-        elif freq_group == 9000: # SEC
-            fmt = b'%Y-%m-%d %H:%M:%S'
-        elif freq_group == 10000: # MILLISEC
-            fmt = b'%Y-%m-%d %H:%M:%S.%l'
-        elif freq_group == 11000: # MICROSEC
-            fmt = b'%Y-%m-%d %H:%M:%S.%u'
-        elif freq_group == 12000: # NANOSEC
-            fmt = b'%Y-%m-%d %H:%M:%S.%n'
-        else:
-            raise ValueError('Unknown freq: %d' % freq)
+        fmt = _period_default_fmt(freq)
+        if fmt is None:
+            return _period_week_format(value, freq)
 
     return _period_strftime(value, freq, fmt)
 
+def period_format_arr(ndarray[int64_t] values, int freq, object fmt=None,
+                      object na_rep='NaT'):
+    """
+    Format an array of period ordinals to an object array of strings without
+    boxing each ordinal in a Period. NaT ordinals are rendered as na_rep.
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        ndarray[object] result
+        int64_t val
+        bint is_week = 0
+
+    result = np.empty(n, dtype=object)
+
+    if fmt is None:
+        fmt = _period_default_fmt(freq)
+        is_week = fmt is None
+
+    if fmt is not None and PyUnicode_Check(fmt):
+        fmt = fmt.encode('utf-8')
+
+    for i in range(n):
+        val = values[i]
+        if val == iNaT:
+            result[i] = na_rep
+        elif is_week:
+            result[i] = _period_week_format(val, freq)
+        else:
+            result[i] = _period_strftime(val, freq, fmt)
+
+    return result
+
 
 cdef list extra_fmts = [(b"%q", b"^`AB`^"),
                         (b"%f", b"^`CD`^"),
@@ -54,6 +54,15 @@ typedef struct __PyObjectDecoder
   npy_intp curdim;    // Current array dimension
 
   PyArray_Descr* dtype;
+
+  // records support
+  int depth;              // Nesting depth of the container being decoded
+  int recTop;             // Whether the top level container is an array
+  PyObject* recIndex;     // Position of each key in recKeys
+  PyObject* recKeys;      // Keys of the records, in order of appearance
+  PyObject* recColumns;   // List of the values of each key
+  PyObject* recMissing;   // Value of a key missing from a record (NaN)
+  Py_ssize_t recCount;    // Number of records decoded
 } PyObjectDecoder;
 
 typedef struct __NpyArrContext
@@ -92,6 +101,18 @@ JSOBJ Object_npyNewObject(void *prv, void* decoder);
 JSOBJ Object_npyEndObject(void *prv, JSOBJ obj);
 int Object_npyObjectAddKey(void *prv, JSOBJ obj, JSOBJ name, JSOBJ value);
 
+// records support, decode the objects of a top level array into a list of
+// values per key rather than a dict per object
+JSOBJ Object_recNewArray(void *prv, void* decoder);
+JSOBJ Object_recEndArray(void *prv, JSOBJ obj);
+int Object_recArrayAddItem(void *prv, JSOBJ obj, JSOBJ value);
+JSOBJ Object_recNewObject(void *prv, void* decoder);
+JSOBJ Object_recEndObject(void *prv, JSOBJ obj);
+int Object_recObjectAddKey(void *prv, JSOBJ obj, JSOBJ name, JSOBJ value);
+
+int Object_objectAddKey(void *prv, JSOBJ obj, JSOBJ name, JSOBJ value);
+int Object_arrayAddItem(void *prv, JSOBJ obj, JSOBJ value);
+
 // free the numpy context buffer
 void Npy_releaseContext(NpyArrContext* npyarr)
 {
@@ -478,6 +499,163 @@ int Object_npyObjectAddKey(void *prv, JSOBJ obj, JSOBJ name, JSOBJ value)
   return 0;
 }
 
+// pad the values of a key with NaN up to the current record
+static int Rec_padColumn(PyObjectDecoder* decoder, PyObject* column)
+{
+  while (PyList_GET_SIZE(column) < decoder->recCount)
+  {
+    if (PyList_Append(column, decoder->recMissing))
+    {
+      return 0;
+    }
+  }
+  return 1;
+}
+
+JSOBJ Object_recNewArray(void *prv, void* _decoder)
+{
+  PyObjectDecoder* decoder = (PyObjectDecoder*) _decoder;
+  PRINTMARK();
+  if (decoder->depth++ == 0)
+  {
+    // the values of the records are added to the columns directly
+    decoder->recTop = 1;
+    Py_INCREF(decoder->recColumns);
+    return decoder->recColumns;
+  }
+  return PyList_New(0);
+}
+
+JSOBJ Object_recEndArray(void *prv, JSOBJ obj)
+{
+  PyObjectDecoder* decoder = (PyObjectDecoder*) prv;
+  PyObject* ret;
+  Py_ssize_t i;
+  PRINTMARK();
+
+  decoder->depth--;
+  if (obj != decoder->recColumns)
+  {
+    return obj;
+  }
+
+  for (i = 0; i < PyList_GET_SIZE(decoder->recColumns); i++)
+  {
+    if (!Rec_padColumn(decoder, PyList_GET_ITEM(decoder->recColumns, i)))
+    {
+      Py_DECREF( (PyObject *) obj);
+      return NULL;
+    }
+  }
+
+  ret = Py_BuildValue("(OOn)", decoder->recKeys, decoder->recColumns,
+                      decoder->recCount);
+  Py_DECREF( (PyObject *) obj);
+  return ret;
+}
+
+int Object_recArrayAddItem(void *prv, JSOBJ obj, JSOBJ value)
+{
+  PyObjectDecoder* decoder = (PyObjectDecoder*) prv;
+  PRINTMARK();
+  if (obj != decoder->recColumns)
+  {
+    return Object_arrayAddItem(prv, obj, value);
+  }
+
+  if (value != decoder->recColumns)
+  {
+    PyErr_SetString(PyExc_ValueError, "records must be JSON objects");
+    Py_DECREF( (PyObject *) value);
+    return 0;
+  }
+
+  Py_DECREF( (PyObject *) value);
+  decoder->recCount++;
+  return 1;
+}
+
+JSOBJ Object_recNewObject(void *prv, void* _decoder)
+{
+  PyObjectDecoder* decoder = (PyObjectDecoder*) _decoder;
+  PRINTMARK();
+  if (decoder->depth++ == 1 && decoder->recTop)
+  {
+    // a record, its values are added to the columns
+    Py_INCREF(decoder->recColumns);
+    return decoder->recColumns;
+  }
+  return PyDict_New();
+}
+
+JSOBJ Object_recEndObject(void *prv, JSOBJ obj)
+{
+  PyObjectDecoder* decoder = (PyObjectDecoder*) prv;
+  PRINTMARK();
+  decoder->depth--;
+  return obj;
+}
+
+int Object_recObjectAddKey(void *prv, JSOBJ obj, JSOBJ name, JSOBJ value)
+{
+  PyObjectDecoder* decoder = (PyObjectDecoder*) prv;
+  PyObject *pos, *column;
+  Py_ssize_t i;
+  PRINTMARK();
+
+  if (obj != decoder->recColumns)
+  {
+    return Object_objectAddKey(prv, obj, name, value);
+  }
+
+  pos = PyDict_GetItem(decoder->recIndex, (PyObject *) name);
+  if (pos == NULL)
+  {
+    // first record with this key, the previous ones miss it
+    i = PyList_GET_SIZE(decoder->recColumns);
+    column = PyList_New(0);
+    pos = PyInt_FromSsize_t(i);
+    if (!column || !pos ||
+        PyDict_SetItem(decoder->recIndex, (PyObject *) name, pos) ||
+        PyList_Append(decoder->recKeys, (PyObject *) name) ||
+        PyList_Append(decoder->recColumns, column))
+    {
+      Py_XDECREF(column);
+      Py_XDECREF(pos);
+      return 0;
+    }
+    Py_DECREF(column);
+    Py_DECREF(pos);
+  }
+  else
+  {
+    i = PyInt_AS_LONG(pos);
+  }
+
+  column = PyList_GET_ITEM(decoder->recColumns, i);
+  if (!Rec_padColumn(decoder, column))
+  {
+    return 0;
+  }
+
+  if (PyList_GET_SIZE(column) > decoder->recCount)
+  {
+    // a key repeated in a record, the last value is kept
+    PyList_SetItem(column, decoder->recCount, (PyObject *) value);
+  }
+  else
+  {
+    if (PyList_Append(column, (PyObject *) value))
+    {
+      return 0;
+    }
+    Py_DECREF( (PyObject *) value);
+  }
+
+  Py_DECREF( (PyObject *) name);
+  return 1;
+}
+
 int Object_objectAddKey(void *prv, JSOBJ obj, JSOBJ name, JSOBJ value)
 {
   PyDict_SetItem (obj, name, value);
@@ -557,7 +735,15 @@ static void Object_releaseObject(void *prv, JSOBJ obj, void* _decoder)
   }
 }
 
-static char *g_kwlist[] = {"obj", "precise_float", "numpy", "labelled", "dtype", NULL};
+static char *g_kwlist[] = {"obj", "precise_float", "numpy", "labelled", "dtype", "records", NULL};
+
+static void Rec_releaseContext(PyObjectDecoder* decoder)
+{
+  Py_XDECREF(decoder->recIndex);
+  Py_XDECREF(decoder->recKeys);
+  Py_XDECREF(decoder->recColumns);
+  Py_XDECREF(decoder->recMissing);
+}
 
 PyObject* JSONToObj(PyObject* self, PyObject *args, PyObject *kwargs)
 {
@@ -568,7 +754,7 @@ PyObject* JSONToObj(PyObject* self, PyObject *args, PyObject *kwargs)
   JSONObjectDecoder *decoder;
   PyObjectDecoder pyDecoder;
   PyArray_Descr *dtype = NULL;
-  int numpy = 0, labelled = 0;
+  int numpy = 0, labelled = 0, records = 0;
 
   JSONObjectDecoder dec =
   {
@@ -598,10 +784,17 @@ PyObject* JSONToObj(PyObject* self, PyObject *args, PyObject *kwargs)
   pyDecoder.curdim = 0;
   pyDecoder.npyarr = NULL;
   pyDecoder.npyarr_addr = NULL;
+  pyDecoder.depth = 0;
+  pyDecoder.recTop = 0;
+  pyDecoder.recIndex = NULL;
+  pyDecoder.recKeys = NULL;
+  pyDecoder.recColumns = NULL;
+  pyDecoder.recMissing = NULL;
+  pyDecoder.recCount = 0;
 
   decoder = (JSONObjectDecoder*) &pyDecoder;
 
-  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|OiiO&", g_kwlist, &arg, &opreciseFloat, &numpy, &labelled, PyArray_DescrConverter2, &dtype))
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|OiiO&i", g_kwlist, &arg, &opreciseFloat, &numpy, &labelled, PyArray_DescrConverter2, &dtype, &records))
   {
       Npy_releaseContext(pyDecoder.npyarr);
       return NULL;
@@ -649,6 +842,32 @@ PyObject* JSONToObj(PyObject* self, PyObject *args, PyObject *kwargs)
       decoder->objectAddKey = Object_npyObjectAddKey;
     }
   }
+  else
+  if (records)
+  {
+    pyDecoder.recIndex = PyDict_New();
+    pyDecoder.recKeys = PyList_New(0);
+    pyDecoder.recColumns = PyList_New(0);
+    pyDecoder.recMissing = PyFloat_FromDouble(Py_NAN);
+    if (!pyDecoder.recIndex || !pyDecoder.recKeys || !pyDecoder.recColumns ||
+        !pyDecoder.recMissing)
+    {
+      Rec_releaseContext(&pyDecoder);
+      if (sarg != arg)
+      {
+        Py_DECREF(sarg);
+      }
+      return NULL;
+    }
+
+    decoder->prv = &pyDecoder;
+    decoder->newArray = Object_recNewArray;
+    decoder->endArray = Object_recEndArray;
+    decoder->arrayAddItem = Object_recArrayAddItem;
+    decoder->newObject = Object_recNewObject;
+    decoder->endObject = Object_recEndObject;
+    decoder->objectAddKey = Object_recObjectAddKey;
+  }
 
   ret = JSON_DecodeObject(decoder, PyString_AS_STRING(sarg), PyString_GET_SIZE(sarg));
 
@@ -657,6 +876,8 @@ PyObject* JSONToObj(PyObject* self, PyObject *args, PyObject *kwargs)
     Py_DECREF(sarg);
   }
 
+  Rec_releaseContext(&pyDecoder);
+
   if (PyErr_Occurred())
   {    
     if (ret)
@@ -201,6 +201,82 @@ class TestUnique(tm.TestCase):
 
         tm.assert_almost_equal(result, expected)
 
+class TestIsin(tm.TestCase):
+    _multiprocess_can_split_ = True
+
+    def test_ints(self):
+        comps = np.array([0, 2, 1, 5, 2, -1])
+        expected = np.array([True, True, False, False, True, False])
+
+        for values in [[0, 2], np.array([0, 2]), set([2, 0]),
+                       pd.Index([0, 2]), [0., 2., 2.5, np.nan], [0, 2, 'a']]:
+            result = algos.isin(comps, values)
+            self.assert_numpy_array_equal(result, expected)
+
+        result = algos.isin(comps.astype('int8'), [2, 300])
+        self.assert_numpy_array_equal(result, comps == 2)
+
+        result = algos.isin(np.array([True, False]), [1])
+        self.assert_numpy_array_equal(result, np.array([True, False]))
+
+    def test_floats(self):
+        comps = np.array([0., -0., 1.5, np.nan, 2.])
+        result = algos.isin(comps, [0, 2])
+        expected = np.array([True, True, False, False, True])
+        self.assert_numpy_array_equal(result, expected)
+
+        result = algos.isin(comps, [1.5, np.nan])
+        expected = np.array([False, False, True, True, False])
+        self.assert_numpy_array_equal(result, expected)
+
+        result = algos.isin(comps.astype('float32'), [1.5])
+        self.assert_numpy_array_equal(result, comps == 1.5)
+
+        # integers that float64 would round are not equal to any float
+        comps = np.array([2. ** 53, 2. ** 63, -2. ** 63])
+        result = algos.isin(comps, [2 ** 53 + 1, 2 ** 63 - 1, -2 ** 63])
+        self.assert_numpy_array_equal(result,
+                                      np.array([False, False, True]))
+        result = algos.isin(comps, [2 ** 53])
+        self.assert_numpy_array_equal(result,
+                                      np.array([True, False, False]))
+        result = pd.Series([2. ** 53]).isin([2 ** 53 + 1])
+        self.assert_numpy_array_equal(result.values, np.array([False]))
+
+    def test_objects(self):
+        comps = np.array(['a', 'b', None, 1, 'c'], dtype=object)
+        result = algos.isin(comps, ['a', 'c', 1])
+        expected = np.array([True, False, False, True, True])
+        self.assert_numpy_array_equal(result, expected)
+
+        result = algos.isin(comps, [])
+        self.assert_numpy_array_equal(result, np.zeros(5, dtype=bool))
+
+        self.assertRaises(TypeError, algos.isin, comps, [['a']])
+
+    def test_datetimelike(self):
+        s = Series(pd.date_range('2015-01-01', periods=3))
+        result = algos.isin(s, ['2015-01-02', pd.Timestamp('2015-01-03')])
+        self.assert_numpy_array_equal(result, np.array([False, True, True]))
+
+        s = Series(pd.to_timedelta([1, 2, 3], unit='d'))
+        result = algos.isin(s, ['1 day'])
+        self.assert_numpy_array_equal(result, np.array([True, False, False]))
+
+    def test_sorted(self):
+        values = np.arange(0, 3 * (algos._ISIN_SORTED_MIN_VALUES + 1), 3)
+        comps = np.array([-3, 0, 1, 3, values[-1], values[-1] + 3])
+        expected = np.array([False, True, False, True, True, False])
+
+        self.assert_numpy_array_equal(algos.isin(comps, values), expected)
+        self.assert_numpy_array_equal(algos.isin(comps.astype(float),
+                                                 values.astype(float)),
+                                      expected)
+
+        # unsorted values are hashed
+        self.assert_numpy_array_equal(algos.isin(comps, values[::-1]),
+                                      expected)
+
 class TestValueCounts(tm.TestCase):
     _multiprocess_can_split_ = True
 
@@ -4372,6 +4372,36 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
         result = DataFrame.from_records(generator, columns=columns_names)
         assert_frame_equal(result, expected)
 
+    def test_from_records_iterator_typed(self):
+        def records(n):
+            for i in range(n):
+                yield (i, 'a%d' % i, i / 2., None if i % 3 else i)
+
+        result = DataFrame.from_records(records(100), nrows_hint=10,
+                                        columns=list('abcd'))
+        expected = DataFrame(list(records(100)), columns=list('abcd'))
+        assert_frame_equal(result, expected)
+        self.assertEqual(result['a'].dtype, np.int64)
+        self.assertEqual(result['d'].dtype, np.float64)
+
+        result = DataFrame.from_records(records(100), nrows=10,
+                                        columns=list('abcd'))
+        assert_frame_equal(result, expected.iloc[:10])
+
+        def dicts(n):
+            for i in range(n):
+                row = {'a': i, 'b': 'b%d' % i}
+                if i % 2:
+                    row['c'] = i * 1.5
+                yield row
+
+        result = DataFrame.from_records(dicts(50), index='a')
+        expected = DataFrame(list(dicts(50))).set_index('a')
+        assert_frame_equal(result, expected)
+
+        result = DataFrame.from_records(dicts(50), columns=['c', 'a'])
+        assert_frame_equal(result, expected.reset_index()[['c', 'a']])
+
     def test_from_records_columns_not_modified(self):
         tuples = [(1, 2, 3),
                   (1, 2, 3),
@@ -6893,6 +6923,79 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
         DataFrame(1,index=pd.MultiIndex.from_product([['a'],range(1000)]),columns=['A']).index.nbytes
         DataFrame(1,index=pd.MultiIndex.from_product([['a'],range(1000)]),columns=['A']).index.values.nbytes
 
+    def test_memory_usage_deep(self):
+        df = DataFrame({'a': np.arange(10), 'b': ['x' * 100] * 10})
+        shallow = df.memory_usage()
+        deep = df.memory_usage(deep=True)
+        self.assertEqual(shallow['a'], deep['a'])
+        self.assertTrue(deep['b'] > shallow['b'] + 10 * 100)
+        sampled = df.memory_usage(deep=3)
+        self.assertTrue(abs(sampled['b'] - deep['b']) <= 1)
+        self.assertEqual(df['b'].memory_usage(deep=True), deep['b'])
+
+        buf = StringIO()
+        df.info(buf=buf, memory_usage='deep')
+        res = buf.getvalue().splitlines()
+        self.assertTrue("memory usage: " in res[-1])
+        self.assertFalse(re.match(r"memory usage: [^+]+\+", res[-1]))
+
+        breakdown = df.memory_breakdown()
+        self.assertEqual(list(breakdown.columns),
+                         ['part', 'component', 'dtype', 'bytes'])
+        blocks = breakdown[breakdown['part'] == 'block']
+        self.assertEqual(len(blocks), 2)
+        self.assertEqual(blocks['bytes'].sum(), shallow.sum())
+
+        # the hash table of the engine shows once it is populated
+        df.index.get_loc(3)
+        breakdown = df.memory_breakdown()
+        engine = breakdown[(breakdown['part'] == 'index') &
+                           (breakdown['component'] == 'engine')]
+        self.assertEqual(len(engine), 1)
+        self.assertTrue(engine['bytes'].iloc[0] > 0)
+        self.assertEqual(df.index.memory_usage(),
+                         breakdown['bytes'][breakdown['part'] == 'index'].sum())
+
+        # the engine and cache of the index only count when deep
+        self.assertEqual(df.memory_usage(index=True)['Index'],
+                         df.index.nbytes)
+        self.assertEqual(df.memory_usage(index=True, deep=True)['Index'],
+                         df.index.memory_usage(deep=True))
+
+        # the arrays held in cached tuples and dicts count
+        dti = pd.date_range('20130101', periods=1000, freq='H')
+        dti.year, dti.hour
+        breakdown = dict(dti._memory_breakdown())
+        self.assertTrue(breakdown['cache: _date_fields'] > 2 * 1000 * 4)
+
+    def test_optimize_memory(self):
+        df = DataFrame({'a': [1, 2, 3, 4],
+                        'b': [1., 2., 3., 4.],
+                        'c': [0.5, 1.5, np.nan, 2.5],
+                        'd': [0.1, 0.2, 0.3, 0.4],
+                        'e': [-1, 200, 3, 4],
+                        'f': ['x', 'y', 'x', 'x'],
+                        'g': ['a', 'b', 'c', 'd'],
+                        'h': pd.date_range('20130101', periods=4)})
+        result = df.optimize_memory()
+        expected = Series([np.dtype('int8'), np.dtype('int8'),
+                           np.dtype('float32'), np.dtype('float64'),
+                           np.dtype('int16'), com.CategoricalDtype(),
+                           np.dtype('object'), np.dtype('M8[ns]')],
+                          index=list('abcdefgh'))
+        assert_series_equal(result.dtypes, expected)
+        assert_frame_equal(result.astype(object), df.astype(object))
+
+        result = df.optimize_memory(categorical_threshold=0)
+        self.assertEqual(result['f'].dtype, np.object_)
+
+        buf = StringIO()
+        df.optimize_memory(verbose=True, buf=buf)
+        res = buf.getvalue().splitlines()
+        self.assertTrue(res[0].startswith('memory usage before: '))
+        self.assertTrue(any(l.startswith('memory usage after: ')
+                            for l in res))
+
     def test_dtypes(self):
         self.mixed_frame['bool'] = self.mixed_frame['A'] > 0
         result = self.mixed_frame.dtypes
@@ -10199,6 +10302,88 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
         expected = self.frame * 2
         assert_frame_equal(result, expected)
 
+    def test_apply_batched(self):
+        import pandas.core.frame as frame
+        original = frame._APPLY_BATCH_SIZE
+        frame._APPLY_BATCH_SIZE = 20
+        try:
+            sizes = []
+
+            def f(x):
+                sizes.append(len(x))
+                return x[:, 0] * 2 + x[:, 1]
+
+            result = self.frame.apply(f, axis=1, raw=True, engine='batched')
+            expected = self.frame.apply(lambda x: x['A'] * 2 + x['B'], axis=1)
+            assert_series_equal(result, expected)
+            self.assertEqual(sizes, [5] * 6)
+
+            result = self.frame.apply(lambda x: x.mean(1), raw=True,
+                                      engine='batched')
+            assert_series_equal(result, self.frame.mean())
+
+            # no reduction
+            result = self.frame.apply(lambda x: x * 2, axis=1, raw=True,
+                                      engine='batched')
+            assert_frame_equal(result, self.frame * 2)
+            result = self.frame.apply(lambda x: x * 2, raw=True,
+                                      engine='batched')
+            assert_frame_equal(result, self.frame * 2)
+
+            result = self.frame.apply(lambda x, y: x.sum(1) + y, axis=1,
+                                      raw=True, engine='batched', args=(1,))
+            assert_series_equal(result, self.frame.sum(1) + 1)
+        finally:
+            frame._APPLY_BATCH_SIZE = original
+
+        # mixed frames pass object arrays
+        result = self.mixed_frame.apply(lambda x: x[:, 4], axis=1, raw=True,
+                                        engine='batched')
+        assert_series_equal(result, self.mixed_frame['foo'].astype(object),
+                            check_names=False)
+
+        self.assertRaises(ValueError, self.frame.apply, np.sum, axis=1,
+                          raw=True, engine='batched')
+        self.assertRaises(ValueError, self.frame.apply, np.sum, axis=1,
+                          engine='batched')
+        self.assertRaises(ValueError, self.frame.apply, np.sum, axis=1,
+                          raw=True, engine='foo')
+
+    def test_apply_numba(self):
+        try:
+            import numba
+        except ImportError:
+            raise nose.SkipTest("no numba")
+
+        def f(row):
+            return row[0] * 2 + row[1]
+
+        result = self.frame.apply(f, axis=1, raw=True, engine='numba')
+        expected = self.frame['A'] * 2 + self.frame['B']
+        assert_series_equal(result, expected, check_names=False)
+
+        result = self.frame.apply(f, raw=True, engine='numba')
+        expected = self.frame.iloc[0] * 2 + self.frame.iloc[1]
+        assert_series_equal(result, expected, check_names=False)
+
+        self.assertRaises(TypeError, self.mixed_frame.apply, f, axis=1,
+                          raw=True, engine='numba')
+
+        # the cache is bounded
+        from pandas.core import frame as frame_module
+        size = frame_module._NUMBA_APPLY_CACHE_SIZE
+        frame_module._NUMBA_APPLY_CACHE_SIZE = 2
+        try:
+            funcs = [eval('lambda row: row[0] + %d' % i) for i in range(4)]
+            for i, g in enumerate(funcs):
+                result = self.frame.apply(g, axis=1, raw=True,
+                                          engine='numba')
+                assert_series_equal(result, self.frame['A'] + i,
+                                    check_names=False)
+            self.assertEqual(len(frame_module._numba_apply_loops), 2)
+        finally:
+            frame_module._NUMBA_APPLY_CACHE_SIZE = size
+
     def test_apply_axis1(self):
         d = self.frame.index[0]
         tapplied = self.frame.apply(np.mean, axis=1)
@@ -14045,6 +14230,27 @@ starting,ending,measure
         # column order isn't preserved
         assert_frame_equal(result.reindex_like(expected), expected)
 
+    def test_assign_many(self):
+        df = DataFrame({'A': [1, 2, 3], 'B': [4., 5., 6.]})
+        new = dict(('C%d' % i, df.B * i) for i in range(50))
+        new['D'] = ['a', 'b', 'c']
+        new['B'] = df.A
+        result = df.assign(**new)
+
+        expected = df.copy()
+        for k, v in new.items():
+            expected[k] = v
+        assert_frame_equal(result.reindex_like(expected), expected)
+
+        # same dtype columns are added as a single block
+        self.assertTrue(len(result._data.blocks) <= 4)
+
+        # empty frame takes its index from the values
+        result = DataFrame().assign(A=Series([1, 2], index=['a', 'b']),
+                                    B=Series([2, 4], index=['a', 'b']))
+        expected = DataFrame({'A': [1, 2], 'B': [2, 4]}, index=['a', 'b'])
+        assert_frame_equal(result.reindex_like(expected), expected)
+
     def test_assign_bad(self):
         df = DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]})
         # non-keyword argument
@@ -415,6 +415,38 @@ class TestBlockManager(tm.TestCase):
         for blk in self.mgr.blocks:
             yield self.assertIs, self.mgr.items, blk.ref_items
 
+    def test_insert_many_consolidation(self):
+        mgr = create_mgr('a: f8')
+        for i in range(500):
+            mgr.insert(len(mgr.items), 'x%d' % i, np.arange(N) * i * 1.0)
+
+        # consolidation is deferred but the number of blocks stays bounded
+        self.assertFalse(mgr.is_consolidated())
+        self.assertTrue(len(mgr.blocks) <= len(mgr.items) // 2 + 1)
+        assert_almost_equal(mgr.get('x499', fastpath=False), np.arange(N) * 499.0)
+
+        mgr._consolidate_inplace()
+        self.assertEqual(len(mgr.blocks), 1)
+        assert_almost_equal(mgr.get('x250', fastpath=False), np.arange(N) * 250.0)
+
+    def test_extend(self):
+        mgr = create_mgr('a: f8; b: i8')
+        mgr.extend(['c', 'd', 'e'], [np.zeros(N), np.arange(N),
+                                     np.ones(N)])
+
+        self.assert_numpy_array_equal(mgr.items, ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(len(mgr.blocks), 4)
+        assert_almost_equal(mgr.get('c', fastpath=False), np.zeros(N))
+        assert_almost_equal(mgr.get('d', fastpath=False), np.arange(N))
+        assert_almost_equal(mgr.get('e', fastpath=False), np.ones(N))
+        self.assertIs(mgr.blocks[mgr._blknos[2]], mgr.blocks[mgr._blknos[4]])
+
+        self.assertRaises(ValueError, mgr.extend, ['f', 'a'],
+                          [np.zeros(N), np.zeros(N)])
+        self.assertRaises(ValueError, mgr.extend, ['f', 'f'],
+                          [np.zeros(N), np.zeros(N)])
+        self.assertRaises(ValueError, mgr.extend, ['f'], [])
+
     def test_set_change_dtype(self):
         self.mgr.set('baz', np.zeros(N, dtype=bool))
 
@@ -454,6 +486,136 @@ class TestBlockManager(tm.TestCase):
                     break
             self.assertTrue(found)
 
+    def test_copy_on_write(self):
+        mgr = create_mgr('a,b: f8; c: i8')
+
+        with pd.option_context('mode.copy_on_write', True):
+            cp = mgr.copy()
+
+        for blk, cp_blk in zip(mgr.blocks, cp.blocks):
+            self.assertIs(cp_blk.values, blk.values)
+            self.assertFalse(blk.values.flags.writeable)
+
+        # the first writer gets its own copy
+        orig = mgr.as_matrix().copy()
+        cp.set('a', np.zeros(N))
+        assert_almost_equal(mgr.as_matrix(), orig)
+        self.assertTrue((cp.get('a', fastpath=False) == 0).all())
+
+        # the last holder takes its values back without copying
+        values = mgr.get('b', fastpath=False).base
+        mgr.set('b', np.ones(N))
+        self.assertIs(mgr.get('b', fastpath=False).base, values)
+        self.assertTrue(values.flags.writeable)
+        self.assertFalse((cp.get('b', fastpath=False) == 1).any())
+
+        # disabled by default
+        cp = mgr.copy()
+        for blk, cp_blk in zip(mgr.blocks, cp.blocks):
+            self.assertIsNot(cp_blk.values, blk.values)
+
+    def test_copy_on_write_frame(self):
+        df = DataFrame({'a': np.arange(5.), 'b': np.arange(5)})
+        expected = df.copy()
+
+        with pd.option_context('mode.copy_on_write', True):
+            renamed = df.rename(columns={'a': 'c'})
+            for result in [df.copy(), renamed, df.reindex(df.index),
+                           df.fillna(0)]:
+                result.iloc[0, 1] = 10
+                result.set_value(1, result.columns[0], -1)
+                assert_frame_equal(df, expected)
+
+            s = df['a']
+            s2 = s.copy()
+            s2[0] = 100
+            s2.set_value(1, 100)
+            assert_series_equal(df['a'], expected['a'])
+
+            df.loc[2, 'a'] = 100
+            expected.loc[2, 'a'] = 100
+            assert_frame_equal(df, expected)
+            self.assertEqual(renamed.loc[2, 'c'], 2)
+
+        # values shared while the option was on are still copied on write
+        # once it is off
+        df = DataFrame({'a': np.arange(5.), 'b': np.arange(5)})
+        with pd.option_context('mode.copy_on_write', True):
+            result = df.copy()
+        for blk, res_blk in zip(df._data.blocks, result._data.blocks):
+            self.assertIs(res_blk.values, blk.values)
+
+        result.iloc[0, 0] = 10
+        df.loc[1, 'b'] = 20
+        s = df['a'].copy()
+        s[2] = 30
+        self.assertEqual(df.loc[0, 'a'], 0)
+        self.assertEqual(df.loc[2, 'a'], 2)
+        self.assertEqual(result.loc[1, 'b'], 1)
+        self.assertEqual(result.loc[0, 'a'], 10)
+        self.assertEqual(df.loc[1, 'b'], 20)
+
+    def test_compact_strings(self):
+        df = DataFrame({'a': ['foo', 'bar', np.nan, 'foo', ''],
+                        'b': ['x', 'y', 'z', 'x', 'y'],
+                        'c': ['foo', 1, 2, 3, 4],
+                        'd': np.arange(5.)})
+        result = df.compact_strings()
+        assert_frame_equal(result, df)
+
+        blocks = [b for b in result._data.blocks
+                  if isinstance(b, CompactStringBlock)]
+        self.assertEqual(len(blocks), 1)
+        self.assertTrue(blocks[0]._is_compact)
+        self.assertEqual(sorted(result.columns[blocks[0].mgr_locs.indexer]),
+                         ['a', 'b'])
+        self.assertEqual(blocks[0].dtype, np.object_)
+
+        assert_frame_equal(result.reindex(lrange(7)), df.reindex(lrange(7)))
+        assert_frame_equal(result.iloc[1:3], df.iloc[1:3])
+        assert_frame_equal(result.copy(), df)
+        self.assertTrue(blocks[0]._is_compact)
+        self.assertEqual(result.to_csv(), df.to_csv())
+
+        result = df.compact_strings(columns=['b'])
+        self.assertEqual(
+            [list(b.mgr_locs.as_array) for b in result._data.blocks
+             if isinstance(b, CompactStringBlock)], [[1]])
+
+        # the other columns are copied too
+        expected = df.copy()
+        result.loc[0, 'd'] = 10.
+        result.loc[0, 'c'] = 'bar'
+        assert_frame_equal(df, expected)
+
+        result = df.compact_strings()
+        result.loc[0, 'a'] = 'baz'
+        expected = df.copy()
+        expected.loc[0, 'a'] = 'baz'
+        assert_frame_equal(result, expected)
+
+        self.assertRaises(KeyError, df.compact_strings, columns=['missing'])
+        self.assertRaises(KeyError, df.compact_strings,
+                          columns=['a', 'missing'])
+
+    def test_compact_strings_text_and_bytes(self):
+        # text and bytes strings are compacted, but not merged
+        df = DataFrame({'a': [u('foo'), u('\u03c3'), np.nan],
+                        'b': [b'foo', b'bar', b'\xff'],
+                        'c': [u('foo'), b'foo', u('bar')]})
+        result = df.compact_strings()
+        assert_frame_equal(result, df)
+        blocks = [b for b in result._data.blocks
+                  if isinstance(b, CompactStringBlock)]
+        self.assertEqual(len(blocks), 2)
+
+        result._consolidate_inplace()
+        self.assertEqual(len([b for b in result._data.blocks
+                              if isinstance(b, CompactStringBlock)]), 2)
+        for col in ['a', 'b', 'c']:
+            self.assertEqual([type(x) for x in result[col]],
+                             [type(x) for x in df[col]])
+
     def test_sparse(self):
         mgr = create_mgr('a: sparse-1; b: sparse-2')
 
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# pylint: disable-msg=W0612,E1101
+
+import nose
+
+import numpy as np
+
+from pandas import DataFrame
+from pandas.computation import expressions as expr
+from pandas.core.lazy import LazyFrame, _Project, _Filter, _Assign, _Source
+from pandas.util.testing import assert_frame_equal, assert_series_equal
+import pandas.util.testing as tm
+
+
+class TestLazyFrame(tm.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        np.random.seed(1234)
+        n = 20000
+        self.df = DataFrame({'a': np.random.randn(n),
+                             'b': np.random.randint(0, 10, n),
+                             'c': np.random.randn(n),
+                             'key': np.random.choice(list('xyz'), n),
+                             'unused': np.random.randn(n)})
+
+    def test_lazy(self):
+        lf = self.df.lazy()
+        self.assertIsInstance(lf, LazyFrame)
+        self.assert_numpy_array_equal(lf.columns, self.df.columns)
+
+        result = lf.assign(d=lf.a + lf.b * 2).collect()
+        expected = self.df.assign(d=self.df.a + self.df.b * 2)
+        assert_frame_equal(result, expected)
+
+        with tm.assertRaises(ValueError):
+            (lf.a > 0) and (lf.b > 0)
+
+    def test_filter(self):
+        df = self.df
+        lf = df.lazy()
+
+        result = lf[(lf.a > 0) & (lf.b < 5)][lf.c < lf.a].collect()
+        expected = df[(df.a > 0) & (df.b < 5)]
+        expected = expected[expected.c < expected.a]
+        assert_frame_equal(result, expected)
+
+        result = lf[lf.key.isin(['x', 'y']) & ~(lf.b == 3)].collect()
+        expected = df[df.key.isin(['x', 'y']) & ~(df.b == 3)]
+        assert_frame_equal(result, expected)
+
+        # the filters are fused into one
+        plan = lf[lf.a > 0][lf.b < 5].optimize()._plan
+        self.assertIsInstance(plan, _Filter)
+        self.assertIsInstance(plan.children[0], _Source)
+
+    def test_pushdown(self):
+        df = self.df
+        lf = df.lazy()
+        lf = lf.assign(d=lf.a * lf.c, e=lf.b + 1)
+        lf = lf[lf.b > 2][['a', 'd']]
+
+        expected = df.assign(d=df.a * df.c, e=df.b + 1)
+        expected = expected[expected.b > 2][['a', 'd']]
+        assert_frame_equal(lf.collect(), expected)
+
+        # the filter is applied before the assignment, the unused
+        # assignment and columns are dropped
+        plan = lf.optimize()._plan
+        self.assertIsInstance(plan, _Project)
+        assign = plan.children[0]
+        self.assertIsInstance(assign, _Assign)
+        self.assertEqual(assign.names(), set(['d']))
+        self.assertIsInstance(assign.children[0], _Filter)
+        source = assign.children[0].children[0]
+        self.assertIsInstance(source, _Project)
+        self.assertEqual(source.cols, ['a', 'b', 'c'])
+
+        # a filter on an assigned column stays after the assignment
+        lf = df.lazy()
+        lf = lf.assign(d=lf.a * 2)
+        lf = lf[lf.d > 1]
+        plan = lf.optimize()._plan
+        self.assertIsInstance(plan, _Filter)
+        expected = df.assign(d=df.a * 2)
+        assert_frame_equal(lf.collect(), expected[expected.d > 1])
+
+        # callables are barriers
+        lf = df.lazy().assign(d=lambda x: x.a.cumsum())
+        lf = lf[lf.b > 2]
+        expected = df.assign(d=df.a.cumsum())
+        assert_frame_equal(lf.collect(), expected[expected.b > 2])
+
+    def test_no_modification(self):
+        df = self.df.copy()
+        lf = df.lazy()
+        lf.assign(a=lf.a + 1, b=0).collect()
+        lf[lf.a > 0].assign(a=lf.a + 1).collect()
+        assert_frame_equal(df, self.df)
+
+    def test_groupby(self):
+        df = self.df
+        lf = df.lazy()
+        lf = lf.assign(d=lf.a - lf.c)
+        lf = lf[lf.b != 0]
+
+        result = lf.groupby('key')['d'].sum().collect()
+        expected = df.assign(d=df.a - df.c)
+        expected = expected[expected.b != 0].groupby('key')['d'].sum()
+        assert_series_equal(result, expected)
+
+        result = lf.groupby(['key', 'b']).agg('mean').collect()
+        expected = df.assign(d=df.a - df.c)
+        expected = expected[expected.b != 0].groupby(['key', 'b']).agg('mean')
+        assert_frame_equal(result, expected)
+
+    def test_merge(self):
+        df = self.df
+        right = DataFrame({'key': list('xyz'), 'value': [1., 2., 3.]})
+        lf = df.lazy()
+        lf = lf.merge(right, on='key')
+        lf = lf.assign(d=lf.value * lf.a)[['key', 'd']]
+
+        expected = df.merge(right, on='key')
+        expected = expected.assign(d=expected.value * expected.a)
+        assert_frame_equal(lf.collect(), expected[['key', 'd']])
+
+        # overlapping columns are suffixed, nothing is pruned
+        right = DataFrame({'key': list('xyz'), 'a': [1., 2., 3.]})
+        lf = df.lazy().merge(right.lazy(), on='key')[['key', 'a_y']]
+        expected = df.merge(right, on='key')[['key', 'a_y']]
+        assert_frame_equal(lf.collect(), expected)
+
+    def test_methods(self):
+        df = self.df
+        lf = df.lazy()
+        result = lf[lf.a > 0].head(10).assign(d=1).collect()
+        expected = df[df.a > 0].head(10).assign(d=1)
+        assert_frame_equal(result, expected)
+        assert_frame_equal(df, self.df)
+
+        self.assertIn('Filter', lf[lf.a > 0].explain())
+
+    def test_numexpr(self):
+        if not expr._USE_NUMEXPR:
+            raise nose.SkipTest("numexpr not used")
+
+        df = self.df
+        lf = df.lazy()
+        expr.set_test_mode(True)
+        try:
+            result = lf[(lf.a > 0) & (lf.c < lf.a * 2)].collect()
+            used = expr.get_test_result()
+        finally:
+            expr.set_test_mode(False)
+
+        # evaluated in one pass
+        self.assertEqual(used, [True])
+        assert_frame_equal(result, df[(df.a > 0) & (df.c < df.a * 2)])
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
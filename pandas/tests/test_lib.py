@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, date, time
 import numpy as np
 
 import pandas as pd
+import pandas.lib as lib
 from pandas.lib import isscalar, item_from_zerodim, max_len_string_array
 import pandas.util.testing as tm
 from pandas.compat import u
@@ -19,6 +20,78 @@ class TestMisc(tm.TestCase):
         arr = arr.astype('U')
         self.assertTrue(max_len_string_array(arr),3)
 
+class TestRowsToArrays(tm.TestCase):
+
+    def check(self, column, expected):
+        result, = lib.rows_to_arrays([(v,) for v in column], size_hint=2)
+        expected_conv = lib.maybe_convert_objects(
+            lib.list_to_object_array(list(column)))
+        tm.assert_numpy_array_equivalent(result, expected)
+        self.assertEqual(result.dtype, expected_conv.dtype)
+        self.assertEqual(result.dtype, np.asarray(expected).dtype)
+
+    def test_inference(self):
+        # more values than the initial capacity
+        self.check(list(range(40)), np.arange(40, dtype=np.int64))
+        self.check([True, np.bool_(False)] * 20, np.array([True, False] * 20))
+        self.check([1, 2.5, np.int32(3), np.float32(4)],
+                   np.array([1, 2.5, 3, 4]))
+        self.check([1, None, 3], np.array([1, np.nan, 3]))
+        self.check([None, 1.5], np.array([np.nan, 1.5]))
+
+        # falling back to objects keeps the original values
+        for column in [[1, None, 'a'], [True, None], [None, True],
+                       [1, True], [True, 1.5], [None, None],
+                       [1, 2 ** 70], [1.5, None, u('a'), 3]]:
+            self.check(column, lib.list_to_object_array(column))
+
+    def test_rows(self):
+        result = lib.rows_to_arrays(iter([(1, 'a'), [2, 'b', 1.5], (3,)]))
+        self.assertEqual(len(result), 3)
+        tm.assert_numpy_array_equivalent(result[0], np.array([1, 2, 3]))
+        tm.assert_numpy_array_equivalent(
+            result[1], np.array(['a', 'b', None], dtype=object))
+        tm.assert_numpy_array_equivalent(result[2],
+                                         np.array([np.nan, 1.5, np.nan]))
+
+        result = lib.rows_to_arrays([(1, 2.5)], infer=False)
+        self.assertTrue(all(arr.dtype == object for arr in result))
+
+        self.assertEqual(lib.rows_to_arrays(iter([])), [])
+
+    def test_rows_dtypes(self):
+        rows = [(1, None, 1, 'a', True), (2, None, 3, 'b', False)]
+        dtypes = [np.float64, np.int64, np.int64, np.float64, np.float64]
+        result = lib.rows_to_arrays(rows, dtypes=dtypes)
+        tm.assert_numpy_array_equivalent(result[0], np.array([1., 2.]))
+        self.assertEqual(result[0].dtype, np.float64)
+        tm.assert_numpy_array_equivalent(result[1],
+                                         np.array([np.nan, np.nan]))
+        self.assertEqual(result[2].dtype, np.int64)
+
+        # values which don't fit are kept
+        self.assertEqual(result[3].dtype, object)
+        self.assertEqual(result[4].dtype, np.bool_)
+
+        result = lib.rows_to_arrays([(1, 2)], dtypes=[None])
+        self.assertEqual([arr.dtype for arr in result], [np.int64, np.int64])
+
+    def test_dicts(self):
+        rows = [{'b': 1, 'a': 'x'}, {'a': 'y', 'c': 1.5}, {}]
+        arrays, columns = lib.dicts_to_arrays(iter(rows))
+        self.assertEqual(columns, ['a', 'b', 'c'])
+        tm.assert_numpy_array_equivalent(
+            arrays[0], np.array(['x', 'y', np.nan], dtype=object))
+        tm.assert_numpy_array_equivalent(arrays[1],
+                                         np.array([1, np.nan, np.nan]))
+        tm.assert_numpy_array_equivalent(arrays[2],
+                                         np.array([np.nan, 1.5, np.nan]))
+
+        arrays, columns = lib.dicts_to_arrays(rows, columns=['c', 'd'])
+        self.assertEqual(columns, ['c', 'd'])
+        tm.assert_numpy_array_equivalent(arrays[1], np.array([np.nan] * 3))
+
+
 class TestIsscalar(tm.TestCase):
     def test_isscalar_builtin_scalars(self):
         self.assertTrue(isscalar(None))
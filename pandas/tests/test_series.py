@@ -3434,6 +3434,15 @@ class TestSeries(tm.TestCase, CheckNameIntegration):
         s.fillna(method='ffill', inplace=True)
         assert_series_equal(s.fillna(method='ffill', inplace=False), s)
 
+    def test_fillna_nothing_to_fill_downcast(self):
+        # nothing to fill still downcasts
+        with pd.option_context('mode.copy_on_write', False):
+            result = Series([1, 2], dtype=object).fillna(0)
+            assert_series_equal(result, Series([1, 2]))
+
+            result = Series([1., 2.]).fillna(0, downcast='infer')
+            assert_series_equal(result, Series([1, 2]))
+
     def test_fillna_raise(self):
         s = Series(np.random.randint(-100, 100, 50))
         self.assertRaises(TypeError, s.fillna, [1, 2])
@@ -17,6 +17,7 @@ from pandas.tseries.frequencies import (
     infer_freq, to_offset, get_period_alias,
     Resolution)
 import pandas.algos as _algos
+import pandas.core.algorithms as algos
 
 class DatetimeIndexOpsMixin(object):
     """ common ops mixin to support a unified inteface datetimelike Index """
@@ -426,8 +427,7 @@ class DatetimeIndexOpsMixin(object):
             except ValueError:
                 return self.asobject.isin(values)
 
-        value_set = set(values.asi8)
-        return lib.ismember(self.asi8, value_set)
+        return algos.isin(self.asi8, values.asi8)
 
     def shift(self, n, freq=None):
         """
@@ -42,19 +42,14 @@ def _utc():
 
 def _field_accessor(name, field, docstring=None):
     def f(self):
-        values = self.asi8
-        if self.tz is not None:
-            utc = _utc()
-            if self.tz is not utc:
-                values = self._local_timestamps()
-
         if field in ['is_month_start', 'is_month_end',
                     'is_quarter_start', 'is_quarter_end',
                     'is_year_start', 'is_year_end']:
+            values = self._local_asi8()
             month_kw = self.freq.kwds.get('startingMonth', self.freq.kwds.get('month', 12)) if self.freq else 12
             result = tslib.get_start_end_field(values, field, self.freqstr, month_kw)
         else:
-            result = tslib.get_date_field(values, field)
+            result = self._get_date_fields([field])[field]
 
         return self._maybe_mask_results(result,convert='float64')
 
@@ -662,6 +657,11 @@ class DatetimeIndex(DatetimeIndexOpsMixin, Int64Index):
             new_values = self._add_delta_td(delta)
         elif isinstance(delta, TimedeltaIndex):
             new_values = self._add_delta_tdi(delta)
+        elif isinstance(delta, DateOffset):
+            try:
+                new_values = delta.apply_index(self)
+            except NotImplementedError:
+                new_values = self.astype('O') + delta
         else:
             new_values = self.astype('O') + delta
         tz = 'UTC' if self.tz is not None else None
@@ -1377,6 +1377,37 @@ class DatetimeIndex(DatetimeIndexOpsMixin, Int64Index):
 
             return self._simple_new(result, self.name, new_offset, self.tz)
 
+    def _local_asi8(self):
+        values = self.asi8
+        if self.tz is not None:
+            utc = _utc()
+            if self.tz is not utc:
+                values = self._local_timestamps()
+        return values
+
+    def _get_date_fields(self, fields):
+        """
+        Return a dict of field code -> int32 array of the local date fields
+        (see tslib.get_date_field for the codes). Fields that are not yet
+        cached on the (immutable) index are extracted together in a single
+        pass; the returned arrays are copies of the cached ones.
+        """
+        cache = getattr(self, '_cache', None)
+        if cache is None:
+            cache = self._cache = {}
+
+        # some set operations assign the tz of a result after creating it
+        tz, fields_cache = cache.get('_date_fields', (None, None))
+        if fields_cache is None or tz is not self.tz:
+            fields_cache = {}
+            cache['_date_fields'] = (self.tz, fields_cache)
+
+        missing = [f for f in fields if f not in fields_cache]
+        if missing:
+            fields_cache.update(tslib.get_date_fields(self._local_asi8(),
+                                                      missing))
+        return dict((f, fields_cache[f].copy()) for f in fields)
+
     # alias to offset
     def _get_freq(self):
         return self.offset
@@ -1,5 +1,5 @@
 from datetime import date, datetime, timedelta
-from pandas.compat import range
+from pandas.compat import range, OrderedDict
 from pandas import compat
 import numpy as np
 
@@ -220,6 +220,24 @@ class DateOffset(object):
         else:
             return other + timedelta(self.n)
 
+    def apply_index(self, i):
+        """
+        Vectorized apply of DateOffset to DatetimeIndex,
+        raises NotImplementedError for offsets without a
+        vectorized implementation
+
+        Parameters
+        ----------
+        i : DatetimeIndex
+
+        Returns
+        -------
+        y : DatetimeIndex
+        """
+        raise NotImplementedError('DateOffset subclass %s does not have a '
+                                  'vectorized implementation'
+                                  % (self.__class__.__name__,))
+
     def isAnchored(self):
         return (self.n == 1)
 
@@ -531,6 +549,50 @@ class BusinessDay(BusinessMixin, SingleConstructorOffset):
         return dt.weekday() < 5
 
 
+# np.busdaycalendar objects are immutable, so instances built from the same
+# weekmask and holidays are shared between offsets
+_busdaycalendar_cache = OrderedDict()
+_BUSDAYCALENDAR_CACHE_SIZE = 128
+
+
+def _get_busdaycalendar(weekmask, holidays):
+    """
+    Return a np.busdaycalendar for a weekmask and a sorted tuple of
+    datetime64[D] holidays, reusing a recently constructed one if possible
+    """
+    if isinstance(weekmask, compat.string_types):
+        key = (weekmask, holidays)
+    else:
+        key = (tuple(weekmask), holidays)
+
+    try:
+        busdaycalendar = _busdaycalendar_cache.pop(key)
+    except KeyError:
+        kwargs = {'weekmask': weekmask}
+        if holidays:
+            kwargs['holidays'] = holidays
+
+        try:
+            busdaycalendar = np.busdaycalendar(**kwargs)
+        except:
+            # Check we have the required numpy version
+            from distutils.version import LooseVersion
+
+            if LooseVersion(np.__version__) < '1.7.0':
+                raise NotImplementedError("CustomBusinessDay requires numpy >= "
+                                          "1.7.0. Current version: " +
+                                          np.__version__)
+            else:
+                raise
+
+        if len(_busdaycalendar_cache) >= _BUSDAYCALENDAR_CACHE_SIZE:
+            _busdaycalendar_cache.popitem(last=False)
+
+    # (re)insert as the most recently used entry
+    _busdaycalendar_cache[key] = busdaycalendar
+    return busdaycalendar
+
+
 class CustomBusinessDay(BusinessDay):
     """
     **EXPERIMENTAL** DateOffset subclass representing possibly n business days
@@ -589,30 +651,19 @@ class CustomBusinessDay(BusinessDay):
 
         if holidays is None:
             holidays = []
+        holidays = [self._to_dt64(dt, dtype='datetime64[D]') for dt in
+                    holidays]
         try:
-            holidays = holidays + calendar.holidays().tolist()
+            # the calendar dates are tz-naive, so convert them in one go
+            calendar_holidays = calendar.holidays()
         except AttributeError:
             pass
-        holidays = [self._to_dt64(dt, dtype='datetime64[D]') for dt in
-                    holidays]
+        else:
+            holidays = holidays + list(
+                calendar_holidays.values.astype('datetime64[D]'))
         holidays = tuple(sorted(holidays))
 
-        kwargs = {'weekmask': weekmask}
-        if holidays:
-            kwargs['holidays'] = holidays
-
-        try:
-            busdaycalendar = np.busdaycalendar(**kwargs)
-        except:
-            # Check we have the required numpy version
-            from distutils.version import LooseVersion
-
-            if LooseVersion(np.__version__) < '1.7.0':
-                raise NotImplementedError("CustomBusinessDay requires numpy >= "
-                                          "1.7.0. Current version: " +
-                                          np.__version__)
-            else:
-                raise
+        busdaycalendar = _get_busdaycalendar(weekmask, holidays)
         return busdaycalendar, holidays
 
     def __getstate__(self):
@@ -667,6 +718,39 @@ class CustomBusinessDay(BusinessDay):
             raise ApplyTypeError('Only know how to combine trading day with '
                                  'datetime, datetime64 or timedelta.')
 
+    def apply_index(self, i):
+        """
+        Vectorized apply of the offset to a tz-naive DatetimeIndex through
+        np.busday_offset, keeping the time of day of each element
+        """
+        if i.tz is not None:
+            raise NotImplementedError('CustomBusinessDay.apply_index does '
+                                      'not support tz-aware values')
+
+        if self.n <= 0:
+            roll = 'forward'
+        else:
+            roll = 'backward'
+
+        i8 = i.asi8
+        mask = i8 == tslib.iNaT
+
+        day_nanos = 86400 * 1000000000
+        days = np.where(mask, 0, i8 // day_nanos)
+        times = i8 - days * day_nanos
+
+        shifted = np.busday_offset(days.view('M8[D]'), self.n, roll=roll,
+                                   busdaycal=self.calendar)
+        result = shifted.view('i8') * day_nanos + times
+        if self.offset:
+            result += tslib._delta_to_nanoseconds(self.offset)
+        if self.normalize:
+            # the offset can roll the result onto another day
+            result = result // day_nanos * day_nanos
+        result[mask] = tslib.iNaT
+
+        return i._simple_new(result, name=i.name)
+
     @staticmethod
     def _to_dt64(dt, dtype='datetime64'):
         # Currently
@@ -17,10 +17,10 @@ import pandas._period as period
 from pandas._period import (
     get_period_field_arr,
     _validate_end_alias,
-    _quarter_to_myear,
 )
 
 import pandas.core.common as com
+import pandas.core.algorithms as algos
 from pandas.core.common import (isnull, _INT64_DTYPE, _maybe_box,
                                 _values_from_object, ABCSeries,
                                 is_integer, is_float)
@@ -43,8 +43,14 @@ def _field_accessor(name, alias, docstring=None):
 
 def _get_ordinals(data, freq):
     f = lambda x: Period(x, freq=freq).ordinal
-    if isinstance(data[0], Period):
+    if len(data) > 0 and isinstance(data[0], Period):
         return period.extract_ordinals(data, freq)
+    elif lib.is_string_array(data) or lib.is_integer_array(data):
+        # parse each distinct label only once, then broadcast the ordinals
+        # back through the labels
+        labels, uniques = algos.factorize(data)
+        ordinals = com._ensure_int64(lib.map_infer(uniques, f))
+        return ordinals.take(labels)
     else:
         return lib.map_infer(data, f)
 
@@ -218,8 +224,7 @@ class PeriodIndex(DatetimeIndexOpsMixin, Int64Index):
                 data = com._ensure_int64(data)
                 if freq is None:
                     raise ValueError('freq not specified')
-                data = np.array([Period(x, freq=freq).ordinal for x in data],
-                                dtype=np.int64)
+                data = _get_ordinals(data, freq)
             except (TypeError, ValueError):
                 data = com._ensure_object(data)
 
@@ -680,14 +685,9 @@ class PeriodIndex(DatetimeIndexOpsMixin, Int64Index):
             return PeriodIndex(result, name=self.name, freq=self.freq)
 
     def _format_native_types(self, na_rep=u('NaT'), **kwargs):
-
-        values = np.array(list(self), dtype=object)
-        mask = isnull(self.values)
-        values[mask] = na_rep
-
-        imask = ~mask
-        values[imask] = np.array([u('%s') % dt for dt in values[imask]])
-        return values.tolist()
+        base = _gfc(self.freq)[0]
+        return period.period_format_arr(self.values, base,
+                                        na_rep=na_rep).tolist()
 
     def __array_finalize__(self, obj):
         if not self.ndim:  # pragma: no cover
@@ -879,8 +879,6 @@ def _range_from_fields(year=None, month=None, quarter=None, day=None,
     if day is None:
         day = 1
 
-    ordinals = []
-
     if quarter is not None:
         if freq is None:
             freq = 'Q'
@@ -893,20 +891,33 @@ def _range_from_fields(year=None, month=None, quarter=None, day=None,
                 raise AssertionError("base must equal FR_QTR")
 
         year, quarter = _make_field_arrays(year, quarter)
-        for y, q in zip(year, quarter):
-            y, m = _quarter_to_myear(y, q, freq)
-            val = period.period_ordinal(y, m, 1, 1, 1, 1, 0, 0, base)
-            ordinals.append(val)
+        year, month = _quarter_to_myear_arr(year, quarter, freq)
+        ones = np.ones(len(year), dtype=np.int64)
+        ordinals = period.periodarr_from_fields(year, month, ones, ones,
+                                                ones, ones, base)
     else:
         base, mult = _gfc(freq)
         if mult != 1:
             raise ValueError('Only mult == 1 supported')
 
         arrays = _make_field_arrays(year, month, day, hour, minute, second)
-        for y, mth, d, h, mn, s in zip(*arrays):
-            ordinals.append(period.period_ordinal(y, mth, d, h, mn, s, 0, 0, base))
+        arrays = [com._ensure_int64(x) for x in arrays]
+        ordinals = period.periodarr_from_fields(*(arrays + [base]))
+
+    return ordinals, freq
+
+
+def _quarter_to_myear_arr(year, quarter, freq):
+    """ vectorized version of _quarter_to_myear """
+    year = com._ensure_int64(year)
+    quarter = com._ensure_int64(quarter)
+    if ((quarter <= 0) | (quarter > 4)).any():
+        raise ValueError('Quarter must be 1 <= q <= 4')
 
-    return np.array(ordinals, dtype=np.int64), freq
+    mnum = frequencies._month_numbers[frequencies._get_rule_month(freq)] + 1
+    month = (mnum + (quarter - 1) * 3) % 12 + 1
+    year = np.where(month > mnum, year - 1, year)
+    return year, month
 
 
 def _make_field_arrays(*fields):
@@ -365,6 +365,193 @@ class TimeGrouper(Grouper):
                              % (axlabels.freq, self.freq))
 
 
+# the partial aggregates of the rows of a bin that can be combined across
+# chunks, by the how computed from them, and how to combine each of them
+_CHUNK_STATES = {'sum': ['sum'], 'count': ['count'],
+                 'mean': ['sum', 'count'], 'first': ['first'],
+                 'last': ['last'], 'min': ['min'], 'max': ['max'],
+                 'ohlc': ['first', 'max', 'min', 'last']}
+_COMBINE_STATES = {'sum': 'sum', 'count': 'sum', 'first': 'first',
+                   'last': 'last', 'min': 'min', 'max': 'max'}
+
+
+def _resample_chunks(chunks, rule, how=None, closed=None, label=None,
+                     loffset=None, base=0):
+    """
+    Downsample a sequence of time-ordered chunks (e.g. the iterator returned
+    by HDFStore.select with a chunksize) one chunk at a time. The result is
+    the same as resampling the concatenated chunks.
+
+    For sum, count, mean, first, last, min, max and ohlc, only the partial
+    aggregates of the bin still open at the end of a chunk are carried
+    over; for any other how the rows of that bin are.
+
+    Parameters
+    ----------
+    chunks : iterable of Series or DataFrame with a DatetimeIndex, each
+        sorted and starting at or after the end of the previous one
+    rule, how, closed, label, loffset, base : see NDFrame.resample
+
+    Returns
+    -------
+    resampled : Series or DataFrame, or None if chunks is empty
+    """
+    offset = to_offset(rule)
+    if isinstance(offset, Day) and offset.n > 1:
+        # these bins are anchored on the first day of each chunk
+        raise NotImplementedError('resampling in chunks is not supported '
+                                  'for multi-day rules')
+
+    how = how or _DEFAULT_METHOD
+    chunks = _sorted_chunks(chunks)
+    if isinstance(how, compat.string_types) and how in _CHUNK_STATES:
+        return _resample_chunk_states(chunks, offset, how, closed=closed,
+                                      label=label, loffset=loffset, base=base)
+    return _resample_chunk_rows(chunks, offset, how, closed=closed,
+                                label=label, loffset=loffset, base=base)
+
+
+def _sorted_chunks(chunks):
+    """ the non-empty chunks, checking that they are sorted by time """
+    last = None
+    for chunk in chunks:
+        ax = chunk.index
+        if not isinstance(ax, DatetimeIndex):
+            raise TypeError('axis must be a DatetimeIndex, but got '
+                            'an instance of %r' % type(ax).__name__)
+        if not len(ax):
+            continue
+        if not ax.is_monotonic or (last is not None and ax[0] < last):
+            raise ValueError('resampling in chunks requires the data to be '
+                             'sorted by its index')
+        last = ax[-1]
+        yield chunk
+
+
+def _resample_chunk_states(chunks, offset, how, closed=None, label=None,
+                           loffset=None, base=0):
+    from pandas.core.frame import DataFrame
+    from pandas.core.series import Series
+    from pandas.tools.merge import concat
+
+    states = _CHUNK_STATES[how]
+    pieces = dict((s, []) for s in states)
+    carry = None
+    first = last = None
+    for chunk in chunks:
+        if first is None:
+            first = chunk.index[:1]
+        last = chunk.index[-1:]
+
+        grouper = TimeGrouper(offset, closed=closed, label=label,
+                              base=_chunk_base(offset, base, first[0],
+                                               chunk.index[0]))
+        grouped = chunk.groupby(grouper)
+
+        # the last bin may continue into the next chunk, so its partial
+        # aggregates are carried over and combined with the first bin there
+        parts = {}
+        for s in states:
+            part = grouped.aggregate(s)
+            if carry is not None:
+                part = concat([carry[s], part]).groupby(level=0).aggregate(
+                    _COMBINE_STATES[s])
+            pieces[s].append(part.iloc[:-1])
+            parts[s] = part.iloc[-1:]
+        carry = parts
+
+    if carry is None:
+        return None
+
+    # the bins of the whole range, including those without any rows
+    # between two chunks
+    ax = first.append(last)
+    index = TimeGrouper(offset, closed=closed, label=label, how='count',
+                        base=base).resample(Series(1, index=ax)).index
+
+    stats = {}
+    for s in states:
+        pieces[s].append(carry[s])
+        stats[s] = concat(pieces[s]).reindex(index)
+    if 'count' in stats:
+        stats['count'] = stats['count'].fillna(0).astype(np.int64)
+
+    if how == 'mean':
+        sums, counts = stats['sum'], stats['count']
+        if isinstance(sums, DataFrame):
+            counts = counts.reindex(columns=sums.columns)
+        result = sums / counts
+    elif how == 'ohlc':
+        names = ['open', 'high', 'low', 'close']
+        parts = [stats[s] for s in states]
+        if isinstance(parts[0], DataFrame):
+            columns = parts[0].columns
+            result = concat([concat([p[c] for p in parts], axis=1, keys=names)
+                             for c in columns], axis=1, keys=columns)
+        else:
+            result = concat(parts, axis=1, keys=names)
+    else:
+        result = stats[how]
+
+    if isinstance(loffset, compat.string_types):
+        loffset = to_offset(loffset)
+    if isinstance(loffset, (DateOffset, timedelta)) and len(result.index):
+        result.index = result.index + loffset
+    result.index.name = ax.name
+    return result
+
+
+def _resample_chunk_rows(chunks, offset, how, closed=None, label=None,
+                         loffset=None, base=0):
+    from pandas.tools.merge import concat
+
+    pieces = []
+    first = None
+    carry = None
+    for chunk in chunks:
+        if carry is not None:
+            chunk = concat([carry, chunk])
+        if first is None:
+            first = chunk.index[0]
+
+        grouper = TimeGrouper(offset, how=how, closed=closed, label=label,
+                              loffset=loffset,
+                              base=_chunk_base(offset, base, first,
+                                               chunk.index[0]))
+        result = grouper.resample(chunk)
+
+        # the rows of the last bin may continue into the next chunk, so they
+        # are carried over and only the completed bins are emitted
+        bins = grouper.grouper.bins
+        starts = bins[bins < len(chunk)]
+        split = starts[-1] if len(starts) else 0
+        carry = chunk.iloc[split:]
+        pieces.append(result.iloc[:bins.searchsorted(split, side='right')])
+
+    if carry is None:
+        return None
+
+    pieces.append(TimeGrouper(offset, how=how, closed=closed, label=label,
+                              loffset=loffset,
+                              base=_chunk_base(offset, base, first,
+                                               carry.index[0])).resample(carry))
+    return concat(pieces)
+
+
+def _chunk_base(offset, base, first, chunk_first):
+    """
+    Return the base that puts the bins of a chunk starting at chunk_first on
+    the same edges as bins anchored at the start of the day of first
+    """
+    if not isinstance(offset, Tick) or isinstance(offset, Day):
+        return base
+
+    unit_nanos = offset.nanos // offset.n
+    day_diff = (first.tz_localize(None).normalize().value -
+                chunk_first.tz_localize(None).normalize().value)
+    return (day_diff // unit_nanos + base) % offset.n
+
+
 def _take_new_index(obj, indexer, new_index, axis=0):
     from pandas.core.api import Series, DataFrame
 
@@ -863,6 +863,51 @@ class TestCustomBusinessDay(Base):
         dt = datetime(2014, 1, 17)
         assertEq(CDay(calendar=calendar), dt, datetime(2014, 1, 21))
 
+    def test_calendar_cached(self):
+        calendar = USFederalHolidayCalendar()
+        cday1 = CDay(calendar=calendar)
+        cday2 = CDay(calendar=USFederalHolidayCalendar())
+        self.assertEqual(cday1.holidays, cday2.holidays)
+        self.assertTrue(cday1.calendar is cday2.calendar)
+
+        cday3 = CDay(calendar=calendar, weekmask='Sun Mon Tue Wed Thu')
+        self.assertFalse(cday1.calendar is cday3.calendar)
+
+        holidays = ['2012-05-01', datetime(2013, 5, 1)]
+        self.assertTrue(CDay(holidays=holidays).calendar is
+                        CDay(holidays=holidays).calendar)
+
+    def test_apply_index(self):
+        calendar = USFederalHolidayCalendar()
+        rng = date_range('2013-12-20 09:30', periods=40, freq='7H')
+        for n in [-3, -1, 0, 1, 2, 5]:
+            for offset in [CDay(n, calendar=calendar),
+                           CDay(n, calendar=calendar, normalize=True),
+                           CDay(n, calendar=calendar,
+                                offset=timedelta(hours=1)),
+                           CDay(n, calendar=calendar, normalize=True,
+                                offset=timedelta(hours=20))]:
+                result = rng + offset
+                expected = DatetimeIndex([d + offset for d in rng])
+                tm.assert_index_equal(result, expected)
+
+        # the offset rolls onto the next day before normalizing
+        rng = DatetimeIndex(['2014-01-16 09:30'])
+        offset = CDay(normalize=True, offset=timedelta(hours=20))
+        expected = DatetimeIndex(['2014-01-18'])
+        tm.assert_index_equal(offset.apply_index(rng), expected)
+        tm.assert_index_equal(rng + offset, expected)
+
+        rng = DatetimeIndex(['2014-01-17', NaT, '2014-01-18'])
+        result = CDay(calendar=calendar).apply_index(rng)
+        expected = DatetimeIndex(['2014-01-21', NaT, '2014-01-21'])
+        tm.assert_index_equal(result, expected)
+
+        rng = date_range('2014-01-17', periods=3, tz='US/Eastern')
+        self.assertRaises(NotImplementedError, CDay().apply_index, rng)
+        expected = DatetimeIndex([d + CDay() for d in rng])
+        tm.assert_index_equal(rng + CDay(), expected)
+
     def test_roundtrip_pickle(self):
         def _check_roundtrip(obj):
             unpickled = self.round_trip_pickle(obj)
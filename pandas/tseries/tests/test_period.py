@@ -1226,6 +1226,50 @@ class TestPeriodIndex(tm.TestCase):
         exp = period_range('2007-01', periods=3, freq='M')
         self.assertTrue(idx.equals(exp))
 
+    def test_constructor_repeated_strings(self):
+        strs = ['2014Q1', '2014Q2', '2014Q1', '2014Q3', '2014Q2'] * 3
+        idx = PeriodIndex(strs, freq='Q')
+        expected = PeriodIndex([Period(s, freq='Q') for s in strs])
+        self.assertTrue(idx.equals(expected))
+
+        ints = [2005, 2007, 2005, 2009] * 3
+        idx = PeriodIndex(ints, freq='A')
+        expected = PeriodIndex([Period(str(x), freq='A') for x in ints])
+        self.assertTrue(idx.equals(expected))
+
+        idx = PeriodIndex(np.array(ints), freq='A')
+        self.assertTrue(idx.equals(expected))
+
+        idx = PeriodIndex([], freq='A')
+        self.assertEqual(len(idx), 0)
+
+    def test_constructor_field_arrays_fiscal_quarters(self):
+        years = np.arange(2000, 2005).repeat(4)
+        quarters = np.tile(np.arange(1, 5), 5)
+
+        idx = PeriodIndex(year=years, quarter=quarters, freq='Q-MAR')
+        for p, y, q in zip(idx, years, quarters):
+            self.assertEqual(p, Period(year=y, quarter=q, freq='Q-MAR'))
+
+    def test_format_native_types(self):
+        idx = period_range('2011-01-01', periods=3, freq='D')
+        self.assertEqual(idx._format_native_types(),
+                         ['2011-01-01', '2011-01-02', '2011-01-03'])
+
+        for freq in ['A', 'Q-MAR', 'M', 'W', 'H', 'S']:
+            idx = period_range('2011-01-01', periods=5, freq=freq)
+            self.assertEqual(idx._format_native_types(),
+                             [str(p) for p in idx])
+
+        ordinal = Period('2011-01', freq='M').ordinal
+        idx = PeriodIndex(np.array([ordinal, tslib.iNaT]), freq='M')
+        self.assertEqual(idx._format_native_types(), ['2011-01', 'NaT'])
+        self.assertEqual(idx._format_native_types(na_rep='x'),
+                         ['2011-01', 'x'])
+
+        df = DataFrame({'a': [1, 2]}, index=idx)
+        self.assertEqual(df.to_csv(na_rep='x'), ',a\n2011-01,1\nx,2\n')
+
     def test_constructor_U(self):
         # U was used as undefined period
         self.assertRaises(ValueError, period_range, '2007-1-1', periods=500,
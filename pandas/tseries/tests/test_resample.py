@@ -789,6 +789,81 @@ class TestResample(tm.TestCase):
             exp = df.asfreq('T')
             tm.assert_frame_equal(result, exp)
 
+    def test_resample_median_bins(self):
+        rng = date_range('1/1/2000', periods=1000, freq='7T')
+        values = np.random.randn(1000)
+        values[::13] = np.nan
+        values[100:300] = np.nan
+        ts = Series(values, index=rng)
+        ts = ts.drop(ts.index[400:600])
+
+        result = ts.resample('2H', how='median')
+        expected = ts.resample('2H', how=lambda x: x.median())
+        assert_series_equal(result, expected)
+
+        df = DataFrame({'A': ts, 'B': ts * 2, 'C': ts[::-1].values})
+        result = df.resample('H', how='median', closed='right')
+        expected = df.resample('H', how=lambda x: x.median(),
+                               closed='right')
+        assert_frame_equal(result, expected)
+
+    def test_resample_ohlc_bins(self):
+        # all of the columns are aggregated in one pass over the bins
+        rng = date_range('1/1/2000', periods=1000, freq='7T')
+        values = np.random.randn(1000)
+        values[::13] = np.nan
+        values[100:300] = np.nan
+        df = DataFrame({'A': values, 'B': np.arange(1000),
+                        'C': values[::-1] > 0}, index=rng)
+        df = df.drop(df.index[400:600])
+
+        for closed in ['left', 'right']:
+            result = df.resample('H', how='ohlc', closed=closed)
+            expected = pd.concat([df[c].resample('H', how='ohlc',
+                                                 closed=closed)
+                                  for c in df.columns],
+                                 keys=df.columns, axis=1)
+            assert_frame_equal(result, expected)
+
+    def test_resample_chunks(self):
+        from pandas.tseries.resample import _resample_chunks
+
+        rng = date_range('1/1/2000 23:00', periods=2000, freq='37s')
+        ts = Series(np.random.randn(len(rng)), index=rng)
+        chunks = [ts[i:i + 111] for i in range(0, len(ts), 111)]
+
+        for rule in ['7T', 'H', 'D']:
+            for how in ['mean', 'sum', 'count', 'first', 'last', 'min',
+                        'max', 'median']:
+                for closed in ['left', 'right']:
+                    expected = ts.resample(rule, how=how, closed=closed)
+                    result = _resample_chunks(iter(chunks), rule, how=how,
+                                              closed=closed)
+                    assert_series_equal(result, expected)
+
+            expected = ts.resample(rule, how='ohlc')
+            result = _resample_chunks(iter(chunks), rule, how='ohlc')
+            assert_frame_equal(result, expected)
+
+        # the default how aggregates small chunks that have a freq too
+        small = [ts[i:i + 3] for i in range(0, 30, 3)]
+        expected = ts[:30].resample('7T')
+        assert_series_equal(_resample_chunks(iter(small), '7T'), expected)
+
+        # bins without rows between the chunks
+        gapped = ts[:500].append(ts[1500:])
+        df = DataFrame({'a': gapped, 'b': gapped * 2})
+        df_chunks = [df[i:i + 50] for i in range(0, len(df), 50)]
+        for how in ['mean', 'count', 'last', 'median']:
+            expected = df.resample('7T', how=how, loffset='1s')
+            result = _resample_chunks(iter(df_chunks), '7T', how=how,
+                                      loffset='1s')
+            assert_frame_equal(result, expected)
+
+        self.assertIsNone(_resample_chunks([], 'H'))
+        self.assertRaises(ValueError, _resample_chunks, chunks[::-1], 'H')
+        self.assertRaises(NotImplementedError, _resample_chunks, chunks, '2D')
+
     def test_how_lambda_functions(self):
 
         ts = _simple_ts('1/1/2000', '4/1/2000')
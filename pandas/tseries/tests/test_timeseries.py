@@ -2964,6 +2964,40 @@ class TestDatetime64(tm.TestCase):
 
         self.assert_numpy_array_equal(dti.nanosecond, np.arange(10))
 
+    def test_get_date_fields(self):
+        dti = DatetimeIndex(start='1999-12-25 07:13:05.123456', freq='37H',
+                            periods=2000)
+        values = dti.asi8.copy()
+        values[5] = tslib.iNaT
+        codes = ['Y', 'M', 'D', 'h', 'm', 's', 'us', 'ns',
+                 'doy', 'dow', 'woy', 'q', 'dim']
+
+        result = tslib.get_date_fields(values, codes)
+        for code in codes:
+            self.assert_numpy_array_equal(result[code],
+                                          tslib.get_date_field(values, code))
+
+        result = tslib.get_date_fields(values, [])
+        self.assertEqual(result, {})
+        self.assertRaises(ValueError, tslib.get_date_fields, values, ['foo'])
+
+    def test_datetimeindex_fields_cached(self):
+        dti = DatetimeIndex(start='2000-01-01', freq='7H', periods=100,
+                            tz='US/Eastern')
+        expected = np.array([d.hour for d in dti])
+
+        result = dti.hour
+        self.assert_numpy_array_equal(result, expected)
+
+        # the cached values are not exposed
+        result[:] = -1
+        self.assert_numpy_array_equal(dti.hour, expected)
+
+        fields = dti._get_date_fields(['Y', 'h', 'dow'])
+        self.assert_numpy_array_equal(fields['h'], expected)
+        self.assert_numpy_array_equal(fields['dow'], dti.dayofweek)
+        self.assert_numpy_array_equal(fields['Y'], dti.year)
+
     def test_datetimeindex_diff(self):
         dti1 = DatetimeIndex(freq='Q-JAN', start=datetime(1997, 12, 31),
                              periods=100)
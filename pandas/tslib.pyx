@@ -3214,6 +3214,113 @@ def get_date_field(ndarray[int64_t] dtindex, object field):
     raise ValueError("Field %s not supported" % field)
 
 
+# codes accepted by get_date_fields, in the order of their C-level index
+_date_field_codes = ['Y', 'M', 'D', 'h', 'm', 's', 'us', 'ns',
+                     'doy', 'dow', 'woy', 'q', 'dim']
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def get_date_fields(ndarray[int64_t] dtindex, object fields):
+    '''
+    Given a int64-based datetime index, extract several fields (see
+    get_date_field for the field codes) with a single conversion of each
+    value, and return a dict of field -> int32 array. The extraction loop
+    releases the GIL.
+    '''
+    cdef:
+        Py_ssize_t i, j, count, nfields
+        pandas_datetimestruct dts
+        int64_t *values
+        int32_t *outs[13]
+        int codes[13]
+        int k, code, val, isleap, doy, dow, woy
+        ndarray arr
+        dict result = {}
+
+    fields = list(fields)
+    nfields = len(fields)
+    if nfields > 13:
+        raise ValueError("Cannot extract more than 13 fields at once")
+
+    dtindex = np.ascontiguousarray(dtindex)
+    count = len(dtindex)
+    values = <int64_t*> dtindex.data
+
+    for j in range(nfields):
+        field = fields[j]
+        if field not in _date_field_codes:
+            raise ValueError("Field %s not supported" % field)
+        codes[j] = _date_field_codes.index(field)
+        arr = np.empty(count, dtype='i4')
+        outs[j] = <int32_t*> arr.data
+        result[field] = arr
+
+    with nogil:
+        for i in range(count):
+            if values[i] == NPY_NAT:
+                for j in range(nfields):
+                    outs[j][i] = -1
+                continue
+
+            pandas_datetime_to_datetimestruct(values[i], PANDAS_FR_ns, &dts)
+
+            for j in range(nfields):
+                code = codes[j]
+                if code == 0:
+                    val = dts.year
+                elif code == 1:
+                    val = dts.month
+                elif code == 2:
+                    val = dts.day
+                elif code == 3:
+                    val = dts.hour
+                elif code == 4:
+                    val = dts.min
+                elif code == 5:
+                    val = dts.sec
+                elif code == 6:
+                    val = dts.us
+                elif code == 7:
+                    val = dts.ps / 1000
+                elif code == 11:
+                    val = (dts.month - 1) / 3 + 1
+                else:
+                    isleap = is_leapyear(dts.year)
+                    if code == 12:
+                        val = days_per_month_table[isleap][dts.month - 1]
+                    else:
+                        dow = dayofweek(dts.year, dts.month, dts.day)
+                        doy = dts.day
+                        for k in range(dts.month - 1):
+                            doy += days_per_month_table[isleap][k]
+
+                        if code == 8:
+                            val = doy
+                        elif code == 9:
+                            val = dow
+                        else:
+                            # same rules as get_date_field
+                            woy = (doy - 1) - dow + 3
+                            if woy >= 0:
+                                woy = woy / 7 + 1
+
+                            if woy < 0:
+                                if (woy > -2) or (woy == -2 and
+                                                  is_leapyear(dts.year - 1)):
+                                    woy = 53
+                                else:
+                                    woy = 52
+                            elif woy == 53:
+                                if 31 - dts.day + dow < 3:
+                                    woy = 1
+                            val = woy
+
+                outs[j][i] = val
+
+    return result
+
+
 @cython.wraparound(False)
 def get_start_end_field(ndarray[int64_t] dtindex, object field, object freqstr=None, int month_kw=12):
     '''
@@ -213,6 +213,27 @@ def f(K=100):
 
 frame_insert_100_columns_begin = Benchmark('f()', setup, start_date=datetime(2011, 1, 1))
 
+setup = common_setup + """
+N = 1000
+
+def f(K=2000):
+    df = DataFrame(index=range(N))
+    new_col = np.random.randn(N)
+    for i in range(K):
+        df[i] = new_col
+"""
+
+frame_insert_2000_columns_end = Benchmark('f()', setup, start_date=datetime(2015, 4, 1))
+
+setup = common_setup + """
+N = 1000
+df = DataFrame(index=range(N))
+new_cols = dict(('c%d' % i, np.random.randn(N)) for i in range(2000))
+"""
+
+frame_assign_2000_columns = Benchmark('df.assign(**new_cols)', setup,
+                                      start_date=datetime(2015, 4, 1))
+
 #----------------------------------------------------------------------
 # strings methods, #2602
 
@@ -392,6 +413,17 @@ frame_apply_pass_thru = Benchmark('df.apply(lambda x: x)', setup,
                                   name = 'frame_apply_pass_thru',
                                   start_date=datetime(2012,1,1))
 
+setup = common_setup + """
+df = DataFrame(np.random.randn(1000000, 3), columns=list('abc'))
+"""
+frame_apply_axis_1_raw = Benchmark(
+    'df.apply(lambda x: x[0] * x[1] + x[2], axis=1, raw=True)', setup,
+    name='frame_apply_axis_1_raw', start_date=datetime(2015, 4, 25))
+frame_apply_axis_1_batched = Benchmark(
+    "df.apply(lambda x: x[:, 0] * x[:, 1] + x[:, 2], axis=1, raw=True, "
+    "engine='batched')", setup,
+    name='frame_apply_axis_1_batched', start_date=datetime(2015, 4, 25))
+
 setup = common_setup + """
 df = DataFrame(np.random.randn(1000,100))
 """
@@ -523,3 +555,23 @@ df = DataFrame({'a':np.random.randint(- 1 << 8, 1 << 8, n),
 
 frame_duplicated = Benchmark('df.duplicated()', setup,
                              name='frame_duplicated')
+
+#-----------------------------------------------------------------------------
+# compact strings
+
+setup = common_setup + """
+n = 100000
+strings = np.array(['string_%d' % i for i in range(1000)], dtype=object)
+df = DataFrame({'a': strings.take(np.random.randint(0, 1000, n)),
+                'b': strings.take(np.random.randint(0, 1000, n))})
+compact = df.compact_strings()
+indexer = np.random.permutation(n)
+"""
+
+frame_compact_strings = Benchmark('df.compact_strings()', setup,
+                                  name='frame_compact_strings',
+                                  start_date=datetime(2015, 4, 1))
+
+frame_compact_strings_take = Benchmark('compact.take(indexer)', setup,
+                                       name='frame_compact_strings_take',
+                                       start_date=datetime(2015, 4, 1))
@@ -27,3 +27,21 @@ series_nsmallest2 = Benchmark('s2.nsmallest(3, take_last=True);'
                               's2.nsmallest(3, take_last=False)',
                               setup,
                               start_date=datetime(2014, 1, 25))
+
+setup = common_setup + """
+s1 = Series(np.random.randint(0, 1000000, size=10000000))
+s2 = s1.astype(float)
+s3 = s1.astype(str).astype(object)
+values = np.random.randint(0, 1000000, size=100000)
+values_sorted = np.arange(0, 2000000, 2)
+values_str = [str(v) for v in values]
+"""
+
+series_isin_int64 = Benchmark('s1.isin(values)', setup,
+                              start_date=datetime(2015, 4, 25))
+series_isin_int64_sorted = Benchmark('s1.isin(values_sorted)', setup,
+                                     start_date=datetime(2015, 4, 25))
+series_isin_float64 = Benchmark('s2.isin(values)', setup,
+                                start_date=datetime(2015, 4, 25))
+series_isin_object = Benchmark('s3.isin(values_str)', setup,
+                               start_date=datetime(2015, 4, 25))
@@ -52,6 +52,17 @@ timeseries_1min_5min_mean = Benchmark(
     common_setup,
     start_date=datetime(2012, 5, 1))
 
+timeseries_1min_5min_median = Benchmark(
+    "ts[:10000].resample('5min', how='median')",
+    common_setup)
+
+setup = common_setup + """
+df = DataFrame(np.random.randn(100000, 10), index=rng[:100000])
+"""
+
+timeseries_frame_1min_5min_ohlc = Benchmark(
+    "df.resample('5min', how='ohlc')", setup)
+
 #----------------------------------------------------------------------
 # Irregular alignment
 
@@ -340,6 +351,14 @@ timeseries_custom_bday_cal_incr_n = \
 timeseries_custom_bday_cal_incr_neg_n = \
     Benchmark("date - 10 * cdayh",setup)
 
+timeseries_custom_bday_cal_construct = \
+    Benchmark("pd.offsets.CustomBusinessDay(calendar=hcal)",setup)
+
+timeseries_custom_bday_cal_apply_index = \
+    Benchmark("rng + cdayh",setup + """
+rng = pd.date_range('1/1/2000', periods=10000, freq='H')
+""")
+
 # Increment custom business month
 timeseries_custom_bmonthend_incr = \
     Benchmark("date + cme",setup)
@@ -368,6 +387,10 @@ rng = date_range('1/1/1', periods=N, freq='B')
 timeseries_is_month_start = Benchmark('rng.is_month_start', setup,
                                   start_date=datetime(2014, 4, 1))
 
+timeseries_field_accessors_repeated = Benchmark(
+    'rng.year; rng.month; rng.day; rng.dayofweek; rng.year; rng.month',
+    setup)
+
 #----------------------------------------------------------------------
 # iterate over DatetimeIndex/PeriodIndex
 setup = common_setup + """
@@ -391,3 +414,23 @@ timeseries_iter_periodindex = Benchmark('iter_n(idx2)', setup)
 timeseries_iter_datetimeindex_preexit = Benchmark('iter_n(idx1, M)', setup)
 
 timeseries_iter_periodindex_preexit = Benchmark('iter_n(idx2, M)', setup)
+
+#----------------------------------------------------------------------
+# PeriodIndex construction and formatting
+setup = common_setup + """
+N = 100000
+strs = np.array(['2014Q1', '2014Q2', '2014Q3', '2014Q4'] * (N // 4),
+                dtype=object)
+years = np.arange(1900, 1900 + N // 4).repeat(4)
+quarters = np.tile(np.arange(1, 5), N // 4)
+pidx = period_range(start='1/1/1990', freq='D', periods=N)
+"""
+
+period_index_from_repeated_strings = Benchmark('PeriodIndex(strs, freq="Q")',
+                                               setup)
+
+period_index_from_fields = Benchmark(
+    'PeriodIndex(year=years, quarter=quarters, freq="Q")', setup)
+
+period_index_format_native_types = Benchmark('pidx._format_native_types()',
+                                             setup)